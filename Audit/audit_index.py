@@ -0,0 +1,274 @@
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from Audit.audit_log import AUDIT_LOG_PATH, audit_writer, log_file_lock
+
+#SQLite index over the audit log (the JSON Lines files stay the source of truth;
+#each indexed row keeps a copy of its original line)
+AUDIT_INDEX_PATH = Path("outputs/audit_index.sqlite")
+
+#Default / maximum number of events returned by one query
+AUDIT_QUERY_LIMIT = 1000
+AUDIT_QUERY_MAX_LIMIT = 100_000
+
+#Events inserted per transaction while catching up with the log
+_INSERT_CHUNK = 50_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT,
+    action TEXT,
+    source TEXT,
+    record_id TEXT,
+    severity TEXT,
+    event TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_record ON events(record_id, id);
+CREATE INDEX IF NOT EXISTS idx_events_time ON events(timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_action ON events(action, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_source ON events(source, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_severity ON events(severity, timestamp);
+CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS archives (name TEXT PRIMARY KEY);
+"""
+
+
+def _first_line_hash(f) -> str | None:
+    line = f.readline()
+    if not line.endswith(b"\n"):
+        return None
+    return hashlib.sha1(line).hexdigest()
+
+
+class AuditIndex:
+    """
+    Incrementally built SQLite index of the audit log.
+
+    Every query first catches up with the log: only the bytes appended
+    since the last sync are parsed. The active file is recognised by
+    the hash of its first line, so after a rotation the rest of the
+    rotated file is read from its gzip archive and the new file is
+    read from the start. Archives that are already deleted by the
+    time the index syncs cannot be indexed.
+    """
+
+    def __init__(self, log_path: Path | str = AUDIT_LOG_PATH, index_path: Path | str = AUDIT_INDEX_PATH):
+        self.log_path = Path(log_path)
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    # ---------------------------------------------------------
+    # Sync
+    # ---------------------------------------------------------
+
+    def sync(self) -> int:
+        """
+        Indexes events appended since the last sync. Returns how many.
+        """
+        with self._lock:
+            conn = self._connect()
+            try:
+                #BEGIN IMMEDIATE: one syncing process at a time
+                conn.execute("BEGIN IMMEDIATE")
+                #Archives are only complete once the writer releases the lock,
+                #and the active file must not rotate between the two steps
+                #(its offset would be stored against the wrong file, and the
+                #archive re-read from the start). Writers wait at most for
+                #the lines appended since the last sync.
+                with log_file_lock(self.log_path):
+                    added = self._sync_archives(conn)
+                    added += self._sync_active(conn)
+                conn.commit()
+                return added
+            finally:
+                conn.close()
+
+    def _state(self, conn, key: str):
+        row = conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_state(self, conn, key: str, value):
+        conn.execute("INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, value))
+
+    def _archives(self) -> list[Path]:
+        name = self.log_path
+        return sorted(name.parent.glob(f"{name.stem}.*{name.suffix}.gz"))
+
+    def _sync_archives(self, conn) -> int:
+        added = 0
+        done = {row[0] for row in conn.execute("SELECT name FROM archives")}
+
+        for archive in self._archives():
+            if archive.name in done:
+                continue
+            with gzip.open(archive, "rb") as f:
+                #The rotated version of the file being followed: skip what
+                #was already indexed from it
+                head = self._state(conn, "active_head")
+                if head is not None and _first_line_hash(f) == head:
+                    f.seek(int(self._state(conn, "active_offset")))
+                    self._set_state(conn, "active_head", None)
+                    self._set_state(conn, "active_offset", "0")
+                else:
+                    f.seek(0)
+                added += self._ingest(conn, f)
+            conn.execute("INSERT INTO archives (name) VALUES (?)", (archive.name,))
+
+        return added
+
+    def _sync_active(self, conn) -> int:
+        if not self.log_path.exists():
+            return 0
+
+        with open(self.log_path, "rb") as f:
+            head = _first_line_hash(f)
+            if head is None:
+                return 0
+
+            offset = 0
+            if head == self._state(conn, "active_head"):
+                offset = int(self._state(conn, "active_offset"))
+            f.seek(offset)
+            added = self._ingest(conn, f)
+
+            self._set_state(conn, "active_head", head)
+            self._set_state(conn, "active_offset", str(f.tell()))
+        return added
+
+    def _ingest(self, conn, f) -> int:
+        """
+        Inserts every complete line from f's position on, and leaves f
+        positioned after the last complete line.
+        """
+        added = 0
+        rows = []
+        position = f.tell()
+
+        for line in f:
+            if not line.endswith(b"\n"):
+                #A line still being written
+                break
+            position += len(line)
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            record_id = event.get("record_id")
+            rows.append((
+                event.get("timestamp"),
+                event.get("action"),
+                event.get("source"),
+                None if record_id is None else str(record_id),
+                event.get("severity"),
+                line.decode("utf-8")
+            ))
+            if len(rows) >= _INSERT_CHUNK:
+                added += self._insert(conn, rows)
+                rows = []
+
+        added += self._insert(conn, rows)
+        f.seek(position)
+        return added
+
+    def _insert(self, conn, rows: list) -> int:
+        conn.executemany(
+            "INSERT INTO events (timestamp, action, source, record_id, severity, event) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            rows
+        )
+        return len(rows)
+
+    # ---------------------------------------------------------
+    # Queries
+    # ---------------------------------------------------------
+
+    def query(self, record_id=None, action: str | None = None, source: str | None = None,
+              severity: str | None = None, start: str | None = None, end: str | None = None,
+              limit: int = AUDIT_QUERY_LIMIT, newest_first: bool = False) -> dict:
+        """
+        Returns the events matching every given filter, in log order.
+
+        start / end are ISO timestamps (inclusive), compared with the
+        events' UTC timestamps, e.g. "2026-03-12" or "2026-03-12T15:45:00".
+        """
+        #Our own buffered events must be visible to the query
+        if self.log_path == audit_writer.path:
+            audit_writer.flush()
+        self.sync()
+
+        filters = []
+        params = []
+        for column, value in (("record_id", record_id), ("action", action),
+                              ("source", source), ("severity", severity)):
+            if value is not None:
+                filters.append(f"{column} = ?")
+                params.append(str(value))
+        if start is not None:
+            filters.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            #An end date without a time covers that whole day
+            filters.append("timestamp <= ?")
+            params.append(end if "T" in end else end + "T99")
+
+        limit = max(1, min(int(limit), AUDIT_QUERY_MAX_LIMIT))
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        order = "DESC" if newest_first else "ASC"
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT event FROM events {where} ORDER BY id {order} LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+        finally:
+            conn.close()
+
+        #Events are returned exactly as they were logged
+        events = [json.loads(row[0]) for row in rows[:limit]]
+        return {
+            "count": len(events),
+            "truncated": len(rows) > limit,
+            "events": events
+        }
+
+    def record_history(self, record_id, limit: int = AUDIT_QUERY_LIMIT) -> dict:
+        """
+        Every audit event for one record (e.g. an Employee_ID), oldest first.
+        """
+        return self.query(record_id=record_id, limit=limit)
+
+    def rebuild(self):
+        """
+        Drops the index; the next query re-reads the whole log.
+        """
+        with self._lock:
+            for suffix in ("", "-wal", "-shm"):
+                path = Path(str(self.index_path) + suffix)
+                if path.exists():
+                    os.remove(path)
+
+
+#One index for the default audit log
+audit_index = AuditIndex()
+
+
+def query_audit_log(**filters) -> dict:
+    """
+    Queries the default audit log (see AuditIndex.query for the filters).
+    """
+    return audit_index.query(**filters)
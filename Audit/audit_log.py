@@ -1,13 +1,263 @@
+import atexit
+import gzip
 import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 #Location where audits will be stored
 AUDIT_LOG_PATH = Path("outputs/audit_log.jsonl")
 
 #Ensures that the directory exists
 AUDIT_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+#Buffered events are written once there are this many...
+AUDIT_BUFFER_MAX_EVENTS = int(os.environ.get("AUDIT_BUFFER_MAX_EVENTS", "1000"))
+
+#...or once the oldest one has waited this long (seconds)
+AUDIT_FLUSH_INTERVAL = float(os.environ.get("AUDIT_FLUSH_INTERVAL", "1.0"))
+
+#The log is rotated to a gzip archive once it reaches this size
+AUDIT_MAX_BYTES = int(os.environ.get("AUDIT_LOG_MAX_MB", "50")) * 1024 * 1024
+
+#Number of rotated archives kept (oldest are deleted)
+AUDIT_BACKUP_COUNT = int(os.environ.get("AUDIT_BACKUP_COUNT", "10"))
+
+
+@contextmanager
+def log_file_lock(path: Path | str):
+    """
+    Exclusive lock (across processes) on the audit log at path, held
+    while appending to it or rotating it.
+    """
+    path = Path(path)
+    if fcntl is None:
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_name(path.name + ".lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class AuditWriter:
+    """
+    Buffered JSON Lines writer for audit events.
+
+    - Events are serialized when they are written, buffered in memory and
+      appended in one write when the buffer is full, when it gets older
+      than flush_interval, at exit, or at the end of a batch().
+    - Each flush holds a write lock (threads) and an flock on "<log>.lock"
+      (processes), so concurrent API workers never interleave lines.
+    - Once the log reaches max_bytes it is moved to
+      "<name>.<timestamp>.jsonl.gz" and a new log is started.
+    """
+
+    def __init__(self, path: Path | str = AUDIT_LOG_PATH,
+                 buffer_size: int = AUDIT_BUFFER_MAX_EVENTS,
+                 flush_interval: float = AUDIT_FLUSH_INTERVAL,
+                 max_bytes: int = AUDIT_MAX_BYTES,
+                 backup_count: int = AUDIT_BACKUP_COUNT):
+        self.path = Path(path)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        self._buffer = []
+        self._oldest = None
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._flusher = None
+        self._wake = threading.Event()
+
+        atexit.register(self.flush)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    # ---------------------------------------------------------
+    # Writing
+    # ---------------------------------------------------------
+
+    def write(self, event: dict):
+        self.write_many([event])
+
+    def write_many(self, events: list[dict]):
+        if not events:
+            return
+        lines = [json.dumps(event) + "\n" for event in events]
+
+        with self._lock:
+            if not self._buffer:
+                self._oldest = time.monotonic()
+            self._buffer.extend(lines)
+            full = not self._batch_depth and (len(self._buffer) >= self.buffer_size or self._is_stale())
+            if not full and not self._batch_depth:
+                self._start_flusher()
+
+        if full:
+            self.flush()
+
+    def flush(self):
+        """
+        Appends everything buffered to the log file.
+        """
+        with self._lock:
+            if not self._buffer:
+                return
+            data = "".join(self._buffer).encode("utf-8")
+            self._buffer = []
+            self._oldest = None
+            #Taken before releasing _lock so flushes land in order,
+            #while new events can keep being buffered during the write
+            self._write_lock.acquire()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._file_lock():
+                #One write on an O_APPEND descriptor: whole lines only
+                fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    size = os.fstat(fd).st_size
+                finally:
+                    os.close(fd)
+
+                if self.max_bytes and size >= self.max_bytes:
+                    self._rotate()
+        finally:
+            self._write_lock.release()
+
+    @contextmanager
+    def batch(self):
+        """
+        Holds every event written inside the block and writes them
+        together when it exits:
+
+            with audit_writer.batch():
+                for row in rows:
+                    log_event(...)
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                done = not self._batch_depth
+            if done:
+                self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.flush()
+        self._wake.set()
+
+    # ---------------------------------------------------------
+    # Time based flushing
+    # ---------------------------------------------------------
+
+    def _is_stale(self) -> bool:
+        return self._oldest is not None and time.monotonic() - self._oldest >= self.flush_interval
+
+    def _start_flusher(self):
+        #Called with _lock held; _flusher is only reset under it too
+        if self._flusher is not None:
+            return
+        self._wake.clear()
+        self._flusher = threading.Thread(target=self._flush_loop, name="audit-flusher", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self):
+        #Runs while there is something buffered, then exits
+        while True:
+            self._wake.wait(self.flush_interval)
+            with self._lock:
+                self._wake.clear()
+                if not self._buffer:
+                    #Decided under _lock, so a write either lands before this
+                    #check or sees no flusher and starts a new one
+                    self._flusher = None
+                    return
+                stale = not self._batch_depth and self._is_stale()
+            if stale:
+                self.flush()
+
+    def _after_fork(self):
+        #The child must not write the parent's pending events a second time
+        self._buffer = []
+        self._oldest = None
+        self._batch_depth = 0
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._flusher = None
+        self._wake = threading.Event()
+
+    # ---------------------------------------------------------
+    # Rotation
+    # ---------------------------------------------------------
+
+    def _file_lock(self):
+        return log_file_lock(self.path)
+
+    def archives(self) -> list[Path]:
+        """
+        Rotated archives, oldest first.
+        """
+        return sorted(self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}.gz"))
+
+    def _rotate(self):
+        #Called with the file lock held
+        stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+        archive = self.path.with_name(f"{self.path.stem}.{stamp}{self.path.suffix}.gz")
+        rotating = self.path.with_name(f"{self.path.name}.{stamp}.rotating")
+
+        os.replace(self.path, rotating)
+        with open(rotating, "rb") as src, gzip.open(archive, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotating)
+
+        old = self.archives()
+        for path in old[:max(len(old) - self.backup_count, 0)]:
+            path.unlink(missing_ok=True)
+
+
+#One writer for the whole process
+audit_writer = AuditWriter()
+
+
+def audit_batch():
+    """
+    Context manager writing all events logged inside it in one go.
+    """
+    return audit_writer.batch()
+
+
+def flush_audit_log():
+    audit_writer.flush()
+
+
 def log_event(
         action: str,
         source: str,
@@ -17,10 +267,24 @@ def log_event(
         metadata: dict | None = None
 ):
     """
-    Writes a single audit event to a JSON Lines file.
+    Writes a single audit event to a JSON Lines file (buffered).
     """
-    event = {
-        "timestamp": datetime.utcnow().isoformat(),
+    audit_writer.write(build_event(action, source, reason, record_id, severity, metadata))
+
+def build_event(
+        action: str,
+        source: str,
+        reason: str,
+        record_id: str | int | None = None,
+        severity: str = "INFO",
+        metadata: dict | None = None,
+        timestamp: str | None = None
+) -> dict:
+    """
+    Builds an audit event dict without writing it.
+    """
+    return {
+        "timestamp": timestamp or datetime.utcnow().isoformat(),
         "action": action,
         "source": source,
         "reason": reason,
@@ -29,5 +293,9 @@ def log_event(
         "metadata": metadata or {}
     }
 
-    with open(AUDIT_LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(json.dumps(event) + "\n")
\ No newline at end of file
+def log_events(events: list[dict]):
+    """
+    Writes many audit events and flushes them straight away.
+    """
+    with audit_batch():
+        audit_writer.write_many(events)
@@ -0,0 +1,9 @@
+# =============================================================
+# Benchmarks Package
+# =============================================================
+# Standalone timing scripts for the hot paths of the pipeline.
+# Each module can be run directly, e.g.:
+#   python -m Benchmarks.bench_row_scoring
+#   python -m Benchmarks.bench_suite   (all entry points, JSON results)
+# Nothing in here is imported by the API or the pipelines.
+# =============================================================
@@ -0,0 +1,154 @@
+"""
+Audit Log Throughput Benchmark
+===============================
+Measures audit events written per second:
+
+  legacy       the original log_event(): open, append one line, close,
+               for every event (reference copy below)
+  buffered     Audit.audit_log.log_event() through a buffered AuditWriter
+  batch        the same inside one `with writer.batch():` block
+  threads      buffered writes from THREADS threads sharing one writer
+
+Every mode writes to its own file in a temporary folder (or --work-dir),
+and the line count is checked afterwards.
+
+How to run:
+  python -m Benchmarks.bench_audit_log
+  python -m Benchmarks.bench_audit_log --events 10000 200000
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import Audit.audit_log as audit_log
+from Audit.audit_log import AuditWriter
+
+DEFAULT_EVENTS = [10_000, 100_000]
+THREADS = 4
+
+
+def legacy_log_event(path: Path, action, source, reason, record_id=None, severity="INFO", metadata=None):
+    """
+    The original log_event(), writing to `path`.
+    """
+    event = {
+        "timestamp": datetime.utcnow().isoformat(),
+        "action": action,
+        "source": source,
+        "reason": reason,
+        "record_id": record_id,
+        "severity": severity,
+        "metadata": metadata or {}
+    }
+
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(event) + "\n")
+
+
+def _event_args(i: int) -> tuple:
+    return ("STANDARDIZE_EMAIL", "standardization", "Normalized email casing/spacing", i)
+
+
+def _metadata(i: int) -> dict:
+    return {"before": f" User{i}@Example.com", "after": f"user{i}@example.com"}
+
+
+def run_legacy(path: Path, events: int):
+    for i in range(events):
+        legacy_log_event(path, *_event_args(i), metadata=_metadata(i))
+
+
+def run_buffered(path: Path, events: int):
+    writer = AuditWriter(path, max_bytes=0)
+    original, audit_log.audit_writer = audit_log.audit_writer, writer
+    try:
+        for i in range(events):
+            audit_log.log_event(*_event_args(i), metadata=_metadata(i))
+        writer.close()
+    finally:
+        audit_log.audit_writer = original
+
+
+def run_batch(path: Path, events: int):
+    writer = AuditWriter(path, max_bytes=0)
+    original, audit_log.audit_writer = audit_log.audit_writer, writer
+    try:
+        with writer.batch():
+            for i in range(events):
+                audit_log.log_event(*_event_args(i), metadata=_metadata(i))
+        writer.close()
+    finally:
+        audit_log.audit_writer = original
+
+
+def run_threads(path: Path, events: int):
+    writer = AuditWriter(path, max_bytes=0)
+    per_thread = events // THREADS
+
+    def worker(offset: int):
+        for i in range(offset, offset + per_thread):
+            writer.write(audit_log.build_event(*_event_args(i), metadata=_metadata(i)))
+
+    threads = [threading.Thread(target=worker, args=(n * per_thread,)) for n in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    writer.close()
+
+
+MODES = {
+    "legacy": run_legacy,
+    "buffered": run_buffered,
+    "batch": run_batch,
+    "threads": run_threads,
+}
+
+
+def run_benchmark(sizes: list[int], work_dir: str) -> list[dict]:
+    results = []
+
+    for events in sizes:
+        for mode, func in MODES.items():
+            path = Path(work_dir) / f"{mode}_{events}.jsonl"
+
+            start = time.perf_counter()
+            func(path, events)
+            seconds = time.perf_counter() - start
+
+            with open(path, encoding="utf-8") as f:
+                lines = sum(1 for _ in f)
+            written = events - events % THREADS if mode == "threads" else events
+
+            entry = {
+                "mode": mode,
+                "events": events,
+                "seconds": round(seconds, 3),
+                "events_per_s": round(written / seconds),
+                "complete": lines == written,
+            }
+            results.append(entry)
+            print(entry)
+            os.remove(path)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark audit log write throughput")
+    parser.add_argument("--events", type=int, nargs="+", default=DEFAULT_EVENTS)
+    parser.add_argument("--work-dir", default=None, help="Where the benchmark logs are written")
+    args = parser.parse_args()
+
+    if args.work_dir:
+        os.makedirs(args.work_dir, exist_ok=True)
+        run_benchmark(args.events, args.work_dir)
+    else:
+        with tempfile.TemporaryDirectory() as work_dir:
+            run_benchmark(args.events, work_dir)
@@ -0,0 +1,132 @@
+"""
+Row Scoring Benchmark
+======================
+Times the vectorized Quality_Detection.row_scoring.calculate_row_quality_scores
+against the original row-by-row (iterrows) implementation, which is kept
+below as a reference copy.
+
+The bundled Messy_Employee dataset is resampled up to each target size
+so the mix of blanks, bad emails, phones and duplicate IDs stays realistic.
+
+How to run:
+  python -m Benchmarks.bench_row_scoring
+  python -m Benchmarks.bench_row_scoring --sizes 10000 100000 --legacy-max-rows 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from Quality_Detection.Quality_Detection import load_data
+from Quality_Detection.row_scoring import calculate_row_quality_scores
+
+SOURCE_CSV = "Messy_Employee_dataset_v2.csv"
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def legacy_row_quality_scores(df: pd.DataFrame):
+    """
+    The original iterrows() scorer, minus the per-row SSN HTTP call
+    (the benchmark datasets have no SSN column).
+    """
+    scores = []
+
+    duplicate_ids = df["Employee_ID"].duplicated(keep=False)
+
+    for idx, row in df.iterrows():
+        score = 100
+
+        for col in ["Employee_ID", "First_Name", "Last_Name", "Email", "Department_Region"]:
+            if pd.isna(row[col]) or str(row[col]).strip() == "":
+                score -= 25
+
+        if not pd.isna(row["Email"]) and "@" not in str(row["Email"]):
+            score -= 20
+
+        if "Age" in df.columns:
+            if pd.isna(row["Age"]):
+                score -= 10
+
+        if "Join_Date" in df.columns:
+            if pd.isna(row["Join_Date"]):
+                score -= 10
+
+        if "Phone" in df.columns:
+            phone = str(row["Phone"])
+            if phone and not phone.isdigit():
+                score -= 15
+
+        if "Salary" in df.columns:
+            if pd.isna(row["Salary"]):
+                score -= 5
+
+        if duplicate_ids.iloc[idx]:
+            score -= 30
+
+        scores.append(max(score, 0))
+
+    df["Row_Quality_Score"] = scores
+
+    def classify(score):
+        if score >= 85:
+            return "GOOD"
+        elif score >= 70:
+            return "WARNING"
+        return "BAD"
+
+    df["Row_Usability_Status"] = df["Row_Quality_Score"].apply(classify)
+
+    return df
+
+
+def build_dataset(base: pd.DataFrame, rows: int, seed: int = 0) -> pd.DataFrame:
+    """
+    Resamples the base dataset (with replacement) up to the requested size.
+    """
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(base), size=rows)
+    return base.iloc[picks].reset_index(drop=True)
+
+
+def time_call(func, df: pd.DataFrame) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(df.copy())
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(sizes: list[int], legacy_max_rows: int) -> list[dict]:
+    base = load_data(SOURCE_CSV)
+    results = []
+
+    for rows in sizes:
+        df = build_dataset(base, rows)
+
+        new_seconds, new_df = time_call(calculate_row_quality_scores, df)
+        entry = {"rows": rows, "vectorized_s": round(new_seconds, 4)}
+
+        if rows <= legacy_max_rows:
+            old_seconds, old_df = time_call(legacy_row_quality_scores, df)
+            entry["legacy_s"] = round(old_seconds, 4)
+            entry["speedup"] = round(old_seconds / new_seconds, 1)
+            entry["identical"] = bool(
+                (old_df["Row_Quality_Score"].to_numpy() == new_df["Row_Quality_Score"].to_numpy()).all()
+            )
+
+        results.append(entry)
+        print(entry)
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark employee row scoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--legacy-max-rows", type=int, default=max(DEFAULT_SIZES),
+        help="Skip the slow iterrows() reference above this many rows"
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.legacy_max_rows)
@@ -0,0 +1,106 @@
+"""
+CSV vs Columnar Sidecar Load Benchmark
+=======================================
+Times loading the bundled datasets, scaled up by resampling rows, three ways:
+
+  csv_s        plain pd.read_csv()
+  first_load_s columnar_sidecar.load_csv() with no sidecar yet
+               (parses the CSV and writes the .arrow sidecar)
+  sidecar_s    columnar_sidecar.load_csv() with a fresh sidecar
+  projected_s  the same, loading only PROJECTED_COLUMNS
+
+The scaled CSVs are written to a temporary folder (or --work-dir) and
+can be large: 10M rows of the employee data is roughly 1GB of CSV.
+
+How to run:
+  python -m Benchmarks.bench_sidecar
+  python -m Benchmarks.bench_sidecar --sizes 100000 1000000 --datasets Messy_Employee_dataset_v2.csv
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from columnar_sidecar import load_csv, sidecar_available, sidecar_path
+
+DEFAULT_DATASETS = [
+    "Messy_Employee_dataset.csv",
+    "Messy_Employee_dataset_v2.csv",
+    "Messy_Employee_dataset_with_ssn.csv",
+]
+DEFAULT_SIZES = [100_000, 1_000_000, 10_000_000]
+PROJECTED_COLUMNS = 2
+
+
+def write_scaled_csv(source: str, rows: int, target: str, seed: int = 0):
+    """
+    Resamples the source CSV (with replacement) to `rows` rows.
+    """
+    base = pd.read_csv(source)
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(base), size=rows)
+    base.iloc[picks].to_csv(target, index=False)
+
+
+def time_call(func, *args) -> tuple[float, pd.DataFrame]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def run_benchmark(datasets: list[str], sizes: list[int], work_dir: str) -> list[dict]:
+    results = []
+
+    for dataset in datasets:
+        for rows in sizes:
+            csv_path = os.path.join(work_dir, f"{rows}_{os.path.basename(dataset)}")
+            write_scaled_csv(dataset, rows, csv_path)
+
+            csv_seconds, csv_df = time_call(pd.read_csv, csv_path)
+            first_seconds, _ = time_call(load_csv, csv_path)
+            sidecar_seconds, sidecar_df = time_call(load_csv, csv_path)
+
+            columns = csv_df.columns[:PROJECTED_COLUMNS].tolist()
+            projected_seconds, _ = time_call(load_csv, csv_path, columns)
+
+            entry = {
+                "dataset": dataset,
+                "rows": rows,
+                "csv_mb": round(os.path.getsize(csv_path) / (1024 * 1024), 1),
+                "csv_s": round(csv_seconds, 3),
+                "first_load_s": round(first_seconds, 3),
+                "sidecar_s": round(sidecar_seconds, 3),
+                "projected_s": round(projected_seconds, 3),
+                "speedup": round(csv_seconds / sidecar_seconds, 1),
+                "identical": bool(csv_df.equals(sidecar_df)),
+            }
+            results.append(entry)
+            print(entry)
+
+            os.remove(csv_path)
+            if os.path.exists(sidecar_path(csv_path)):
+                os.remove(sidecar_path(csv_path))
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CSV vs columnar sidecar loads")
+    parser.add_argument("--datasets", nargs="+", default=DEFAULT_DATASETS)
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--work-dir", default=None, help="Where the scaled CSVs are written")
+    args = parser.parse_args()
+
+    if not sidecar_available():
+        raise SystemExit("pyarrow is not installed (or DQ_DISABLE_SIDECAR=1); nothing to compare.")
+
+    if args.work_dir:
+        os.makedirs(args.work_dir, exist_ok=True)
+        run_benchmark(args.datasets, args.sizes, args.work_dir)
+    else:
+        with tempfile.TemporaryDirectory() as work_dir:
+            run_benchmark(args.datasets, args.sizes, work_dir)
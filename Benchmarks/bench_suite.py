@@ -0,0 +1,336 @@
+"""
+End-to-End Benchmark Suite
+===========================
+Times the public entry points on synthetic messy datasets (see
+synthetic_data.py) and writes the results as JSON, so runs from two
+commits can be compared:
+
+  employee datasets   load_data, calculate_row_quality_scores,
+                      ResolutionEngine.resolve, apply_standardization,
+                      run_employee_dq_pipeline
+  generic datasets    run_generic_pipeline (in-memory and streaming)
+                      and every mcp_main tool, both on a cold dataset
+                      cache and on a warm one ("[cached]")
+
+Each target runs --repeat times per dataset; the JSON keeps every run
+plus the best and median wall time, the CPU time and the peak memory
+(measured with tracing.Trace). Reports that carry their own per-stage
+"timings" (run_generic_pipeline) keep the stages of the best run.
+
+Side effects stay in the work folder: the audit log and audit index
+are pointed at it for the duration of the run, and SSNs are validated
+locally (no SSN server needed).
+
+How to run:
+  python -m Benchmarks.bench_suite
+  python -m Benchmarks.bench_suite --rows 10000 1000000 --repeat 5 --null-rate 0.2
+  python -m Benchmarks.bench_suite --targets run_generic_pipeline --compare outputs/benchmarks/<old>.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import warnings
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+import Audit.audit_index as audit_index
+import Audit.audit_log as audit_log
+import integrations.ssn_client as ssn_client
+from Audit.audit_index import AuditIndex
+from Audit.audit_log import AuditWriter
+from Benchmarks.synthetic_data import (
+    MESSINESS, generate_employee_dataset, generate_generic_dataset,
+    random_generic_schema, write_dataset
+)
+from dataset_cache import dataset_cache
+from Generic_Detection.generic_pipeline import run_generic_pipeline
+from Quality_Detection.Quality_Detection import load_data, run_employee_dq_pipeline
+from Quality_Detection.row_scoring import calculate_row_quality_scores
+from Resolution_Strategy.resolution_engine import ResolutionEngine
+from Resolution_Strategy.rules import RESOLUTION_RULES
+from Resolution_Strategy.standardization import apply_standardization
+from tracing import Trace
+
+try:
+    import mcp_main
+except ImportError:  # fastmcp is optional outside the MCP server
+    mcp_main = None
+
+DEFAULT_ROWS = [10_000, 100_000]
+DEFAULT_COLUMNS = 12
+DEFAULT_REPEAT = 3
+RESULTS_DIR = Path("outputs/benchmarks")
+
+
+def _quiet(func, *args, **kwargs):
+    """
+    Calls func with its prints (ResolutionEngine is chatty) discarded.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+# =============================================================
+# TARGETS
+# =============================================================
+# Each target maps a dataset context to a zero-argument callable:
+# anything built outside the callable (copies, scored frames) is
+# setup and is not timed.
+
+EMPLOYEE_TARGETS = {
+    "load_data": lambda ctx: partial(load_data, ctx["csv_path"]),
+    "calculate_row_quality_scores": lambda ctx: partial(calculate_row_quality_scores, ctx["df"].copy()),
+    "ResolutionEngine.resolve": lambda ctx: partial(
+        _quiet, ResolutionEngine(RESOLUTION_RULES).resolve, ctx["scored"].copy()
+    ),
+    "apply_standardization": lambda ctx: partial(apply_standardization, ctx["df"].copy()),
+    "run_employee_dq_pipeline": lambda ctx: partial(run_employee_dq_pipeline, ctx["csv_path"]),
+}
+
+GENERIC_TARGETS = {
+    "run_generic_pipeline": lambda ctx: partial(run_generic_pipeline, ctx["csv_path"], streaming=False),
+    "run_generic_pipeline[streaming]": lambda ctx: partial(run_generic_pipeline, ctx["csv_path"], streaming=True),
+}
+
+
+def _mcp_tool_calls(ctx: dict) -> dict:
+    """
+    Arguments for every mcp_main tool, picked from the dataset's schema.
+    """
+    columns = [name for name, _ in ctx["schema"]]
+    numeric = next((name for name, kind in ctx["schema"] if kind in ("int", "float")), columns[0])
+    email = next((name for name, kind in ctx["schema"] if kind == "email"), columns[0])
+    path = ctx["csv_path"]
+
+    return {
+        "get_dataset_summary": {"csv_path": path},
+        "check_missing_values": {"csv_path": path},
+        "find_duplicates": {"csv_path": path},
+        "detect_numeric_outliers": {"csv_path": path, "column": numeric},
+        "check_type_consistency": {"csv_path": path},
+        "validate_column_range": {"csv_path": path, "column": numeric, "min_val": 0, "max_val": 1000},
+        "check_schema_validity": {"csv_path": path, "expected_columns": columns},
+        "check_regex_pattern": {"csv_path": path, "column": email,
+                                "pattern": r"^[^@\s]+@[^@\s]+\.[a-z]+$", "description": "email"},
+        "manage_dataset_cache": {"action": "status"},
+        "query_audit_events": {"limit": 100},
+    }
+
+
+def _mcp_targets() -> dict:
+    if mcp_main is None:
+        return {}
+
+    def cold(tool, kwargs):
+        dataset_cache.clear()
+        return tool(**kwargs)
+
+    targets = {}
+    for name in _mcp_tool_calls({"csv_path": "", "schema": [("x", "int")]}):
+        # fastmcp 2 wraps the function in a tool object (.fn), fastmcp 1 does not
+        tool = getattr(getattr(mcp_main, name), "fn", getattr(mcp_main, name))
+        targets[f"mcp_main.{name}"] = (
+            lambda ctx, tool=tool, name=name: partial(cold, tool, _mcp_tool_calls(ctx)[name])
+        )
+        targets[f"mcp_main.{name}[cached]"] = (
+            lambda ctx, tool=tool, name=name: partial(tool, **_mcp_tool_calls(ctx)[name])
+        )
+    return targets
+
+
+# =============================================================
+# MEASUREMENT
+# =============================================================
+
+def measure(target: str, make_call, ctx: dict, repeat: int) -> dict:
+    trace = Trace("benchmark")
+    stages = None
+    best = None
+
+    for _ in range(repeat):
+        call = make_call(ctx)
+        try:
+            with trace.stage(target, rows=ctx["rows"]):
+                result = call()
+        except Exception as e:
+            # A target that cannot handle this data is reported, not fatal
+            return {"target": target, "dataset": ctx["name"], "rows": ctx["rows"],
+                    "columns": ctx["columns"], "error": f"{type(e).__name__}: {e}"}
+        span = trace.spans[-1]
+        if best is None or span.wall_s < best.wall_s:
+            best = span
+            if isinstance(result, dict) and "timings" in result:
+                stages = result["timings"]["stages"]
+
+    runs = [span.wall_s for span in trace.spans]
+    entry = {
+        "target": target,
+        "dataset": ctx["name"],
+        "rows": ctx["rows"],
+        "columns": ctx["columns"],
+        "runs_s": [round(seconds, 4) for seconds in runs],
+        "best_s": round(best.wall_s, 4),
+        "median_s": round(statistics.median(runs), 4),
+        "cpu_s": round(best.cpu_s, 4),
+        "peak_rss_mb": round(max(span.peak_rss for span in trace.spans) / (1024 * 1024), 1),
+        "rows_per_s": round(ctx["rows"] / best.wall_s) if best.wall_s else None,
+    }
+    if stages is not None:
+        entry["stages"] = stages
+    return entry
+
+
+@contextlib.contextmanager
+def isolated_outputs(work_dir: Path):
+    """
+    Points the audit log, the audit index and SSN validation at
+    benchmark-only settings, restoring them afterwards.
+    """
+    writer = AuditWriter(work_dir / "audit_log.jsonl", max_bytes=0)
+    index = AuditIndex(work_dir / "audit_log.jsonl", work_dir / "audit_index.sqlite")
+    saved = (audit_log.audit_writer, audit_index.audit_index, ssn_client.SSN_VALIDATION_MODE)
+
+    audit_log.audit_writer = writer
+    audit_index.audit_index = index
+    ssn_client.SSN_VALIDATION_MODE = "local"
+    try:
+        yield
+    finally:
+        writer.close()
+        audit_log.audit_writer, audit_index.audit_index, ssn_client.SSN_VALIDATION_MODE = saved
+        dataset_cache.clear()
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(sizes: list[int], columns: int, repeat: int, messiness: dict,
+                  work_dir: Path, targets: list[str] | None = None, seed: int = 0) -> dict:
+    employee_targets = EMPLOYEE_TARGETS
+    generic_targets = {**GENERIC_TARGETS, **_mcp_targets()}
+    if targets:
+        employee_targets = {k: v for k, v in employee_targets.items() if k.split("[")[0] in targets or k in targets}
+        generic_targets = {k: v for k, v in generic_targets.items() if k.split("[")[0] in targets or k in targets}
+
+    results = []
+    with isolated_outputs(work_dir):
+        for rows in sizes:
+            if employee_targets:
+                csv_path = write_dataset(
+                    generate_employee_dataset(rows, seed, **messiness), str(work_dir / f"employee_{rows}.csv")
+                )
+                df = load_data(csv_path)
+                ctx = {"name": "employee", "csv_path": csv_path, "rows": rows,
+                       "columns": len(df.columns), "df": df,
+                       "scored": calculate_row_quality_scores(df.copy())}
+                for target, make_call in employee_targets.items():
+                    results.append(measure(target, make_call, ctx, repeat))
+                    print({k: v for k, v in results[-1].items() if k != "stages"})
+
+            if generic_targets:
+                schema = random_generic_schema(columns, seed)
+                generic_messiness = {k: v for k, v in messiness.items() if k != "ssn_valid_rate"}
+                csv_path = write_dataset(
+                    generate_generic_dataset(rows, schema, seed, **generic_messiness),
+                    str(work_dir / f"generic_{rows}x{columns}.csv")
+                )
+                ctx = {"name": "generic", "csv_path": csv_path, "rows": rows,
+                       "columns": columns, "schema": schema}
+                for target, make_call in generic_targets.items():
+                    results.append(measure(target, make_call, ctx, repeat))
+                    print({k: v for k, v in results[-1].items() if k != "stages"})
+
+    return {
+        "meta": {
+            "created_at": datetime.utcnow().isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {"rows": sizes, "columns": columns, "repeat": repeat, "seed": seed,
+                   "messiness": messiness, "mcp_tools": mcp_main is not None},
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> list[dict]:
+    """
+    Best times of the targets found in both runs; ratio > 1 means the
+    current run is slower.
+    """
+    def keyed(run):
+        return {(r["target"], r["dataset"], r["rows"], r["columns"]): r
+                for r in run["results"] if "error" not in r}
+
+    old, new = keyed(baseline), keyed(current)
+    rows = []
+    for key in sorted(old.keys() & new.keys(), key=str):
+        rows.append({
+            "target": key[0], "dataset": key[1], "rows": key[2],
+            "baseline_s": old[key]["best_s"], "current_s": new[key]["best_s"],
+            "ratio": round(new[key]["best_s"] / old[key]["best_s"], 2) if old[key]["best_s"] else None,
+        })
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the pipelines on synthetic messy data")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS, help="Columns of the generic datasets")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--targets", nargs="+", default=None, help="Only these targets (default: all)")
+    for name, default in MESSINESS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=default)
+    parser.add_argument("--work-dir", default=None, help="Where the datasets are written")
+    parser.add_argument("--output", default=None, help=f"Results JSON (default: under {RESULTS_DIR}/)")
+    parser.add_argument("--compare", default=None, help="Earlier results JSON to compare against")
+    args = parser.parse_args()
+
+    # pandas warns on every date column it cannot infer a format for
+    warnings.simplefilter("ignore", UserWarning)
+
+    if mcp_main is None:
+        print("fastmcp is not installed: skipping the mcp_main tools")
+
+    messiness = {name: getattr(args, name) for name in MESSINESS}
+    run = partial(run_benchmark, args.rows, args.columns, args.repeat, messiness,
+                  targets=args.targets, seed=args.seed)
+    if args.work_dir:
+        os.makedirs(args.work_dir, exist_ok=True)
+        report = run(Path(args.work_dir))
+    else:
+        with tempfile.TemporaryDirectory() as work_dir:
+            report = run(Path(work_dir))
+
+    output = Path(args.output) if args.output else (
+        RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}_{report['meta']['commit'] or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        for entry in compare(json.loads(Path(args.compare).read_text()), report):
+            print(entry)
@@ -0,0 +1,305 @@
+"""
+Synthetic Messy Dataset Generator
+==================================
+Builds datasets of any size with a controlled amount of dirt, for the
+benchmarks (see bench_suite.py) and for trying the pipelines on more
+than the ~1k rows of the bundled Messy_Employee CSVs.
+
+Two shapes are supported:
+
+  employee   the bundled Messy_Employee schema (Employee_ID ... Remote_Work,
+             plus SSN unless include_ssn=False), with values drawn from
+             the same pools as the bundled files
+  generic    any schema, given as a list of (column name, kind) pairs,
+             where kind is one of GENERIC_KINDS; random_generic_schema()
+             makes one up for a number of columns
+
+The dirt is controlled by MESSINESS (all rates are fractions, 0..1):
+
+  null_rate        cells left blank
+  duplicate_rate   rows replaced by a copy of another row
+  outlier_rate     numeric cells pushed far outside the normal range
+  mixed_type_rate  numeric/date/email cells replaced by text of the
+                   wrong kind ("N/A", "thirty", "2021-13-45", ...);
+                   the employee shape keeps Age and Salary numeric
+                   (see EMPLOYEE_NUMERIC_COLUMNS)
+  ssn_valid_rate   SSNs that pass integrations.SSN.is_valid_ssn()
+                   (the rest use the invalid patterns of the bundled file)
+
+Everything is drawn from a seeded numpy Generator, so the same
+arguments always produce the same dataset.
+
+How to run (writes one CSV):
+  python -m Benchmarks.synthetic_data --rows 100000 --output employees.csv
+  python -m Benchmarks.synthetic_data --shape generic --columns 30 --null-rate 0.2 --output wide.csv
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Default dirt, close to what the bundled Messy_Employee files contain
+MESSINESS = {
+    "null_rate": 0.05,
+    "duplicate_rate": 0.02,
+    "outlier_rate": 0.01,
+    "mixed_type_rate": 0.02,
+    "ssn_valid_rate": 0.8,
+}
+
+FIRST_NAMES = ["Alice", "Bob", "Charlie", "David", "Eva", "Frank", "Grace", "Heidi", "Ivan", "Judy"]
+LAST_NAMES = ["Brown", "Davis", "Garcia", "Johnson", "Jones", "Miller", "Smith", "Williams"]
+DEPARTMENTS = ["Admin", "DevOps", "Finance", "HR", "IT", "Marketing", "Sales"]
+REGIONS = ["California", "Florida", "Illinois", "Nevada", "New York", "Texas"]
+STATUSES = ["Active", "Inactive", "Pending"]
+PERFORMANCE = ["Poor", "Average", "Good", "Excellent"]
+
+# Invalid SSN patterns seen in Messy_Employee_dataset_with_ssn.csv
+INVALID_SSNS = ["000-00-0000", "666-00-10000", "900-00-0000", "900-100-0000",
+                "666-100-0000", "000-00-10000", "900-100-10000"]
+
+# Wrong-kind text used for mixed types, per kind of column
+MIXED_VALUES = {
+    "int": ["N/A", "unknown", "thirty", "12k", "-"],
+    "float": ["N/A", "unknown", "TBD", "1,234.5", "$"],
+    "date": ["2021-13-45", "yesterday", "00/00/0000", "N/A"],
+    "email": ["no-email", "bob.davis.example.com", "@example.com", "N/A"],
+    "bool": ["maybe", "yes?", "2"],
+}
+
+# Employee columns that never get mixed types: like in the bundled files
+# they are always numbers, and the employee pipeline compares them with
+# numbers (Quality_Detection.accuracy_checks), so text would only make
+# run_employee_dq_pipeline raise instead of being benchmarked
+EMPLOYEE_NUMERIC_COLUMNS = ("Age", "Salary")
+
+GENERIC_KINDS = ("id", "int", "float", "category", "date", "email", "text", "bool")
+_WORDS = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel",
+          "india", "juliet", "kilo", "lima", "mike", "november", "oscar", "papa"]
+
+
+# =============================================================
+# VALUE POOLS
+# =============================================================
+
+def _pick(rng: np.random.Generator, pool: list, rows: int) -> np.ndarray:
+    return np.asarray(pool, dtype=object)[rng.integers(0, len(pool), size=rows)]
+
+
+def _dates(rng: np.random.Generator, rows: int, start_year: int = 2015, end_year: int = 2025) -> pd.Series:
+    """
+    m/d/yyyy strings, the format of the bundled Join_Date column.
+    """
+    month = pd.Series(rng.integers(1, 13, size=rows)).astype(str)
+    day = pd.Series(rng.integers(1, 29, size=rows)).astype(str)
+    year = pd.Series(rng.integers(start_year, end_year + 1, size=rows)).astype(str)
+    return month + "/" + day + "/" + year
+
+
+def _ssns(rng: np.random.Generator, rows: int, valid_rate: float) -> pd.Series:
+    # Valid: area 001-899 without 666, group 01-99, serial 0001-9999
+    area = rng.integers(1, 899, size=rows)
+    area = np.where(area == 666, 667, area)
+    group = rng.integers(1, 100, size=rows)
+    serial = rng.integers(1, 10000, size=rows)
+    valid = (
+        pd.Series(area).astype(str).str.zfill(3) + "-"
+        + pd.Series(group).astype(str).str.zfill(2) + "-"
+        + pd.Series(serial).astype(str).str.zfill(4)
+    )
+    invalid = pd.Series(_pick(rng, INVALID_SSNS, rows))
+    return valid.where(rng.random(rows) < valid_rate, invalid)
+
+
+# =============================================================
+# DIRT
+# =============================================================
+
+def _with_outliers(rng: np.random.Generator, values: np.ndarray, rate: float, low, high) -> np.ndarray:
+    """
+    Replaces `rate` of the values with ones far below `low` or far above `high`.
+    """
+    mask = rng.random(len(values)) < rate
+    if not mask.any():
+        return values
+    values = values.astype(float)
+    span = high - low
+    far = np.where(rng.random(mask.sum()) < 0.5, low - span * 10, high + span * 10)
+    values[mask] = far
+    return values
+
+
+def _with_mixed_types(rng: np.random.Generator, values, rate: float, kind: str) -> pd.Series:
+    values = pd.Series(values)
+    mask = rng.random(len(values)) < rate
+    if not mask.any():
+        return values
+    values = values.astype(object)
+    values[mask] = _pick(rng, MIXED_VALUES[kind], int(mask.sum()))
+    return values
+
+
+def _finish(rng: np.random.Generator, df: pd.DataFrame, null_rate: float,
+            duplicate_rate: float, keep_columns: tuple = ()) -> pd.DataFrame:
+    """
+    Blanks `null_rate` of the cells (except in keep_columns), then
+    replaces `duplicate_rate` of the rows with copies of other rows.
+    """
+    rows = len(df)
+
+    if null_rate > 0:
+        for column in df.columns:
+            if column in keep_columns:
+                continue
+            mask = rng.random(rows) < null_rate
+            if mask.any():
+                df[column] = df[column].mask(mask)
+
+    duplicates = int(round(rows * duplicate_rate))
+    if duplicates and rows > 1:
+        order = np.arange(rows)
+        order[rng.choice(rows, size=duplicates, replace=False)] = rng.integers(0, rows, size=duplicates)
+        df = df.iloc[order].reset_index(drop=True)
+
+    return df
+
+
+def _rates(overrides: dict) -> dict:
+    unknown = set(overrides) - set(MESSINESS)
+    if unknown:
+        raise ValueError(f"Unknown messiness settings: {sorted(unknown)}")
+    return {**MESSINESS, **overrides}
+
+
+# =============================================================
+# EMPLOYEE SCHEMA
+# =============================================================
+
+def generate_employee_dataset(rows: int, seed: int = 0, include_ssn: bool = True, **messiness) -> pd.DataFrame:
+    """
+    A Messy_Employee-shaped DataFrame with `rows` rows.
+
+    messiness overrides entries of MESSINESS, e.g. null_rate=0.2.
+    Employee_ID is never blanked, so duplicate_rate is also the rate
+    of duplicate IDs.
+    """
+    rates = _rates(messiness)
+    rng = np.random.default_rng(seed)
+
+    first = _pick(rng, FIRST_NAMES, rows)
+    last = _pick(rng, LAST_NAMES, rows)
+    email = pd.Series(first).str.lower() + "." + pd.Series(last).str.lower() + "@example.com"
+
+    age = _with_outliers(rng, rng.integers(22, 61, size=rows), rates["outlier_rate"], 22, 60)
+    salary = _with_outliers(rng, rng.normal(85_000, 20_000, size=rows).round(2),
+                            rates["outlier_rate"], 40_000, 150_000)
+
+    def mixed(column: str, values, kind: str) -> pd.Series:
+        # Text only goes into columns the employee pipeline reads as text
+        rate = 0.0 if column in EMPLOYEE_NUMERIC_COLUMNS else rates["mixed_type_rate"]
+        return _with_mixed_types(rng, values, rate, kind)
+
+    columns = {
+        "Employee_ID": "EMP" + pd.Series(np.arange(1000, 1000 + rows)).astype(str),
+        "First_Name": first,
+        "Last_Name": last,
+        "Age": mixed("Age", age, "int"),
+        "Department_Region": pd.Series(_pick(rng, DEPARTMENTS, rows)) + "-" + pd.Series(_pick(rng, REGIONS, rows)),
+        "Status": _pick(rng, STATUSES, rows),
+        "Join_Date": mixed("Join_Date", _dates(rng, rows), "date"),
+        "Salary": mixed("Salary", salary, "float"),
+        "Email": mixed("Email", email, "email"),
+        # The bundled files store phones as (often negative) 10-digit integers
+        "Phone": mixed("Phone", rng.integers(-9_999_999_999, 9_999_999_999, size=rows), "int"),
+        "Performance_Score": _pick(rng, PERFORMANCE, rows),
+        "Remote_Work": rng.random(rows) < 0.5,
+    }
+    if include_ssn:
+        columns["SSN"] = _ssns(rng, rows, rates["ssn_valid_rate"])
+
+    df = pd.DataFrame({name: pd.Series(values) for name, values in columns.items()})
+    return _finish(rng, df, rates["null_rate"], rates["duplicate_rate"], keep_columns=("Employee_ID",))
+
+
+# =============================================================
+# GENERIC SCHEMAS
+# =============================================================
+
+def random_generic_schema(columns: int, seed: int = 0) -> list[tuple[str, str]]:
+    """
+    `columns` (name, kind) pairs: an id column, then random kinds.
+    """
+    rng = np.random.default_rng(seed)
+    kinds = ["id"] + list(_pick(rng, GENERIC_KINDS[1:], max(columns - 1, 0)))
+    return [(f"{kind}_{i}", kind) for i, kind in enumerate(kinds[:columns])]
+
+
+def _generic_column(rng: np.random.Generator, kind: str, rows: int, rates: dict):
+    if kind == "id":
+        return "ID" + pd.Series(np.arange(rows)).astype(str)
+    if kind == "int":
+        values = _with_outliers(rng, rng.integers(0, 1000, size=rows), rates["outlier_rate"], 0, 1000)
+        return _with_mixed_types(rng, values, rates["mixed_type_rate"], "int")
+    if kind == "float":
+        values = _with_outliers(rng, rng.normal(100, 15, size=rows).round(3), rates["outlier_rate"], 55, 145)
+        return _with_mixed_types(rng, values, rates["mixed_type_rate"], "float")
+    if kind == "category":
+        return _pick(rng, _WORDS[:6], rows)
+    if kind == "date":
+        return _with_mixed_types(rng, _dates(rng, rows), rates["mixed_type_rate"], "date")
+    if kind == "email":
+        email = pd.Series(_pick(rng, _WORDS, rows)) + pd.Series(rng.integers(0, 100, size=rows)).astype(str) + "@example.org"
+        return _with_mixed_types(rng, email, rates["mixed_type_rate"], "email")
+    if kind == "text":
+        return pd.Series(_pick(rng, _WORDS, rows)) + " " + pd.Series(_pick(rng, _WORDS, rows))
+    if kind == "bool":
+        return _with_mixed_types(rng, rng.random(rows) < 0.5, rates["mixed_type_rate"], "bool")
+    raise ValueError(f"Unknown column kind '{kind}'. Use one of {GENERIC_KINDS}.")
+
+
+def generate_generic_dataset(rows: int, schema: list[tuple[str, str]] | int = 12,
+                             seed: int = 0, **messiness) -> pd.DataFrame:
+    """
+    A DataFrame following `schema` (or random_generic_schema(schema)
+    when given a column count) with `rows` rows.
+
+    messiness overrides entries of MESSINESS; ssn_valid_rate is unused.
+    """
+    rates = _rates(messiness)
+    if isinstance(schema, int):
+        schema = random_generic_schema(schema, seed)
+    rng = np.random.default_rng(seed)
+
+    df = pd.DataFrame({
+        name: pd.Series(_generic_column(rng, kind, rows, rates)) for name, kind in schema
+    })
+    id_columns = tuple(name for name, kind in schema if kind == "id")
+    return _finish(rng, df, rates["null_rate"], rates["duplicate_rate"], keep_columns=id_columns)
+
+
+def write_dataset(df: pd.DataFrame, path: str) -> str:
+    df.to_csv(path, index=False)
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a synthetic messy CSV")
+    parser.add_argument("--shape", choices=["employee", "generic"], default="employee")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=12, help="Generic shape only")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-ssn", action="store_true", help="Employee shape without the SSN column")
+    for name, default in MESSINESS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=default)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+
+    rates = {name: getattr(args, name) for name in MESSINESS}
+    if args.shape == "employee":
+        data = generate_employee_dataset(args.rows, args.seed, include_ssn=not args.no_ssn, **rates)
+    else:
+        data = generate_generic_dataset(args.rows, args.columns, args.seed, **rates)
+
+    write_dataset(data, args.output)
+    print(f"Wrote {len(data)} rows x {len(data.columns)} columns to {args.output}")
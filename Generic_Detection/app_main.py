@@ -44,15 +44,27 @@ app.include_router(generic_router)
 # Existing (from mcp_server.py — unchanged):
 #   POST /analyze            — Employee DQ pipeline
 #   GET  /health             — Health check
+#   GET  /metrics            — Per-stage timings (Prometheus format)
 #   POST /analyze/schema     — Schema validation
 #   POST /analyze/anomalies  — Anomaly detection
 #   POST /analyze/full       — Full analysis
 #   POST /analyze/score      — Row scoring
-#   POST /analyze/health     — Health classification
+#   POST /analyze/health     — Health classification (incremental=true: appended rows only)
 #   POST /monitor/run        — Resolution + monitoring
-#   POST /review/queue       — Human review queue
+#   POST /review/queue       — Human review queue (one page, most urgent first)
+#   GET  /review/queue       — Same, with query parameters
+#   GET  /review/reasons     — Rows awaiting review per reason
+#   GET  /review/clusters    — Rows awaiting review grouped by failure signature
+#   POST /review/clusters/decision — One decision for a whole cluster
 #   POST /review/decision    — Submit review decision
+#   POST /review/decisions   — Submit many review decisions at once
+#   GET  /audit/events       — Query the audit log
+#   POST /jobs               — Queue a background analysis job
+#   GET  /jobs/{id}          — Job status, progress and result
+#   GET  /jobs/{id}/events   — Job progress as server-sent events
+#   POST /jobs/{id}/cancel   — Cancel a job
 #
 # New (from generic_api.py):
 #   POST /upload/analyze     — Upload any CSV + get quality report
+#   POST /upload/submit      — Upload any CSV + analyze it as a job
 #   GET  /upload/files       — List previously uploaded files
@@ -11,23 +11,42 @@ Architecture Note:
 
 Endpoints:
   POST /upload/analyze   — Upload a CSV file, run generic analysis, return report
+  POST /upload/submit    — Upload a CSV file, analyze it as a background job
   GET  /upload/files     — List all previously uploaded files
 
 File Handling:
-  - Uploaded CSVs are saved to the 'uploads/' folder on disk
-  - Files are validated for: CSV extension, size limit (50MB), parseability
+  - Uploaded CSVs are streamed to the 'uploads/' folder on disk in
+    UPLOAD_CHUNK_BYTES pieces (the upload is never held in memory whole)
+  - Files are validated for: CSV extension, size limit, parseability
   - Each file is saved with a timestamp prefix to avoid name collisions
     (e.g., "20260312_154500_sales_data.csv")
+  - Uploads are identified by a SHA-256 hash of their bytes: an identical
+    re-upload reuses the file already on disk, and its report is served
+    from the result cache (see generic_cache.py) without re-running
+    the pipeline
+  - Files above STREAMING_THRESHOLD_BYTES are analyzed with the chunked
+    streaming pipeline (see generic_streaming.py)
 """
 
+import hashlib
 import os
-import shutil
+import uuid
 from datetime import datetime
 
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from starlette.concurrency import run_in_threadpool
 
 # Import our generic pipeline from Phase 1
-from Generic_Detection.generic_pipeline import run_generic_pipeline
+from Generic_Detection.generic_pipeline import (
+    run_generic_pipeline,
+    STREAMING_THRESHOLD_BYTES
+)
+
+# Import the content-hash result cache
+from Generic_Detection.generic_cache import ResultCache, cache_key
+
+# Background jobs for /upload/submit
+from job_queue import job_queue
 
 # =============================================================
 # CONFIGURATION
@@ -36,9 +55,14 @@ from Generic_Detection.generic_pipeline import run_generic_pipeline
 # Directory where uploaded files will be saved
 UPLOAD_DIR = "uploads"
 
-# Maximum file size in bytes (200MB)
-# 200 * 1024 * 1024 = 209,715,200 bytes
-MAX_FILE_SIZE_BYTES = 200 * 1024 * 1024
+# Maximum file size in bytes (10GB)
+# Large files are streamed to disk and analyzed in chunks, so this
+# limit is about disk space, not memory.
+# 10 * 1024 * 1024 * 1024 = 10,737,418,240 bytes
+MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024 * 1024
+
+# How much of the upload is read into memory at a time (8MB)
+UPLOAD_CHUNK_BYTES = 8 * 1024 * 1024
 
 # =============================================================
 # ROUTER SETUP
@@ -66,60 +90,60 @@ def ensure_upload_dir():
     os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 
+def get_result_cache() -> ResultCache:
+    """
+    Returns the report cache stored under uploads/.cache/.
+    """
+    ensure_upload_dir()
+    return ResultCache(UPLOAD_DIR)
+
+
 # =============================================================
 # HELPER: Generate a unique filename with timestamp
 # =============================================================
 
 def generate_safe_filename(original_name: str) -> str:
     """
-    Prepends a timestamp to the original filename to prevent
-    overwriting if the same file is uploaded twice.
+    Prepends a timestamp and a random tag to the original filename,
+    so two uploads never get the same name (not even two different
+    files with the same name uploaded in the same second).
 
     Example:
-      "sales_data.csv" → "20260312_154500_sales_data.csv"
+      "sales_data.csv" → "20260312_154500_123456_1a2b3c4d_sales_data.csv"
 
     Args:
         original_name: The original filename from the upload
 
     Returns:
-        A timestamped filename string
+        A unique, timestamped filename string
     """
-    # Format: YYYYMMDD_HHMMSS
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Format: YYYYMMDD_HHMMSS_microseconds, then 8 random hex digits
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    tag = uuid.uuid4().hex[:8]
 
     # Replace any spaces in the filename with underscores
     # (spaces in filenames can cause issues on some systems)
     clean_name = original_name.replace(" ", "_")
 
-    return f"{timestamp}_{clean_name}"
+    return f"{timestamp}_{tag}_{clean_name}"
 
 
 # =============================================================
-# ENDPOINT: Upload and Analyze a CSV File
+# HELPER: Save an upload to disk
 # =============================================================
 
-@router.post("/analyze")
-async def upload_and_analyze(file: UploadFile = File(...)):
+async def save_upload(file: UploadFile) -> dict:
     """
-    Upload a CSV file and receive a full quality analysis report.
-
-    This endpoint:
-    1. Validates the file (CSV format, under 50MB)
-    2. Saves it to the uploads/ directory
-    3. Runs the Generic_Detection pipeline on it
-    4. Returns the complete analysis report
+    Validates an uploaded CSV and streams it into uploads/, hashing
+    it on the way (identical content already on disk is reused).
 
-    Request:
-        - Multipart form upload with a single file field
-
-    Response:
-        - Full analysis report (health, anomalies, scores, etc.)
-        - The saved file path (for re-analysis or reference)
+    Returns:
+        A dict with original_name, saved_as, save_path, file_size,
+        content_hash, streaming and deduplicated
 
-    Errors:
-        - 400: File is not a CSV
-        - 413: File exceeds 50MB size limit
-        - 500: File could not be parsed or analyzed
+    Errors (HTTPException):
+        - 400: File is not a CSV, or is empty
+        - 413: File exceeds the size limit
     """
 
     # ---------------------------------------------------------
@@ -139,26 +163,49 @@ async def upload_and_analyze(file: UploadFile = File(...)):
         )
 
     # ---------------------------------------------------------
-    # VALIDATION 2: Check file size (must be under 50MB)
-    # We read the entire file content into memory to check size.
-    # For files under 50MB this is fine and avoids partial reads.
+    # SAVE THE FILE TO DISK (streamed) + VALIDATION 2: file size
+    # We copy the upload to uploads/ UPLOAD_CHUNK_BYTES at a time,
+    # so even multi-GB files never sit in memory. The file is
+    # written under a ".part" name and only renamed once it has
+    # passed the size checks. The ".part" file is created
+    # exclusively, so no other upload can ever write into it.
     # ---------------------------------------------------------
-    contents = await file.read()
-    file_size = len(contents)
-
-    if file_size > MAX_FILE_SIZE_BYTES:
-        # Convert to MB for a human-readable error message
-        size_mb = round(file_size / (1024 * 1024), 2)
+    ensure_upload_dir()
+    safe_name = generate_safe_filename(file.filename)
+    save_path = os.path.join(UPLOAD_DIR, safe_name)
+    partial_path = save_path + ".part"
+
+    file_size = 0
+    too_large = False
+
+    # The content hash is computed while writing, so the file
+    # never has to be read a second time
+    digest = hashlib.sha256()
+
+    fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    with os.fdopen(fd, "wb") as f:
+        while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+            file_size += len(chunk)
+            if file_size > MAX_FILE_SIZE_BYTES:
+                too_large = True
+                break
+            digest.update(chunk)
+            f.write(chunk)
+
+    if too_large:
+        os.remove(partial_path)
+        max_mb = round(MAX_FILE_SIZE_BYTES / (1024 * 1024), 2)
         raise HTTPException(
             status_code=413,
             detail={
                 "error": "File too large",
-                "message": f"File is {size_mb}MB. Maximum allowed is 200MB."
+                "message": f"File exceeds the maximum allowed size of {max_mb}MB."
             }
         )
 
     # Also reject empty files
     if file_size == 0:
+        os.remove(partial_path)
         raise HTTPException(
             status_code=400,
             detail={
@@ -168,26 +215,110 @@ async def upload_and_analyze(file: UploadFile = File(...)):
         )
 
     # ---------------------------------------------------------
-    # SAVE THE FILE TO DISK
-    # We save to uploads/ with a timestamp prefix so files
-    # don't overwrite each other.
+    # DEDUPLICATE: if these exact bytes were uploaded before,
+    # keep the existing copy and drop the new one
     # ---------------------------------------------------------
-    ensure_upload_dir()
-    safe_name = generate_safe_filename(file.filename)
-    save_path = os.path.join(UPLOAD_DIR, safe_name)
+    content_hash = digest.hexdigest()
+    result_cache = get_result_cache()
+
+    existing_name = result_cache.find_upload(content_hash)
+    if existing_name:
+        os.remove(partial_path)
+        safe_name = existing_name
+        save_path = os.path.join(UPLOAD_DIR, safe_name)
+    else:
+        os.replace(partial_path, save_path)
+        result_cache.remember_upload(content_hash, safe_name)
+
+    # Big files are analyzed chunk by chunk (bounded memory)
+    streaming = file_size > STREAMING_THRESHOLD_BYTES
+
+    return {
+        "original_name": file.filename,
+        "saved_as": safe_name,
+        "save_path": save_path,
+        "file_size": file_size,
+        "content_hash": content_hash,
+        "streaming": streaming,
+        "deduplicated": existing_name is not None
+    }
 
-    # Write the file contents to disk
-    with open(save_path, "wb") as f:
-        f.write(contents)
+
+def _file_info(upload: dict) -> dict:
+    """
+    The file_info block of the upload responses.
+    """
+    file_size = upload["file_size"]
+    return {
+        "original_name": upload["original_name"],
+        "saved_as": upload["saved_as"],
+        "saved_path": upload["save_path"],
+        "file_size_bytes": file_size,
+        "file_size_mb": round(file_size / (1024 * 1024), 2),
+        "analysis_mode": "streaming" if upload["streaming"] else "in_memory",
+        "content_hash": upload["content_hash"],
+        "deduplicated": upload["deduplicated"]
+    }
+
+
+# =============================================================
+# ENDPOINT: Upload and Analyze a CSV File
+# =============================================================
+
+@router.post("/analyze")
+async def upload_and_analyze(file: UploadFile = File(...)):
+    """
+    Upload a CSV file and receive a full quality analysis report.
+
+    This endpoint:
+    1. Validates the file (CSV format, under MAX_FILE_SIZE_BYTES)
+    2. Streams it to the uploads/ directory, hashing it on the way
+       (identical content already on disk is reused, not saved again)
+    3. Returns the cached report for this content if there is one,
+       otherwise runs the Generic_Detection pipeline on it (streaming
+       mode for files above STREAMING_THRESHOLD_BYTES) and caches it
+    4. Returns the complete analysis report
+
+    Request:
+        - Multipart form upload with a single file field
+
+    Response:
+        - Full analysis report (health, anomalies, scores, etc.)
+        - The saved file path (for re-analysis or reference)
+        - cache: "hit" if the report came from the result cache, else "miss"
+
+    Errors:
+        - 400: File is not a CSV
+        - 413: File exceeds the size limit
+        - 500: File could not be parsed or analyzed
+    """
+
+    upload = await save_upload(file)
+    result_cache = get_result_cache()
+    save_path = upload["save_path"]
+    streaming = upload["streaming"]
+
+    # ---------------------------------------------------------
+    # CACHE LOOKUP: same content + same pipeline settings
+    # means the same report, so skip the analysis entirely
+    # ---------------------------------------------------------
+    key = cache_key(upload["content_hash"], streaming)
+    report = result_cache.get_report(key)
+    cache_status = "miss" if report is None else "hit"
 
     # ---------------------------------------------------------
     # RUN THE GENERIC ANALYSIS PIPELINE
     # This calls Generic_Detection/generic_pipeline.py which
     # runs all checks: completeness, duplicates, types,
     # outliers, row scoring, and health classification.
+    # The pipeline is synchronous, so it runs in a worker thread;
+    # awaiting it keeps the event loop (and every other request)
+    # responsive. For long analyses use /upload/submit instead.
     # ---------------------------------------------------------
     try:
-        report = run_generic_pipeline(save_path)
+        if report is None:
+            report = await run_in_threadpool(run_generic_pipeline, save_path, streaming=streaming)
+            result_cache.put_report(key, report)
     except Exception as e:
         # If the pipeline fails (e.g., file isn't valid CSV data),
         # return a 500 error with details about what went wrong.
@@ -196,7 +327,7 @@ async def upload_and_analyze(file: UploadFile = File(...)):
             detail={
                 "error": "Analysis failed",
                 "message": f"Could not analyze the file: {str(e)}",
-                "file": safe_name
+                "file": upload["saved_as"]
             }
         )
 
@@ -207,17 +338,56 @@ async def upload_and_analyze(file: UploadFile = File(...)):
     # ---------------------------------------------------------
     return {
         "status": "success",
-        "file_info": {
-            "original_name": file.filename,
-            "saved_as": safe_name,
-            "saved_path": save_path,
-            "file_size_bytes": file_size,
-            "file_size_mb": round(file_size / (1024 * 1024), 2)
-        },
+        "file_info": _file_info(upload),
+        "cache": cache_status,
         "report": report
     }
 
 
+# =============================================================
+# ENDPOINT: Upload a CSV File and Analyze it in the Background
+# =============================================================
+
+@router.post("/submit")
+async def upload_and_submit(file: UploadFile = File(...)):
+    """
+    Upload a CSV file and queue its analysis as a background job.
+
+    Returns as soon as the file is saved:
+        - job_id: poll GET /jobs/{job_id} (or stream
+          GET /jobs/{job_id}/events) for progress and the report
+        - if the report for this content is already cached, it is
+          returned straight away instead (cache: "hit", no job)
+
+    Errors: same as /upload/analyze for the file checks.
+    """
+    upload = await save_upload(file)
+
+    report = get_result_cache().get_report(cache_key(upload["content_hash"], upload["streaming"]))
+    if report is not None:
+        return {
+            "status": "success",
+            "file_info": _file_info(upload),
+            "cache": "hit",
+            "report": report
+        }
+
+    job_id = job_queue.submit("generic_upload_analysis", {
+        "csv_path": upload["save_path"],
+        "upload_dir": UPLOAD_DIR,
+        "content_hash": upload["content_hash"],
+        "streaming": upload["streaming"]
+    })
+    return {
+        "status": "queued",
+        "file_info": _file_info(upload),
+        "cache": "miss",
+        "job_id": job_id,
+        "job_url": f"/jobs/{job_id}",
+        "events_url": f"/jobs/{job_id}/events"
+    }
+
+
 # =============================================================
 # ENDPOINT: List Previously Uploaded Files
 # =============================================================
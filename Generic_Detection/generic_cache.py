@@ -0,0 +1,252 @@
+"""
+Generic Analysis Result Cache
+===============================
+Remembers the report for every CSV that has already been analyzed, keyed
+by a hash of the file's CONTENT, so re-uploading the same data returns
+the stored report instantly instead of re-running the pipeline.
+
+Two things live under uploads/.cache/:
+
+  reports/<key>.json
+    One cached report per (content hash, pipeline fingerprint, mode).
+    The fingerprint is PIPELINE_VERSION plus every threshold that can
+    change the report, so tuning a threshold or bumping the version
+    simply misses the old entries. A report served from here has its
+    "timings" replaced by {"cached": true, "lookup_s": ...}, with the
+    timings of the run that produced it kept under "original_run". The total size of this folder is
+    kept under CACHE_MAX_BYTES by evicting the least recently used
+    reports (a file's mtime is refreshed on every hit).
+
+  content_index.json
+    content hash → the file in uploads/ holding those bytes (with its
+    size and mtime when it was saved), so an identical upload reuses
+    the existing copy instead of being saved again under a new name.
+    An entry whose file has since changed or disappeared is ignored.
+
+All writes go to a temporary file first and are then renamed into
+place, so a crash never leaves a half-written report behind.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+from .generic_pipeline import PIPELINE_VERSION, run_generic_pipeline
+from .generic_profile import MIN_IQR_VALUES
+from .generic_scoring import (
+    MISSING_PENALTY,
+    MISSING_PENALTY_CAP,
+    DUPLICATE_PENALTY,
+    OUTLIER_PENALTY,
+    OUTLIER_PENALTY_CAP
+)
+from .generic_streaming import (
+    CHUNK_ROWS,
+    EXACT_DISTINCT_LIMIT,
+    HLL_PRECISION,
+    QUANTILE_SAMPLE_SIZE
+)
+from .generic_types import TYPE_THRESHOLD, TYPE_SAMPLE_SIZE, TYPE_AMBIGUITY_MARGIN
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# Cache folder name inside the uploads directory
+CACHE_DIR_NAME = ".cache"
+
+# Upper bound for all cached reports together (256MB)
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_lock = threading.Lock()
+
+
+def pipeline_fingerprint(streaming: bool) -> dict:
+    """
+    Everything besides the file content that can change the report.
+    """
+    fingerprint = {
+        "pipeline_version": PIPELINE_VERSION,
+        "type_threshold": TYPE_THRESHOLD,
+        "type_sample_size": TYPE_SAMPLE_SIZE,
+        "type_ambiguity_margin": TYPE_AMBIGUITY_MARGIN,
+        "min_iqr_values": MIN_IQR_VALUES,
+        "penalties": [
+            MISSING_PENALTY, MISSING_PENALTY_CAP, DUPLICATE_PENALTY,
+            OUTLIER_PENALTY, OUTLIER_PENALTY_CAP
+        ],
+        "streaming": streaming,
+    }
+
+    # The streaming sketches only matter for streamed files
+    if streaming:
+        fingerprint["streaming_settings"] = [
+            CHUNK_ROWS, EXACT_DISTINCT_LIMIT, HLL_PRECISION, QUANTILE_SAMPLE_SIZE
+        ]
+
+    return fingerprint
+
+
+def cache_key(content_hash: str, streaming: bool) -> str:
+    """
+    Combines the SHA-256 of the file content with the pipeline fingerprint.
+    """
+    fingerprint = json.dumps(pipeline_fingerprint(streaming), sort_keys=True)
+    return hashlib.sha256(f"{content_hash}:{fingerprint}".encode()).hexdigest()
+
+
+def _write_json_atomic(path: str, data):
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(temp_path, path)
+
+
+class ResultCache:
+    """
+    Disk-backed report cache and content index for one uploads folder.
+    """
+
+    def __init__(self, upload_dir: str, max_bytes: int = CACHE_MAX_BYTES):
+        self.upload_dir = upload_dir
+        self.max_bytes = max_bytes
+        self.cache_dir = os.path.join(upload_dir, CACHE_DIR_NAME)
+        self.reports_dir = os.path.join(self.cache_dir, "reports")
+        self.index_path = os.path.join(self.cache_dir, "content_index.json")
+        os.makedirs(self.reports_dir, exist_ok=True)
+
+    # ---------------------------------------------------------
+    # Reports
+    # ---------------------------------------------------------
+
+    def _report_path(self, key: str) -> str:
+        return os.path.join(self.reports_dir, f"{key}.json")
+
+    def get_report(self, key: str) -> dict | None:
+        """
+        Returns the cached report for `key`, or None on a miss.
+        """
+        started = time.perf_counter()
+        path = self._report_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                report = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        # Mark as recently used for LRU eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+        # The stored timings describe the run that filled the cache,
+        # not this request
+        report["timings"] = {
+            "cached": True,
+            "lookup_s": round(time.perf_counter() - started, 4),
+            "original_run": report.get("timings"),
+        }
+        return report
+
+    def put_report(self, key: str, report: dict):
+        """
+        Stores a report, then evicts old reports if over the size budget.
+        """
+        with _lock:
+            _write_json_atomic(self._report_path(key), report)
+            self._evict()
+
+    def _evict(self):
+        entries = []
+        total = 0
+        for name in os.listdir(self.reports_dir):
+            if not name.endswith(".json"):
+                continue
+            stat = os.stat(os.path.join(self.reports_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+            total += stat.st_size
+
+        # Oldest access first
+        entries.sort()
+        for _, size, name in entries:
+            if total <= self.max_bytes:
+                break
+            os.remove(os.path.join(self.reports_dir, name))
+            total -= size
+
+    def clear(self):
+        """
+        Removes every cached report (uploaded files are kept).
+        """
+        with _lock:
+            for name in os.listdir(self.reports_dir):
+                os.remove(os.path.join(self.reports_dir, name))
+
+    # ---------------------------------------------------------
+    # Content index (upload deduplication)
+    # ---------------------------------------------------------
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def find_upload(self, content_hash: str) -> str | None:
+        """
+        Filename in the uploads folder that still holds these bytes,
+        or None if there is none (deleted, or modified since it was
+        saved). Entries from older versions (a bare filename, nothing
+        to check it against) are never trusted.
+        """
+        with _lock:
+            entry = self._load_index().get(content_hash)
+        if not isinstance(entry, dict):
+            return None
+
+        try:
+            stat = os.stat(os.path.join(self.upload_dir, entry["filename"]))
+        except FileNotFoundError:
+            return None
+        if [stat.st_size, stat.st_mtime_ns] != [entry["size"], entry["mtime_ns"]]:
+            return None
+        return entry["filename"]
+
+    def remember_upload(self, content_hash: str, filename: str):
+        """
+        Records which uploaded file holds the given content.
+        """
+        stat = os.stat(os.path.join(self.upload_dir, filename))
+        with _lock:
+            index = self._load_index()
+            index[content_hash] = {
+                "filename": filename,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+            }
+            _write_json_atomic(self.index_path, index)
+
+
+# =============================================================
+# CACHED ANALYSIS
+# =============================================================
+
+def analyze_with_cache(csv_path: str, upload_dir: str, content_hash: str,
+                       streaming: bool, progress=None) -> dict:
+    """
+    Returns the cached report for this content, or runs the pipeline
+    and caches its report. This is what an upload analysis job runs
+    (see job_queue.py), so its report is cached like a direct upload's.
+    """
+    cache = ResultCache(upload_dir)
+    key = cache_key(content_hash, streaming)
+
+    report = cache.get_report(key)
+    if report is None:
+        report = run_generic_pipeline(csv_path, streaming=streaming, progress=progress)
+        cache.put_report(key, report)
+    return report
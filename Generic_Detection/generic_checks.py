@@ -14,10 +14,16 @@ Design Notes:
 - Modeled after Quality_Detection/schema_checks.py and anomaly_checks.py
 - Returns structured dictionaries so results can be serialized to JSON via the API
 - All functions take a pandas DataFrame as input (already loaded)
+- All functions also accept an optional pre-computed profile from
+  generic_profile.profile_dataset(); the pipeline builds it once and
+  shares it so the data is only swept once for all checks.
+  When a profile is given, df is not read at all (the streaming pipeline
+  passes df=None with a profile merged from chunks).
 """
 
 import pandas as pd
-import numpy as np
+
+from .generic_profile import TYPE_THRESHOLD, profile_dataset
 
 
 # =============================================================
@@ -26,7 +32,7 @@ import numpy as np
 # Mirrors Quality_Detection.Quality_Detection.completeness_checks()
 # but works on ALL columns (not just employee-specific ones).
 
-def check_completeness(df: pd.DataFrame):
+def check_completeness(df: pd.DataFrame | None, profile: dict | None = None):
     """
     Calculates the percentage of missing (null/NaN) values for every column.
 
@@ -37,14 +43,17 @@ def check_completeness(df: pd.DataFrame):
         - missing_pct: percentage of rows missing (0.0 to 100.0)
         - severity: HIGH if >20%, MEDIUM if >5%, LOW otherwise
     """
+    if profile is None:
+        profile = profile_dataset(df)
+
     results = []
 
-    for col in df.columns:
+    for col, col_profile in profile["columns"].items():
         # Count how many values are null/NaN in this column
-        missing_count = int(df[col].isna().sum())
+        missing_count = col_profile["null_count"]
 
         # Calculate percentage of missing values
-        missing_pct = round((missing_count / len(df)) * 100, 2)
+        missing_pct = round((missing_count / profile["row_count"]) * 100, 2)
 
         # Assign severity based on how much data is missing
         # These thresholds match common data quality standards:
@@ -75,7 +84,7 @@ def check_completeness(df: pd.DataFrame):
 # but checks for FULL row duplicates (since we don't know which
 # column is the primary key in an arbitrary dataset).
 
-def check_duplicates(df: pd.DataFrame):
+def check_duplicates(df: pd.DataFrame | None, profile: dict | None = None):
     """
     Detects fully duplicated rows in the dataset.
 
@@ -86,12 +95,14 @@ def check_duplicates(df: pd.DataFrame):
         - duplicate_pct: percentage of duplicate rows
         - severity: CRITICAL if >10%, HIGH if >5%, MEDIUM if >0%, LOW if 0%
     """
-    # duplicated() marks rows that are exact copies of a previous row
-    # keep=False would mark ALL copies; default (keep='first') marks
-    # only the second, third, etc. occurrence — we use default here
-    # so each duplicate is counted once.
-    duplicate_count = int(df.duplicated().sum())
-    duplicate_pct = round((duplicate_count / len(df)) * 100, 2)
+    if profile is None:
+        profile = profile_dataset(df)
+
+    # duplicate_count follows duplicated()'s default (keep='first'):
+    # only the second, third, etc. occurrence is counted, so each
+    # duplicate is counted once.
+    duplicate_count = profile["duplicate_count"]
+    duplicate_pct = round((duplicate_count / profile["row_count"]) * 100, 2)
 
     # Assign severity based on % of duplicates
     if duplicate_pct > 10:
@@ -104,7 +115,7 @@ def check_duplicates(df: pd.DataFrame):
         severity = "LOW"
 
     return {
-        "total_rows": len(df),
+        "total_rows": profile["row_count"],
         "duplicate_count": duplicate_count,
         "duplicate_pct": duplicate_pct,
         "severity": severity
@@ -119,7 +130,7 @@ def check_duplicates(df: pd.DataFrame):
 # and flag any values that don't match. This catches things like
 # a numeric column that has some text entries mixed in.
 
-def check_type_consistency(df: pd.DataFrame):
+def check_type_consistency(df: pd.DataFrame | None, profile: dict | None = None):
     """
     For each column, determines the dominant data type and checks
     if all values are consistent with that type.
@@ -131,13 +142,16 @@ def check_type_consistency(df: pd.DataFrame):
         - inconsistent_count: how many non-null values don't match the dominant type
         - inconsistent_pct: percentage of inconsistent values
     """
+    if profile is None:
+        profile = profile_dataset(df)
+
     results = []
 
-    for col in df.columns:
-        # Drop nulls — we only check type consistency on actual values
-        non_null = df[col].dropna()
+    for col, col_profile in profile["columns"].items():
+        # We only check type consistency on actual (non-null) values
+        non_null_count = col_profile["non_null_count"]
 
-        if len(non_null) == 0:
+        if non_null_count == 0:
             # Entire column is empty — nothing to check
             results.append({
                 "column": col,
@@ -147,18 +161,14 @@ def check_type_consistency(df: pd.DataFrame):
             })
             continue
 
-        # Try to convert the column to numeric
-        # errors='coerce' turns non-numeric values into NaN
-        numeric_converted = pd.to_numeric(non_null, errors="coerce")
-        numeric_valid_count = numeric_converted.notna().sum()
-        numeric_pct = numeric_valid_count / len(non_null)
+        # How many values parse as numbers / dates (from the profiler).
+        # The datetime count is only computed when the column is not
+        # already numeric, since it is not needed otherwise.
+        numeric_valid_count = col_profile["numeric_valid_count"]
+        numeric_pct = numeric_valid_count / non_null_count
 
-        # Try to convert the column to datetime
-        # errors='coerce' turns non-date values into NaT
-        # Note: infer_datetime_format was removed — pandas 2.x infers format automatically
-        datetime_converted = pd.to_datetime(non_null, errors="coerce")
-        datetime_valid_count = datetime_converted.notna().sum()
-        datetime_pct = datetime_valid_count / len(non_null)
+        datetime_valid_count = col_profile["datetime_valid_count"] or 0
+        datetime_pct = datetime_valid_count / non_null_count
 
         # Decision logic for type inference:
         # If >80% of values are numeric → it's a numeric column
@@ -166,20 +176,20 @@ def check_type_consistency(df: pd.DataFrame):
         # Otherwise → it's a text column
         # The 80% threshold allows for some dirty data while still
         # identifying the "intended" type.
-        if numeric_pct >= 0.80:
+        if numeric_pct >= TYPE_THRESHOLD:
             inferred_type = "numeric"
             # Inconsistent values are the ones that AREN'T numeric
-            inconsistent_count = int(len(non_null) - numeric_valid_count)
-        elif datetime_pct >= 0.80:
+            inconsistent_count = int(non_null_count - numeric_valid_count)
+        elif datetime_pct >= TYPE_THRESHOLD:
             inferred_type = "datetime"
             # Inconsistent values are the ones that AREN'T dates
-            inconsistent_count = int(len(non_null) - datetime_valid_count)
+            inconsistent_count = int(non_null_count - datetime_valid_count)
         else:
             inferred_type = "text"
             # For text columns, all values are "consistent" by default
             inconsistent_count = 0
 
-        inconsistent_pct = round((inconsistent_count / len(non_null)) * 100, 2)
+        inconsistent_pct = round((inconsistent_count / non_null_count) * 100, 2)
 
         results.append({
             "column": col,
@@ -201,7 +211,7 @@ def check_type_consistency(df: pd.DataFrame):
 #   - IQR = Q3 - Q1
 #   - Outlier if value < Q1 - 1.5*IQR or value > Q3 + 1.5*IQR
 
-def check_outliers(df: pd.DataFrame):
+def check_outliers(df: pd.DataFrame | None, profile: dict | None = None):
     """
     Detects statistical outliers in all numeric columns using the IQR method.
 
@@ -214,33 +224,24 @@ def check_outliers(df: pd.DataFrame):
         - upper_bound: the upper fence (Q3 + 1.5*IQR)
         - severity: HIGH if >10%, MEDIUM if >5%, LOW otherwise
     """
-    results = []
+    if profile is None:
+        profile = profile_dataset(df)
 
-    # Select only numeric columns for outlier detection
-    # This automatically skips text, date, and categorical columns
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-
-    for col in numeric_cols:
-        # Drop nulls before computing statistics
-        values = df[col].dropna()
+    results = []
 
-        if len(values) < 4:
-            # Need at least 4 values for meaningful IQR calculation
+    # The profiler only computes IQR fences for numeric columns
+    # (text, date, and categorical columns are skipped) that have
+    # at least 4 non-null values (needed for a meaningful IQR)
+    for col, col_profile in profile["columns"].items():
+        if col_profile["outlier_bounds"] is None:
             continue
 
-        # Calculate IQR boundaries
-        q1 = values.quantile(0.25)
-        q3 = values.quantile(0.75)
-        iqr = q3 - q1
-
-        # Define outlier fences
-        lower_bound = q1 - 1.5 * iqr
-        upper_bound = q3 + 1.5 * iqr
+        # Outlier fences: Q1 - 1.5*IQR and Q3 + 1.5*IQR
+        lower_bound, upper_bound = col_profile["outlier_bounds"]
 
-        # Count values outside the fences
-        outliers = (values < lower_bound) | (values > upper_bound)
-        outlier_count = int(outliers.sum())
-        outlier_pct = round((outlier_count / len(values)) * 100, 2)
+        # Count of non-null values outside the fences
+        outlier_count = col_profile["outlier_count"]
+        outlier_pct = round((outlier_count / col_profile["non_null_count"]) * 100, 2)
 
         # Assign severity based on outlier percentage
         if outlier_pct > 10:
@@ -268,7 +269,7 @@ def check_outliers(df: pd.DataFrame):
 # This provides a quick overview of each column — useful for
 # the dashboard to show the user what their dataset contains.
 
-def generate_column_summary(df: pd.DataFrame):
+def generate_column_summary(df: pd.DataFrame | None, profile: dict | None = None):
     """
     Generates a summary of each column in the dataset.
 
@@ -280,29 +281,20 @@ def generate_column_summary(df: pd.DataFrame):
         - unique_count: how many unique values exist
         - sample_values: up to 3 example values from the column
     """
-    results = []
+    if profile is None:
+        profile = profile_dataset(df)
 
-    for col in df.columns:
-        # Get up to 3 unique non-null sample values for preview
-        samples = df[col].dropna().unique()[:3].tolist()
-
-        # Convert numpy types to native Python types for JSON serialization
-        # (numpy int64, float64, etc. can't be serialized to JSON directly)
-        safe_samples = []
-        for val in samples:
-            if isinstance(val, (np.integer,)):
-                safe_samples.append(int(val))
-            elif isinstance(val, (np.floating,)):
-                safe_samples.append(float(val))
-            else:
-                safe_samples.append(str(val))
+    results = []
 
+    for col, col_profile in profile["columns"].items():
+        # Sample values are up to 3 unique non-null values, already
+        # converted to native Python types for JSON serialization
         results.append({
             "column": col,
-            "dtype": str(df[col].dtype),
-            "non_null_count": int(df[col].notna().sum()),
-            "unique_count": int(df[col].nunique()),
-            "sample_values": safe_samples
+            "dtype": col_profile["dtype"],
+            "non_null_count": col_profile["non_null_count"],
+            "unique_count": col_profile["unique_count"],
+            "sample_values": col_profile["sample_values"]
         })
 
     return results
@@ -15,6 +15,37 @@ Health Levels:
 import pandas as pd
 
 
+def summarize_generic_health(avg_score: float, bad_row_pct: float, rows_analyzed: int,
+                             good_count: int, warning_count: int, bad_count: int):
+    """
+    Builds the health dict from already-aggregated row statistics.
+
+    classify_generic_health() uses this on a scored DataFrame; the
+    streaming pipeline uses it on running totals collected chunk by chunk.
+    """
+
+    # Classify overall health using the same logic as health.py:
+    #   GOOD: high average AND very few bad rows
+    #   DEGRADED: decent average AND moderate bad rows
+    #   FAIL: poor average OR too many bad rows
+    if avg_score >= 85 and bad_row_pct <= 5:
+        status = "GOOD"
+    elif avg_score >= 70 and bad_row_pct <= 20:
+        status = "DEGRADED"
+    else:
+        status = "FAIL"
+
+    return {
+        "dataset_health": status,
+        "average_row_score": round(avg_score, 2),
+        "bad_row_percentage": round(bad_row_pct, 2),
+        "rows_analyzed": rows_analyzed,
+        "good_count": good_count,
+        "warning_count": warning_count,
+        "bad_count": bad_count
+    }
+
+
 def classify_generic_health(df: pd.DataFrame):
     """
     Computes overall dataset health based on the row-level quality scores.
@@ -36,36 +67,24 @@ def classify_generic_health(df: pd.DataFrame):
         - bad_count: rows classified as BAD
     """
 
-    # Calculate the average quality score across all rows
-    avg_score = df["Row_Quality_Score"].mean()
+    # Calculate the average quality score across all rows.
+    # The integer sum divided by the row count is exact, and is what the
+    # streaming pipeline computes from its running totals, so both
+    # pipelines report the same rounded average.
+    rows = len(df)
+    avg_score = int(df["Row_Quality_Score"].sum()) / rows if rows else float("nan")
 
     # Calculate the percentage of "bad" rows (score < 70)
     # This threshold matches Quality_Detection/health.py
-    bad_row_pct = (df["Row_Quality_Score"] < 70).mean() * 100
-
-    # Classify overall health using the same logic as health.py:
-    #   GOOD: high average AND very few bad rows
-    #   DEGRADED: decent average AND moderate bad rows
-    #   FAIL: poor average OR too many bad rows
-    if avg_score >= 85 and bad_row_pct <= 5:
-        status = "GOOD"
-    elif avg_score >= 70 and bad_row_pct <= 20:
-        status = "DEGRADED"
-    else:
-        status = "FAIL"
+    bad_row_pct = int((df["Row_Quality_Score"] < 70).sum()) / rows * 100 if rows else float("nan")
 
     # Count rows in each usability category
-    # (these come from generic_scoring.py's classify() function)
+    # (these come from generic_scoring.py's classify_row_scores())
     good_count = int((df["Row_Usability_Status"] == "GOOD").sum())
     warning_count = int((df["Row_Usability_Status"] == "WARNING").sum())
     bad_count = int((df["Row_Usability_Status"] == "BAD").sum())
 
-    return {
-        "dataset_health": status,
-        "average_row_score": round(avg_score, 2),
-        "bad_row_percentage": round(bad_row_pct, 2),
-        "rows_analyzed": len(df),
-        "good_count": good_count,
-        "warning_count": warning_count,
-        "bad_count": bad_count
-    }
+    return summarize_generic_health(
+        avg_score, bad_row_pct, rows,
+        good_count, warning_count, bad_count
+    )
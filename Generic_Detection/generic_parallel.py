@@ -0,0 +1,196 @@
+"""
+Parallel Column Profiling
+==========================
+Spreads the per-column work of generic_profile.profile_dataset() across a
+process pool, so a wide file (hundreds of columns) uses more than one core.
+
+How it works:
+  1. Columns are split into shards (round-robin, so cheap numeric columns
+     and expensive text columns are mixed evenly across workers).
+  2. Plain NumPy columns (int / float / bool) are copied ONCE into a single
+     shared-memory block; workers attach to it by name and read their
+     columns in place, so those columns are never pickled per task.
+     Other columns (text, nullable dtypes) are pickled with their shard.
+  3. Each worker profiles its columns with the same accumulate_column()
+     used by the serial profiler and returns the column profiles plus
+     its share of the per-row missing/outlier counters.
+  4. The parent merges the shards back into column order, sums the
+     per-row counters and runs duplicate detection on the full frame.
+
+The result is exactly the dict profile_dataset() would return, so every
+check and the scorer work unchanged.
+
+Small inputs (fewer than PARALLEL_MIN_CELLS cells or PARALLEL_MIN_COLUMNS
+columns) fall back to the serial profiler: starting a pool costs more
+than it saves there.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .generic_profile import accumulate_column, find_duplicate_rows, profile_dataset
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# Below these sizes the serial profiler is used
+PARALLEL_MIN_CELLS = 2_000_000
+PARALLEL_MIN_COLUMNS = 8
+
+# Shards per worker (more shards = better load balancing)
+SHARDS_PER_WORKER = 2
+
+
+def default_workers() -> int:
+    """
+    Worker count used when none is given: all available cores.
+    """
+    return os.cpu_count() or 1
+
+
+# =============================================================
+# WORKER SIDE
+# =============================================================
+
+def _profile_shard(shm_name: str | None, row_count: int, columns: list) -> tuple[list, np.ndarray, np.ndarray]:
+    """
+    Profiles one shard of columns inside a worker process.
+
+    Args:
+        shm_name: name of the shared-memory block holding numeric columns
+        row_count: number of rows in the DataFrame
+        columns: list of (position, name, is_numeric, payload) where payload
+            is ("shared", dtype_str, offset) or ("pickled", Series)
+
+    Returns:
+        - list of (position, column profile)
+        - this shard's per-row missing counts
+        - this shard's per-row outlier counts
+    """
+    row_missing_counts = np.zeros(row_count, dtype=np.int32)
+    row_outlier_counts = np.zeros(row_count, dtype=np.int32)
+    results = []
+
+    shm = shared_memory.SharedMemory(name=shm_name) if shm_name else None
+    try:
+        for position, name, is_numeric, payload in columns:
+            if payload[0] == "shared":
+                _, dtype, offset = payload
+                values = np.ndarray(row_count, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+                series = pd.Series(values, name=name, copy=False)
+            else:
+                series = payload[1]
+
+            column_profile = accumulate_column(series, is_numeric, row_missing_counts, row_outlier_counts)
+            results.append((position, column_profile))
+
+            # Drop views into the shared block before it is closed
+            del series
+            values = None
+    finally:
+        if shm is not None:
+            shm.close()
+
+    return results, row_missing_counts, row_outlier_counts
+
+
+# =============================================================
+# PARENT SIDE
+# =============================================================
+
+def _is_shareable(series: pd.Series) -> bool:
+    """
+    True for plain NumPy int/float/bool columns (no pandas masks or objects).
+    """
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "iufb"
+
+
+def profile_dataset_parallel(df: pd.DataFrame, workers: int | None = None) -> dict:
+    """
+    Same result as profile_dataset(df), computed on a process pool.
+
+    Args:
+        df: the DataFrame to profile
+        workers: number of worker processes (None = all cores).
+            1 or a small input runs the serial profiler instead.
+    """
+    workers = workers or default_workers()
+    row_count = len(df)
+
+    if (
+        workers <= 1
+        or len(df.columns) < PARALLEL_MIN_COLUMNS
+        or row_count * len(df.columns) < PARALLEL_MIN_CELLS
+    ):
+        return profile_dataset(df)
+
+    numeric_cols = set(df.select_dtypes(include=[np.number]).columns)
+
+    # ---------------------------------------------------------
+    # Copy all plain numeric columns into ONE shared block
+    # ---------------------------------------------------------
+    layout = {}
+    total_bytes = 0
+    for position, col in enumerate(df.columns):
+        series = df.iloc[:, position]
+        if _is_shareable(series):
+            layout[position] = (series.dtype.str, total_bytes)
+            total_bytes += series.dtype.itemsize * row_count
+
+    shm = shared_memory.SharedMemory(create=True, size=total_bytes) if total_bytes else None
+    try:
+        for position, (dtype, offset) in layout.items():
+            target = np.ndarray(row_count, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+            target[:] = df.iloc[:, position].to_numpy()
+            del target
+
+        # ---------------------------------------------------------
+        # Build shards (round-robin over columns)
+        # ---------------------------------------------------------
+        shard_count = min(len(df.columns), workers * SHARDS_PER_WORKER)
+        shards = [[] for _ in range(shard_count)]
+        for position, col in enumerate(df.columns):
+            if position in layout:
+                payload = ("shared",) + layout[position]
+            else:
+                payload = ("pickled", df.iloc[:, position])
+            shards[position % shard_count].append((position, col, col in numeric_cols, payload))
+
+        # ---------------------------------------------------------
+        # Run shards and merge in column order
+        # ---------------------------------------------------------
+        column_profiles = {}
+        row_missing_counts = np.zeros(row_count, dtype=np.int32)
+        row_outlier_counts = np.zeros(row_count, dtype=np.int32)
+
+        shm_name = shm.name if shm is not None else None
+        with ProcessPoolExecutor(max_workers=min(workers, shard_count)) as pool:
+            futures = [
+                pool.submit(_profile_shard, shm_name, row_count, shard)
+                for shard in shards
+            ]
+            for future in futures:
+                results, shard_missing, shard_outliers = future.result()
+                row_missing_counts += shard_missing
+                row_outlier_counts += shard_outliers
+                column_profiles.update(results)
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    duplicate_mask, duplicate_count = find_duplicate_rows(df)
+
+    return {
+        "row_count": row_count,
+        "columns": {col: column_profiles[position] for position, col in enumerate(df.columns)},
+        "row_missing_counts": row_missing_counts,
+        "row_outlier_counts": row_outlier_counts,
+        "duplicate_mask": duplicate_mask,
+        "duplicate_count": duplicate_count,
+    }
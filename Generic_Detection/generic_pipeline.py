@@ -9,6 +9,8 @@ and returns a unified report dictionary.
 
 Pipeline Steps:
   1. Load the CSV file
+     (then profile every column once — see generic_profile.py —
+     and share that profile with steps 2–7)
   2. Generate column summary (metadata about each column)
   3. Run completeness checks (missing values)
   4. Run duplicate detection (full row duplicates)
@@ -19,10 +21,22 @@ Pipeline Steps:
 
 The returned report dictionary is designed to be JSON-serializable
 so it can be returned directly by the FastAPI endpoint.
+
+Files larger than STREAMING_THRESHOLD_BYTES are analyzed with the
+chunked streaming pipeline (generic_streaming.py) instead, so memory
+stays bounded no matter how big the file is.
+
+With workers > 1 the column profile is built on a process pool
+(generic_parallel.py), which helps most on wide files.
 """
 
+import os
+
 import pandas as pd
 
+from dtype_planner import load_planned_csv
+from tracing import Trace
+
 # Import all check functions from our generic checks module
 from .generic_checks import (
     check_completeness,
@@ -32,12 +46,35 @@ from .generic_checks import (
     generate_column_summary
 )
 
+# Import the fused single-pass column profiler
+from .generic_profile import profile_dataset
+
+# Import the process-pool version of the profiler
+from .generic_parallel import profile_dataset_parallel
+
 # Import the row-level scoring function
 from .generic_scoring import calculate_generic_row_scores
 
 # Import the health classification function
 from .generic_health import classify_generic_health
 
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# Bump whenever a change alters the report for the same input or the
+# report's shape (e.g. a new top-level key), so cached reports
+# (generic_cache.py) from older versions are ignored
+PIPELINE_VERSION = "2.1"
+
+# Files above this size are analyzed in streaming (chunked) mode
+# 500 * 1024 * 1024 = 524,288,000 bytes
+STREAMING_THRESHOLD_BYTES = 500 * 1024 * 1024
+
+# Worker processes used to profile columns in the in-memory pipeline
+# 1 = profile serially in this process (the default)
+PROFILE_WORKERS = int(os.environ.get("GENERIC_PROFILE_WORKERS", "1"))
+
 
 def load_generic_data(csv_path: str) -> pd.DataFrame:
     """
@@ -47,17 +84,34 @@ def load_generic_data(csv_path: str) -> pd.DataFrame:
     Quality_Detection.Quality_Detection.load_data(), but without
     any employee-specific column transformations.
 
+    The first load also writes a columnar sidecar next to the CSV
+    (see columnar_sidecar.py); later loads read that instead.
+
+    Dtypes are planned from a sample of the file (see dtype_planner.py):
+    low-cardinality text becomes categorical and integers are downcast,
+    which keeps the values (and so every check result) the same while
+    using a fraction of the memory. df.attrs["memory"] reports the
+    memory with and without planning.
+
     Args:
         csv_path: Path to the CSV file on disk
 
     Returns:
         A pandas DataFrame containing the CSV data
     """
-    df = pd.read_csv(csv_path)
+    df = load_planned_csv(csv_path)
     return df
 
 
-def run_generic_pipeline(csv_path: str) -> dict:
+def should_stream(csv_path: str) -> bool:
+    """
+    True when the file is big enough to need the streaming pipeline.
+    """
+    return os.path.getsize(csv_path) > STREAMING_THRESHOLD_BYTES
+
+
+def run_generic_pipeline(csv_path: str, streaming: bool | None = None,
+                         workers: int = PROFILE_WORKERS, progress=None) -> dict:
     """
     Runs the full generic quality analysis pipeline on a CSV file.
 
@@ -66,6 +120,13 @@ def run_generic_pipeline(csv_path: str) -> dict:
 
     Args:
         csv_path: Path to the CSV file to analyze
+        streaming: True to force the chunked streaming pipeline, False to
+            force the in-memory one, None (default) to pick automatically
+            based on STREAMING_THRESHOLD_BYTES
+        workers: processes used to profile the columns (in-memory mode
+            only); 1 profiles serially
+        progress: optional callback, called as progress(fraction, step)
+            between steps (used by background jobs, see job_queue.py)
 
     Returns:
         A dict containing the full analysis report with:
@@ -81,53 +142,122 @@ def run_generic_pipeline(csv_path: str) -> dict:
         - row_scores_preview: first 20 rows with their scores
     """
 
+    if streaming is None:
+        streaming = should_stream(csv_path)
+
+    if streaming:
+        # Imported here because generic_streaming imports this module
+        from .generic_streaming import run_generic_pipeline_streaming
+        return run_generic_pipeline_streaming(csv_path, progress=progress)
+
+    report_progress = progress or (lambda fraction, step: None)
+
+    # Wall/CPU time, rows and peak memory per step (see tracing.py)
+    trace = Trace("generic_pipeline")
+
     # ---------------------------------------------------------
     # STEP 1: Load the dataset
     # ---------------------------------------------------------
-    df = load_generic_data(csv_path)
+    report_progress(0.0, "loading")
+    with trace.stage("load") as span:
+        df = load_generic_data(csv_path)
+        span.rows = len(df)
+
+    # ---------------------------------------------------------
+    # Profile every column in ONE sweep (null/unique counts,
+    # samples, parse rates, quartiles, duplicate hash). Every
+    # check below and the row scorer read from this profile
+    # instead of each re-scanning the whole DataFrame.
+    # ---------------------------------------------------------
+    report_progress(0.3, "profiling")
+    with trace.stage("profile", rows=len(df)):
+        if workers > 1:
+            profile = profile_dataset_parallel(df, workers)
+        else:
+            profile = profile_dataset(df)
 
     # ---------------------------------------------------------
     # STEP 2: Generate column summary
     # This gives the dashboard metadata about each column
     # (data types, unique counts, sample values)
     # ---------------------------------------------------------
-    column_summary = generate_column_summary(df)
+    report_progress(0.6, "checks")
+    with trace.stage("summary", rows=len(df)):
+        column_summary = generate_column_summary(df, profile)
 
     # ---------------------------------------------------------
     # STEP 3: Run completeness checks
     # Finds missing values in every column
     # ---------------------------------------------------------
-    completeness = check_completeness(df)
+    with trace.stage("completeness", rows=len(df)):
+        completeness = check_completeness(df, profile)
 
     # ---------------------------------------------------------
     # STEP 4: Run duplicate detection
     # Counts exact duplicate rows
     # ---------------------------------------------------------
-    duplicates = check_duplicates(df)
+    with trace.stage("duplicates", rows=len(df)):
+        duplicates = check_duplicates(df, profile)
 
     # ---------------------------------------------------------
     # STEP 5: Run type consistency checks
     # Detects mixed data types within columns
     # ---------------------------------------------------------
-    type_consistency = check_type_consistency(df)
+    with trace.stage("type_consistency", rows=len(df)):
+        type_consistency = check_type_consistency(df, profile)
 
     # ---------------------------------------------------------
     # STEP 6: Run outlier detection
     # Finds IQR-based outliers in numeric columns
     # ---------------------------------------------------------
-    outliers = check_outliers(df)
+    with trace.stage("outliers", rows=len(df)):
+        outliers = check_outliers(df, profile)
 
     # ---------------------------------------------------------
     # STEP 7: Calculate row-level quality scores
     # Adds Row_Quality_Score and Row_Usability_Status columns
     # ---------------------------------------------------------
-    df = calculate_generic_row_scores(df)
+    report_progress(0.8, "scoring")
+    with trace.stage("scoring", rows=len(df)):
+        df = calculate_generic_row_scores(df, profile)
 
     # ---------------------------------------------------------
     # STEP 8: Classify overall dataset health
     # GOOD / DEGRADED / FAIL based on score distribution
     # ---------------------------------------------------------
-    health = classify_generic_health(df)
+    with trace.stage("health", rows=len(df)):
+        health = classify_generic_health(df)
+
+    report = build_generic_report(
+        dataset_info={
+            "total_rows": len(df),
+            "total_columns": len(df.columns),
+            "column_names": df.columns.tolist()
+        },
+        column_summary=column_summary,
+        completeness=completeness,
+        duplicates=duplicates,
+        type_consistency=type_consistency,
+        outliers=outliers,
+        health=health,
+        row_scores_preview=df[
+            ["Row_Quality_Score", "Row_Usability_Status"]
+        ].head(20).to_dict(orient="records")
+    )
+    report["memory"] = df.attrs.get("memory")
+    report["timings"] = trace.finish()
+    return report
+
+
+def build_generic_report(dataset_info: dict, column_summary: list, completeness: list,
+                         duplicates: dict, type_consistency: list, outliers: list,
+                         health: dict, row_scores_preview: list) -> dict:
+    """
+    Assembles the final report from the individual check results.
+
+    Shared by the in-memory pipeline and the streaming pipeline
+    (generic_streaming.py) so both return exactly the same shape.
+    """
 
     # ---------------------------------------------------------
     # DETERMINE OVERALL STATUS
@@ -194,11 +324,7 @@ def run_generic_pipeline(csv_path: str) -> dict:
     return {
         "tool": "generic_analysis",
         "status": overall_status,
-        "dataset_info": {
-            "total_rows": len(df),
-            "total_columns": len(df.columns),
-            "column_names": df.columns.tolist()
-        },
+        "dataset_info": dataset_info,
         "column_summary": column_summary,
         "completeness": completeness,
         "duplicates": duplicates,
@@ -206,7 +332,5 @@ def run_generic_pipeline(csv_path: str) -> dict:
         "outliers": outliers,
         "health": health,
         "anomalies": anomalies,
-        "row_scores_preview": df[
-            ["Row_Quality_Score", "Row_Usability_Status"]
-        ].head(20).to_dict(orient="records")
+        "row_scores_preview": row_scores_preview
     }
@@ -0,0 +1,193 @@
+"""
+Fused Column Profiler
+======================
+Computes, in ONE sweep over the columns, every per-column statistic that
+the generic checks and the row scorer need:
+
+  - null / non-null counts
+  - unique count and up to 3 sample values
+  - numeric and datetime parse rates (for type consistency)
+  - IQR quartiles, fences and outlier counts (numeric columns)
+  - per-row missing-value and outlier counters (for row scoring)
+  - the duplicate-row mask (via a single row hash)
+
+Before this module existed, generate_column_summary, check_completeness,
+check_duplicates, check_type_consistency, check_outliers and
+calculate_generic_row_scores each made their own full pass over the data
+and the scorer recomputed the same quantiles and duplicate mask.
+Now the pipeline builds one profile and hands it to all of them.
+
+The profile is a plain dict so it can be inspected or logged easily.
+"""
+
+import numpy as np
+import pandas as pd
+
+from dtype_planner import logical_dtype
+
+# TYPE_THRESHOLD is re-exported here for the checks and streaming modules
+from .generic_types import TYPE_THRESHOLD, infer_column_types
+
+# IQR needs at least this many values to be meaningful
+MIN_IQR_VALUES = 4
+
+
+def find_duplicate_rows(df: pd.DataFrame) -> tuple[np.ndarray, int]:
+    """
+    Finds fully duplicated rows using one 64-bit hash per row.
+
+    Rows with a unique hash cannot be duplicates, so the exact
+    DataFrame.duplicated() comparison only runs on the (usually tiny)
+    set of rows whose hash collides with another row.
+
+    Returns:
+        - mask of every row that has a duplicate (keep=False semantics)
+        - number of duplicate rows, counting each copy after the first
+          (keep='first' semantics)
+    """
+    if len(df) == 0 or len(df.columns) == 0:
+        return np.zeros(len(df), dtype=bool), 0
+
+    row_hash = pd.util.hash_pandas_object(df, index=False)
+    candidates = row_hash.duplicated(keep=False).to_numpy()
+
+    duplicate_mask = np.zeros(len(df), dtype=bool)
+    duplicate_count = 0
+
+    if candidates.any():
+        subset = df.iloc[np.flatnonzero(candidates)]
+        duplicate_mask[candidates] = subset.duplicated(keep=False).to_numpy()
+        duplicate_count = int(subset.duplicated().sum())
+
+    return duplicate_mask, duplicate_count
+
+
+def json_safe_samples(values) -> list:
+    """
+    Converts numpy scalars to native Python types for JSON serialization.
+    """
+    safe_samples = []
+    for val in values:
+        if isinstance(val, (np.integer,)):
+            safe_samples.append(int(val))
+        elif isinstance(val, (np.floating,)):
+            safe_samples.append(float(val))
+        else:
+            safe_samples.append(str(val))
+    return safe_samples
+
+
+def profile_column(series: pd.Series, not_null: np.ndarray, is_numeric: bool) -> dict:
+    """
+    Profiles a single column. See profile_dataset() for the fields.
+
+    Args:
+        series: the column
+        not_null: boolean array, True where the column has a value
+        is_numeric: whether the column takes part in IQR outlier detection
+    """
+    non_null = series[not_null]
+    non_null_count = len(non_null)
+
+    uniques = non_null.unique()
+
+    profile = {
+        # The dtype pd.read_csv() would give, even for planned dtypes
+        "dtype": logical_dtype(series),
+        "null_count": int(len(series) - non_null_count),
+        "non_null_count": int(non_null_count),
+        "unique_count": int(len(uniques)),
+        "sample_values": json_safe_samples(uniques[:3].tolist()),
+        "numeric_valid_count": 0,
+        "datetime_valid_count": None,
+        "type_sampled": False,
+        "quartiles": None,
+        "outlier_bounds": None,
+        "outlier_count": None,
+    }
+
+    if non_null_count == 0:
+        return profile
+
+    # Numeric / datetime parse counts (see generic_types.py)
+    profile.update(infer_column_types(series, non_null))
+
+    # Quartiles and IQR fences for numeric columns
+    if is_numeric and non_null_count >= MIN_IQR_VALUES:
+        q1, q3 = non_null.quantile([0.25, 0.75]).tolist()
+        iqr = q3 - q1
+        profile["quartiles"] = (q1, q3)
+        profile["outlier_bounds"] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+
+    return profile
+
+
+def accumulate_column(series: pd.Series, is_numeric: bool,
+                      row_missing_counts: np.ndarray, row_outlier_counts: np.ndarray) -> dict:
+    """
+    Profiles one column and adds its missing/outlier flags to the
+    per-row counters (in place).
+
+    Returns:
+        The column profile (see profile_dataset())
+    """
+    not_null = series.notna().to_numpy()
+    row_missing_counts += ~not_null
+
+    column_profile = profile_column(series, not_null, is_numeric)
+
+    # Outliers are counted straight into the per-row counter so no
+    # per-column mask has to be kept around
+    if column_profile["outlier_bounds"] is not None:
+        lower, upper = column_profile["outlier_bounds"]
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        outlier_mask = (values < lower) | (values > upper)
+        row_outlier_counts += outlier_mask
+        column_profile["outlier_count"] = int(outlier_mask.sum())
+
+    return column_profile
+
+
+def profile_dataset(df: pd.DataFrame) -> dict:
+    """
+    Builds the shared profile for a DataFrame, touching each column once.
+
+    Returns:
+        A dict with:
+        - row_count: number of rows
+        - columns: {column name: per-column profile}, in column order, where
+          each profile holds dtype, null_count, non_null_count, unique_count,
+          sample_values, numeric_valid_count, datetime_valid_count (None if
+          not needed), type_sampled, and quartiles / outlier_bounds / outlier_count (None
+          for non-numeric columns or columns with fewer than 4 values)
+        - row_missing_counts: per-row count of missing values
+        - row_outlier_counts: per-row count of outlier values
+        - duplicate_mask: per-row flag, True if the row has an exact copy
+        - duplicate_count: duplicate rows beyond the first occurrence
+    """
+    row_count = len(df)
+
+    # Same definition of "numeric" as check_outliers has always used
+    numeric_cols = set(df.select_dtypes(include=[np.number]).columns)
+
+    # int32 is plenty for per-row counters and halves the memory of int64
+    row_missing_counts = np.zeros(row_count, dtype=np.int32)
+    row_outlier_counts = np.zeros(row_count, dtype=np.int32)
+
+    columns = {}
+    for col in df.columns:
+        columns[col] = accumulate_column(
+            df[col], col in numeric_cols,
+            row_missing_counts, row_outlier_counts
+        )
+
+    duplicate_mask, duplicate_count = find_duplicate_rows(df)
+
+    return {
+        "row_count": row_count,
+        "columns": columns,
+        "row_missing_counts": row_missing_counts,
+        "row_outlier_counts": row_outlier_counts,
+        "duplicate_mask": duplicate_mask,
+        "duplicate_count": duplicate_count,
+    }
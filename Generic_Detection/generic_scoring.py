@@ -18,21 +18,92 @@ After scoring, each row is classified:
   - BAD:     score <  70  (row has significant quality problems)
 
 These thresholds match Quality_Detection/row_scoring.py for consistency.
+
+All penalties are computed column-at-a-time with NumPy, so scoring cost
+grows with (rows x columns) array work rather than a Python-level loop
+over every row.
 """
 
 import pandas as pd
 import numpy as np
 
+from .generic_profile import profile_dataset
+
+
+# Penalty sizes and caps (see module docstring)
+MISSING_PENALTY = 5
+MISSING_PENALTY_CAP = 50
+DUPLICATE_PENALTY = 30
+OUTLIER_PENALTY = 10
+OUTLIER_PENALTY_CAP = 30
+
+
+def classify_row_scores(scores) -> np.ndarray:
+    """
+    Maps an array of row scores to GOOD / WARNING / BAD labels
+    in one vectorized pass (no per-row apply()).
+    """
+    scores = np.asarray(scores)
+    return np.select(
+        [scores >= 85, scores >= 70],
+        ["GOOD", "WARNING"],
+        default="BAD"
+    )
+
+
+def score_rows(missing_counts, duplicate_mask, outlier_counts) -> np.ndarray:
+    """
+    Turns per-row issue counters into 0–100 scores.
+
+    Args:
+        missing_counts: number of missing values in each row
+        duplicate_mask: True for rows that have an exact copy (keep=False)
+        outlier_counts: number of IQR outlier values in each row
+
+    Returns:
+        An int64 array of scores, one per row
+    """
+    missing_counts = np.asarray(missing_counts, dtype=np.int64)
+    outlier_counts = np.asarray(outlier_counts, dtype=np.int64)
+
+    # Every row starts with a perfect score
+    scores = np.full(len(missing_counts), 100, dtype=np.int64)
+
+    # PENALTY 1: Missing values
+    # Deduct 5 points for each column that has a missing value,
+    # capped at 50 points so a row with many columns doesn't
+    # immediately drop to 0.
+    scores -= np.minimum(missing_counts * MISSING_PENALTY, MISSING_PENALTY_CAP)
+
+    # PENALTY 2: Duplicate row
+    # If this row is an exact copy of another row, deduct 30 points.
+    # This matches the employee scorer's duplicate penalty.
+    scores -= np.where(np.asarray(duplicate_mask, dtype=bool), DUPLICATE_PENALTY, 0)
+
+    # PENALTY 3: Outlier values in numeric columns
+    # Deduct 10 points per column whose value falls outside the IQR
+    # bounds, capped at 30 points total. NaN never compares as an
+    # outlier, so nulls are skipped automatically.
+    scores -= np.minimum(outlier_counts * OUTLIER_PENALTY, OUTLIER_PENALTY_CAP)
+
+    # Ensure score never goes below 0
+    return np.maximum(scores, 0)
 
-def calculate_generic_row_scores(df: pd.DataFrame):
+
+def calculate_generic_row_scores(df: pd.DataFrame, profile: dict | None = None):
     """
     Adds 'Row_Quality_Score' and 'Row_Usability_Status' columns to the DataFrame.
 
-    This function iterates through every row and applies penalty-based scoring.
     Each row starts at 100 and loses points for each quality issue found.
+    Every penalty is computed for ALL rows at once as a NumPy array
+    (column-at-a-time), instead of walking the rows with iterrows().
 
     Args:
         df: The input DataFrame (any dataset)
+        profile: Optional output of generic_profile.profile_dataset(df).
+            It already holds the per-row missing/outlier counters and the
+            duplicate mask, so the pipeline passes the one it built for
+            the checks instead of recomputing IQR bounds and duplicates.
 
     Returns:
         The same DataFrame with two new columns added:
@@ -41,70 +112,19 @@ def calculate_generic_row_scores(df: pd.DataFrame):
     """
 
     # -------------------------------------------------------
-    # PRE-COMPUTATION: Figure out which columns are numeric
-    # and pre-calculate outlier bounds for each.
-    # We do this BEFORE the row loop so we don't recalculate
-    # IQR statistics on every single row (performance).
-    # -------------------------------------------------------
-    numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-
-    # Store IQR bounds for each numeric column
-    # Key: column name, Value: (lower_bound, upper_bound)
-    outlier_bounds = {}
-    for col in numeric_cols:
-        values = df[col].dropna()
-        if len(values) >= 4:
-            q1 = values.quantile(0.25)
-            q3 = values.quantile(0.75)
-            iqr = q3 - q1
-            outlier_bounds[col] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
-
-    # -------------------------------------------------------
-    # PRE-COMPUTATION: Identify which rows are exact duplicates.
-    # keep=False marks ALL copies (including the first occurrence)
-    # so every duplicate row gets penalized, not just the second one.
+    # PRE-COMPUTATION: per-row missing counts, per-row outlier
+    # counts (IQR fences on numeric columns) and the duplicate
+    # mask (keep=False, so every copy of a duplicate is
+    # penalized, not just the second one).
     # -------------------------------------------------------
-    duplicate_mask = df.duplicated(keep=False)
+    if profile is None:
+        profile = profile_dataset(df)
 
-    # -------------------------------------------------------
-    # ROW-BY-ROW SCORING
-    # -------------------------------------------------------
-    scores = []
-
-    for idx, row in df.iterrows():
-        # Every row starts with a perfect score
-        score = 100
-
-        # PENALTY 1: Missing values
-        # Deduct 5 points for each column that has a missing value.
-        # We cap the total penalty at 50 points so a row with many
-        # columns doesn't immediately drop to 0.
-        missing_count = int(row.isna().sum())
-        missing_penalty = min(missing_count * 5, 50)
-        score -= missing_penalty
-
-        # PENALTY 2: Duplicate row
-        # If this row is an exact copy of another row, deduct 30 points.
-        # This matches the employee scorer's duplicate penalty.
-        if duplicate_mask.iloc[idx]:
-            score -= 30
-
-        # PENALTY 3: Outlier values in numeric columns
-        # If a numeric value falls outside the IQR bounds, deduct 10 points
-        # per outlier column. Cap at 30 points total for outlier penalties.
-        outlier_penalty = 0
-        for col in numeric_cols:
-            if col in outlier_bounds and not pd.isna(row[col]):
-                lower, upper = outlier_bounds[col]
-                if row[col] < lower or row[col] > upper:
-                    outlier_penalty += 10
-        score -= min(outlier_penalty, 30)
-
-        # Ensure score never goes below 0
-        scores.append(max(score, 0))
-
-    # Add the scores as a new column
-    df["Row_Quality_Score"] = scores
+    df["Row_Quality_Score"] = score_rows(
+        profile["row_missing_counts"],
+        profile["duplicate_mask"],
+        profile["row_outlier_counts"]
+    )
 
     # -------------------------------------------------------
     # USABILITY CLASSIFICATION
@@ -113,13 +133,6 @@ def calculate_generic_row_scores(df: pd.DataFrame):
     #   >= 85 → GOOD
     #   >= 70 → WARNING
     #   <  70 → BAD
-    def classify(score):
-        if score >= 85:
-            return "GOOD"
-        elif score >= 70:
-            return "WARNING"
-        return "BAD"
-
-    df["Row_Usability_Status"] = df["Row_Quality_Score"].apply(classify)
+    df["Row_Usability_Status"] = classify_row_scores(df["Row_Quality_Score"].to_numpy())
 
     return df
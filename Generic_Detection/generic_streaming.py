@@ -0,0 +1,488 @@
+"""
+Streaming (Chunked) Generic Pipeline
+======================================
+Runs the same analysis as generic_pipeline.run_generic_pipeline() on CSV
+files that are too large to hold in memory, by reading the file in chunks
+of CHUNK_ROWS rows and never materializing the whole DataFrame.
+
+Two passes over the file:
+
+  PASS 1 — profile
+    Each chunk is folded into per-column accumulators that can be merged
+    chunk after chunk:
+      - null / non-null counts and numeric parse counts (exact)
+      - sample values (first 3 unique values seen)
+      - distinct counts (exact up to EXACT_DISTINCT_LIMIT, then HyperLogLog)
+      - a reservoir sample of numeric values for the IQR quartiles
+        (exact while a column has <= QUANTILE_SAMPLE_SIZE values)
+      - one 64-bit hash per row for duplicate detection
+    The result is a profile dict with the same shape as
+    generic_profile.profile_dataset(), so the existing checks can read it.
+
+  PASS 2 — score
+    The file is read again; each chunk is scored with the global IQR
+    fences and duplicate mask, and only running totals (score sum,
+    GOOD/WARNING/BAD counts, outlier counts, datetime parse counts)
+    plus the first 20 scored rows are kept.
+
+Peak memory is bounded by the chunk size and the fixed-size sketches,
+plus 9 bytes per row (row hash + duplicate flag) for duplicate detection.
+
+Approximations compared to the in-memory pipeline:
+  - unique_count is estimated once a column exceeds EXACT_DISTINCT_LIMIT
+  - IQR fences come from a sample once a column exceeds QUANTILE_SAMPLE_SIZE
+  - duplicate rows are matched by a 64-bit hash of their values
+  - dtypes are inferred per chunk and then merged; rows are hashed on
+    a dtype-independent string form so 1 and 1.0 still match
+"""
+
+import numpy as np
+import pandas as pd
+
+from .generic_checks import (
+    check_completeness,
+    check_duplicates,
+    check_type_consistency,
+    check_outliers,
+    generate_column_summary
+)
+from .generic_health import summarize_generic_health
+from .generic_pipeline import build_generic_report
+from .generic_profile import MIN_IQR_VALUES, TYPE_THRESHOLD, json_safe_samples
+from .generic_scoring import classify_row_scores, score_rows
+from .generic_types import count_datetime_values, detect_date_format
+from tracing import Trace
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# Rows read per chunk (memory per chunk ~ CHUNK_ROWS x columns)
+CHUNK_ROWS = 100_000
+
+# Distinct values are tracked exactly up to this many per column,
+# then the column switches to a HyperLogLog estimate
+EXACT_DISTINCT_LIMIT = 50_000
+
+# HyperLogLog precision: 2^14 registers (16 KB per column, ~0.8% error)
+HLL_PRECISION = 14
+
+# Max numeric values kept per column for the IQR quartiles
+QUANTILE_SAMPLE_SIZE = 50_000
+
+
+# =============================================================
+# MERGEABLE ACCUMULATORS
+# =============================================================
+
+class DistinctCounter:
+    """
+    Counts distinct 64-bit value hashes.
+
+    Keeps the exact set of hashes until it grows past EXACT_DISTINCT_LIMIT,
+    then folds them into HyperLogLog registers and estimates from there on.
+    """
+
+    def __init__(self):
+        self.exact = np.empty(0, dtype=np.uint64)
+        self.registers = None
+
+    def add(self, hashes: np.ndarray):
+        if self.registers is None:
+            self.exact = np.union1d(self.exact, hashes)
+            if len(self.exact) > EXACT_DISTINCT_LIMIT:
+                self.registers = np.zeros(1 << HLL_PRECISION, dtype=np.uint8)
+                self._add_to_registers(self.exact)
+                self.exact = None
+        else:
+            self._add_to_registers(hashes)
+
+    def _add_to_registers(self, hashes: np.ndarray):
+        # Top bits pick the register, the remaining bits give the rank
+        # (position of the first 1-bit)
+        remaining_bits = 64 - HLL_PRECISION
+        index = (hashes >> np.uint64(remaining_bits)).astype(np.intp)
+        remaining = hashes & np.uint64((1 << remaining_bits) - 1)
+
+        # bit_length via log2 is exact here: remaining < 2^50 < 2^53
+        bit_length = np.zeros(len(remaining), dtype=np.int64)
+        nonzero = remaining > 0
+        bit_length[nonzero] = np.floor(np.log2(remaining[nonzero].astype(np.float64))).astype(np.int64) + 1
+        rank = (remaining_bits - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def count(self) -> int:
+        if self.registers is None:
+            return len(self.exact)
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+
+        # Small-range correction (linear counting)
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros > 0:
+            estimate = m * np.log(m / zeros)
+
+        return int(round(estimate))
+
+
+class QuantileSketch:
+    """
+    Uniform reservoir sample of a numeric stream (Algorithm R).
+
+    Holds every value while the stream is smaller than the capacity, so
+    quartiles are exact for small columns, and a uniform sample after that.
+    """
+
+    def __init__(self, capacity: int = QUANTILE_SAMPLE_SIZE, seed: int = 0):
+        self.capacity = capacity
+        self.values = np.empty(0, dtype=np.float64)
+        self.seen = 0
+        self.rng = np.random.default_rng(seed)
+
+    def add(self, values: np.ndarray):
+        room = self.capacity - len(self.values)
+        if room > 0:
+            self.values = np.concatenate([self.values, values[:room]])
+            self.seen += min(room, len(values))
+            values = values[room:]
+
+        if len(values):
+            # Value number i (1-based) replaces a random slot with
+            # probability capacity / i
+            positions = self.seen + np.arange(1, len(values) + 1)
+            slots = (self.rng.random(len(values)) * positions).astype(np.int64)
+            keep = slots < self.capacity
+            self.values[slots[keep]] = values[keep]
+            self.seen += len(values)
+
+    def quantiles(self, qs: list) -> list:
+        # Linear interpolation, same as pandas Series.quantile()
+        return np.quantile(self.values, qs).tolist()
+
+
+class ColumnAccumulator:
+    """
+    Everything PASS 1 tracks for one column.
+    """
+
+    def __init__(self):
+        self.chunk_dtypes = []
+        self.first_dtype = None
+        self.null_count = 0
+        self.non_null_count = 0
+        self.numeric_valid_count = 0
+        self.all_numeric = True
+        self.samples = []
+        self.distinct = DistinctCounter()
+        self.sketch = QuantileSketch()
+
+    def add(self, series: pd.Series):
+        if self.first_dtype is None:
+            self.first_dtype = series.dtype
+
+        non_null = series.dropna()
+        self.null_count += len(series) - len(non_null)
+        self.non_null_count += len(non_null)
+
+        # All-null chunks say nothing about the column's real type
+        if len(non_null) == 0:
+            return
+        self.chunk_dtypes.append(series.dtype)
+
+        is_number = (
+            pd.api.types.is_numeric_dtype(series)
+            and not pd.api.types.is_bool_dtype(series)
+        )
+
+        if pd.api.types.is_numeric_dtype(series):
+            self.numeric_valid_count += len(non_null)
+        else:
+            self.numeric_valid_count += int(pd.to_numeric(non_null, errors="coerce").notna().sum())
+
+        # Numbers are hashed as float64 so an int chunk and a float chunk
+        # of the same column agree on what a "distinct value" is
+        if is_number:
+            # "+ 0.0" folds -0.0 into 0.0, which unique() treats as equal
+            numbers = non_null.to_numpy(dtype=np.float64) + 0.0
+            hashes = pd.util.hash_array(numbers)
+            if self.all_numeric:
+                self.sketch.add(numbers)
+        else:
+            hashes = pd.util.hash_pandas_object(non_null, index=False).to_numpy()
+            # Not a numeric column after all; the IQR sample is not needed
+            self.all_numeric = False
+            self.sketch = None
+        self.distinct.add(np.unique(hashes))
+
+        if len(self.samples) < 3:
+            for value in non_null.unique():
+                if value not in self.samples:
+                    self.samples.append(value)
+                if len(self.samples) == 3:
+                    break
+
+    def merged_dtype(self) -> str:
+        """
+        Dtype the whole column would have been read as.
+        """
+        dtypes = self.chunk_dtypes or [self.first_dtype]
+        names = {str(dtype) for dtype in dtypes}
+        if len(names) == 1:
+            return names.pop()
+
+        if self.all_numeric:
+            if any(pd.api.types.is_float_dtype(dtype) for dtype in dtypes):
+                return "float64"
+            return "int64"
+
+        non_numeric = {str(dtype) for dtype in dtypes if not pd.api.types.is_numeric_dtype(dtype)}
+        return non_numeric.pop() if len(non_numeric) == 1 else "object"
+
+    def to_profile(self) -> dict:
+        dtype = self.merged_dtype()
+        # Match Series.unique().tolist() in the in-memory profiler:
+        # numpy scalars become native Python values
+        samples = [value.item() if isinstance(value, np.generic) else value for value in self.samples]
+        if dtype.startswith("float"):
+            samples = [float(value) for value in samples]
+
+        profile = {
+            "dtype": dtype,
+            "null_count": int(self.null_count),
+            "non_null_count": int(self.non_null_count),
+            "unique_count": self.distinct.count(),
+            "sample_values": json_safe_samples(samples),
+            "numeric_valid_count": int(self.numeric_valid_count),
+            "datetime_valid_count": None,
+            "type_sampled": False,
+            "quartiles": None,
+            "outlier_bounds": None,
+            "outlier_count": None,
+        }
+
+        if self.all_numeric and self.non_null_count >= MIN_IQR_VALUES:
+            q1, q3 = self.sketch.quantiles([0.25, 0.75])
+            iqr = q3 - q1
+            profile["quartiles"] = (q1, q3)
+            profile["outlier_bounds"] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+            profile["outlier_count"] = 0
+
+        return profile
+
+
+def _canonical_text(series: pd.Series) -> pd.Series:
+    """
+    String form of a column chunk that does not depend on the dtype the
+    chunk happened to be parsed as. A column of IDs is int64 in a chunk
+    without gaps and float64 in a chunk with a NaN, so whole floats are
+    written without the ".0" to hash the same as the ints.
+    """
+    text = series.astype(str)
+    if pd.api.types.is_float_dtype(series):
+        values = series.to_numpy(dtype=np.float64)
+        # Beyond 2^53 a float no longer holds the exact integer
+        whole = np.isfinite(values) & (values == np.floor(values)) & (np.abs(values) < 2 ** 53)
+        if whole.any():
+            text = text.to_numpy(dtype=object)
+            text[whole] = values[whole].astype(np.int64).astype(str)
+            text = pd.Series(text, index=series.index)
+    return text
+
+
+def _hash_rows(chunk: pd.DataFrame) -> np.ndarray:
+    """
+    One 64-bit hash per row, computed on the canonical string form of
+    the values (see _canonical_text) so rows from chunks parsed with
+    different dtypes still match.
+    """
+    text = pd.DataFrame({col: _canonical_text(chunk[col]) for col in chunk.columns})
+    return pd.util.hash_pandas_object(text, index=False).to_numpy()
+
+
+# =============================================================
+# PASS 1: PROFILE
+# =============================================================
+
+def stream_profile(csv_path: str, chunk_rows: int = CHUNK_ROWS) -> tuple[dict, list]:
+    """
+    Reads the CSV in chunks and builds a merged dataset profile.
+
+    Returns:
+        - the profile dict (same shape as generic_profile.profile_dataset(),
+          without the per-row counters; duplicate_mask is included)
+        - the column names in file order
+    """
+    accumulators = None
+    column_names = []
+    row_hashes = []
+    row_count = 0
+
+    for chunk in pd.read_csv(csv_path, chunksize=chunk_rows):
+        if accumulators is None:
+            column_names = chunk.columns.tolist()
+            accumulators = {col: ColumnAccumulator() for col in column_names}
+
+        for col in column_names:
+            accumulators[col].add(chunk[col])
+
+        row_hashes.append(_hash_rows(chunk))
+        row_count += len(chunk)
+
+    if accumulators is None:
+        # Header-only file: read the header so column names are reported
+        column_names = pd.read_csv(csv_path, nrows=0).columns.tolist()
+        accumulators = {col: ColumnAccumulator() for col in column_names}
+
+    hashes = pd.Series(np.concatenate(row_hashes) if row_hashes else np.empty(0, dtype=np.uint64))
+    duplicate_mask = hashes.duplicated(keep=False).to_numpy()
+    duplicate_count = int(hashes.duplicated().sum())
+    del hashes, row_hashes
+
+    profile = {
+        "row_count": row_count,
+        "columns": {col: accumulators[col].to_profile() for col in column_names},
+        "duplicate_mask": duplicate_mask,
+        "duplicate_count": duplicate_count,
+    }
+
+    return profile, column_names
+
+
+# =============================================================
+# PASS 2: SCORE
+# =============================================================
+
+def stream_scores(csv_path: str, profile: dict, chunk_rows: int = CHUNK_ROWS) -> tuple[dict, list]:
+    """
+    Re-reads the CSV in chunks, scores every row and fills in the parts
+    of the profile that need the global statistics from PASS 1
+    (outlier counts against the final fences, datetime parse counts for
+    columns that turned out not to be numeric).
+
+    Returns:
+        - the health dict
+        - the first 20 scored rows (row_scores_preview)
+    """
+    columns = profile["columns"]
+    duplicate_mask = profile["duplicate_mask"]
+
+    # Columns whose type is decided by the datetime parse rate are read
+    # as plain strings, exactly like the in-memory pipeline sees them
+    datetime_cols = [
+        col for col, col_profile in columns.items()
+        if col_profile["non_null_count"] > 0
+        and col_profile["numeric_valid_count"] / col_profile["non_null_count"] < TYPE_THRESHOLD
+    ]
+    for col in datetime_cols:
+        columns[col]["datetime_valid_count"] = 0
+
+    # Dominant date format per column, detected from the first chunk
+    # that has values and reused for every later chunk
+    date_formats = {}
+
+    bounded_cols = [col for col, col_profile in columns.items() if col_profile["outlier_bounds"] is not None]
+
+    score_sum = 0
+    bad_rows = 0
+    status_counts = {"GOOD": 0, "WARNING": 0, "BAD": 0}
+    preview = []
+    offset = 0
+
+    reader = pd.read_csv(csv_path, chunksize=chunk_rows, dtype={col: str for col in datetime_cols})
+    for chunk in reader:
+        rows = len(chunk)
+
+        missing_counts = chunk.isna().sum(axis=1).to_numpy(dtype=np.int64)
+
+        outlier_counts = np.zeros(rows, dtype=np.int64)
+        for col in bounded_cols:
+            lower, upper = columns[col]["outlier_bounds"]
+            values = pd.to_numeric(chunk[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            outlier_mask = (values < lower) | (values > upper)
+            outlier_counts += outlier_mask
+            columns[col]["outlier_count"] += int(outlier_mask.sum())
+
+        for col in datetime_cols:
+            non_null = chunk[col].dropna()
+            if col not in date_formats and len(non_null):
+                date_formats[col] = detect_date_format(non_null)
+            columns[col]["datetime_valid_count"] += count_datetime_values(non_null, date_formats.get(col))
+
+        scores = score_rows(missing_counts, duplicate_mask[offset:offset + rows], outlier_counts)
+        statuses = classify_row_scores(scores)
+
+        score_sum += int(scores.sum())
+        bad_rows += int((scores < 70).sum())
+        for status in status_counts:
+            status_counts[status] += int((statuses == status).sum())
+
+        if len(preview) < 20:
+            take = 20 - len(preview)
+            preview.extend(
+                {"Row_Quality_Score": int(score), "Row_Usability_Status": str(status)}
+                for score, status in zip(scores[:take], statuses[:take])
+            )
+
+        offset += rows
+
+    row_count = profile["row_count"]
+    health = summarize_generic_health(
+        score_sum / row_count if row_count else float("nan"),
+        bad_rows / row_count * 100 if row_count else float("nan"),
+        row_count,
+        status_counts["GOOD"],
+        status_counts["WARNING"],
+        status_counts["BAD"]
+    )
+
+    return health, preview
+
+
+# =============================================================
+# ENTRY POINT
+# =============================================================
+
+def run_generic_pipeline_streaming(csv_path: str, chunk_rows: int = CHUNK_ROWS, progress=None) -> dict:
+    """
+    Streaming equivalent of run_generic_pipeline(): same report shape,
+    bounded memory. See the module docstring for what is approximated.
+
+    progress, if given, is called as progress(fraction, step) before
+    each pass.
+    """
+    report_progress = progress or (lambda fraction, step: None)
+    trace = Trace("generic_streaming")
+
+    report_progress(0.0, "profiling")
+    with trace.stage("profile_pass") as span:
+        profile, column_names = stream_profile(csv_path, chunk_rows)
+        span.rows = profile["row_count"]
+    report_progress(0.5, "scoring")
+    with trace.stage("scoring_pass", rows=profile["row_count"]):
+        health, preview = stream_scores(csv_path, profile, chunk_rows)
+
+    # The in-memory pipeline reports the columns after scoring, so the
+    # two score columns are listed here too to keep the reports identical
+    scored_columns = column_names + ["Row_Quality_Score", "Row_Usability_Status"]
+
+    # The checks read everything from the profile, so no DataFrame is passed
+    with trace.stage("checks"):
+        report = build_generic_report(
+            dataset_info={
+                "total_rows": profile["row_count"],
+                "total_columns": len(scored_columns),
+                "column_names": scored_columns
+            },
+            column_summary=generate_column_summary(None, profile),
+            completeness=check_completeness(None, profile),
+            duplicates=check_duplicates(None, profile),
+            type_consistency=check_type_consistency(None, profile),
+            outliers=check_outliers(None, profile),
+            health=health,
+            row_scores_preview=preview
+        )
+    report["timings"] = trace.finish()
+    return report
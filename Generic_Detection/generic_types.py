@@ -0,0 +1,190 @@
+"""
+Column Type Inference
+======================
+Decides how many values of a column parse as numbers and as dates,
+which is what check_type_consistency() uses to label a column
+"numeric", "datetime" or "text".
+
+Doing this naively (pd.to_numeric + pd.to_datetime on every value of
+every column) is slow: pd.to_datetime without a format falls back to
+parsing each value individually with dateutil. This module avoids most
+of that work:
+
+  1. Native dtypes short-circuit: int/float/bool columns are numeric and
+     datetime64 columns are dates, without parsing anything.
+  2. Large columns are first inferred on a stratified sample of
+     TYPE_SAMPLE_SIZE values (evenly spaced through the column, so sorted
+     or grouped data is still represented).
+  3. The dominant date format is detected once from the sample and the
+     column is parsed with that explicit format; only the values that do
+     not match it are handed to the slow per-value parser.
+  4. Full-column counting only happens when the sample lands within
+     TYPE_AMBIGUITY_MARGIN of TYPE_THRESHOLD or above it.
+
+So the counts are always exact for columns that end up "numeric" or
+"datetime" (those are the ones whose inconsistent_count is reported).
+Columns that are clearly text keep the sample-based estimate, which is
+fine because text columns never report inconsistent values.
+"""
+
+import warnings
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# A column is "numeric" or "datetime" once this share of its
+# non-null values parses as that type (see check_type_consistency).
+TYPE_THRESHOLD = 0.80
+
+# Values inspected before deciding whether a full-column count is needed
+TYPE_SAMPLE_SIZE = 2_000
+
+# A sample rate within this distance of TYPE_THRESHOLD is "ambiguous"
+# and triggers a full-column count
+TYPE_AMBIGUITY_MARGIN = 0.10
+
+# Distinct values probed when guessing the dominant date format
+# (guessing is a per-value Python call, so keep this small)
+DATE_FORMAT_PROBES = 50
+
+
+def stratified_sample(values: pd.Series, size: int = TYPE_SAMPLE_SIZE) -> pd.Series:
+    """
+    Picks up to `size` values evenly spaced through the column.
+    """
+    if len(values) <= size:
+        return values
+    positions = np.linspace(0, len(values) - 1, size).astype(np.int64)
+    return values.iloc[positions]
+
+
+def detect_date_format(values: pd.Series) -> str | None:
+    """
+    Guesses the strftime format shared by most of the (sampled) values.
+
+    Returns:
+        The most common guessable format, or None if no value looks
+        like a date with a recognizable format
+    """
+    distinct = pd.unique(stratified_sample(values).to_numpy())
+    probes = stratified_sample(pd.Series(distinct), DATE_FORMAT_PROBES)
+
+    formats = Counter()
+    for value in probes:
+        # Every supported date format contains digits; skipping plain
+        # words avoids the (slow) guess on typical text columns
+        if isinstance(value, str) and any(ch.isdigit() for ch in value):
+            guessed = guess_datetime_format(value)
+            if guessed is not None:
+                formats[guessed] += 1
+
+    if not formats:
+        return None
+    return formats.most_common(1)[0][0]
+
+
+def count_datetime_values(values: pd.Series, date_format: str | None) -> int:
+    """
+    Counts how many (non-null) values parse as dates.
+
+    Values matching `date_format` are parsed in one vectorized call;
+    only the rest go through the per-value parser.
+    """
+    if len(values) == 0:
+        return 0
+
+    remaining = values
+    valid = 0
+
+    if date_format is not None:
+        parsed = pd.to_datetime(values, format=date_format, errors="coerce")
+        matched = parsed.notna().to_numpy()
+        valid = int(matched.sum())
+        remaining = values[~matched]
+
+    if len(remaining):
+        with warnings.catch_warnings():
+            # Mixed inputs make pandas warn about every per-value fallback
+            warnings.simplefilter("ignore", UserWarning)
+            parsed = pd.to_datetime(remaining, format="mixed", errors="coerce")
+        valid += int(parsed.notna().sum())
+
+    return valid
+
+
+def _is_clearly_below(sample_valid: int, sample_size: int) -> bool:
+    return sample_valid / sample_size < TYPE_THRESHOLD - TYPE_AMBIGUITY_MARGIN
+
+
+def infer_column_types(series: pd.Series, non_null: pd.Series) -> dict:
+    """
+    Counts the numeric and datetime values of one column.
+
+    Args:
+        series: the full column (used for its dtype)
+        non_null: the column's non-null values
+
+    Returns:
+        A dict with:
+        - numeric_valid_count: values that parse as numbers
+        - datetime_valid_count: values that parse as dates, or None when
+          the column is numeric (the date rate is not needed then)
+        - type_sampled: True if a count is an estimate from the sample
+          (only for rates clearly below TYPE_THRESHOLD)
+    """
+    non_null_count = len(non_null)
+    result = {"numeric_valid_count": 0, "datetime_valid_count": None, "type_sampled": False}
+
+    if non_null_count == 0:
+        return result
+
+    # ---------------------------------------------------------
+    # Native dtypes need no parsing at all
+    # ---------------------------------------------------------
+    if pd.api.types.is_numeric_dtype(series):
+        result["numeric_valid_count"] = non_null_count
+        return result
+
+    if pd.api.types.is_datetime64_any_dtype(series):
+        result["datetime_valid_count"] = non_null_count
+        return result
+
+    sample = stratified_sample(non_null)
+    sampled = len(sample) < non_null_count
+
+    # ---------------------------------------------------------
+    # Numeric rate: exact unless the sample is clearly not numeric
+    # ---------------------------------------------------------
+    sample_numeric = int(pd.to_numeric(sample, errors="coerce").notna().sum())
+    if sampled and _is_clearly_below(sample_numeric, len(sample)):
+        numeric_valid = round(sample_numeric / len(sample) * non_null_count)
+        result["type_sampled"] = True
+    elif sampled:
+        numeric_valid = int(pd.to_numeric(non_null, errors="coerce").notna().sum())
+    else:
+        numeric_valid = sample_numeric
+    result["numeric_valid_count"] = numeric_valid
+
+    if numeric_valid / non_null_count >= TYPE_THRESHOLD:
+        return result
+
+    # ---------------------------------------------------------
+    # Datetime rate: exact unless the sample is clearly not dates
+    # ---------------------------------------------------------
+    date_format = detect_date_format(sample)
+    sample_datetime = count_datetime_values(sample, date_format)
+    if sampled and _is_clearly_below(sample_datetime, len(sample)):
+        result["datetime_valid_count"] = round(sample_datetime / len(sample) * non_null_count)
+        result["type_sampled"] = True
+    elif sampled:
+        result["datetime_valid_count"] = count_datetime_values(non_null, date_format)
+    else:
+        result["datetime_valid_count"] = sample_datetime
+
+    return result
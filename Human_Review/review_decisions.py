@@ -1,6 +1,9 @@
 import pandas as pd
 from datetime import datetime
 
+from Audit.audit_log import build_event, log_events
+from Human_Review.review_store import DECISION_ACTIONS, review_store
+
 def apply_review_decision(
         df: pd.DataFrame,
         employee_id: str,
@@ -20,20 +23,72 @@ def apply_review_decision(
 
     mask = df["Employee_ID"] == employee_id
 
-    #Human Approval
-    if decision == "APPROVE":
-        df.loc[mask, "Resolution_Action"] = "ACCEPT"
-        df.loc[mask, "Human_Reviewed"] = True
-    #Human Rejection
-    elif decision == "REJECT":
-        df.loc[mask, "Resolution_Action"] = "REJECTED"
-        df.loc[mask, "Human_Reviewed"] = True
-    #Human says row needs fixing
-    elif decision == "FIX":
-        df.loc[mask, "Resolution_Action"] = "NEEDS_FIX"
+    #APPROVE → ACCEPT, REJECT → REJECTED, FIX → NEEDS_FIX
+    if decision in DECISION_ACTIONS:
+        df.loc[mask, "Resolution_Action"] = DECISION_ACTIONS[decision]
         df.loc[mask, "Human_Reviewed"] = True
 
     df.loc[mask, "Review_Notes"] = notes
     df.loc[mask, "Review_Timestamp"] = datetime.utcnow().isoformat()
 
-    return df
\ No newline at end of file
+    return df
+
+def record_review_decisions(decisions: list[dict]) -> list[dict]:
+    """
+    Records human decisions in the review store, all in one transaction.
+    Parameters:
+        decisions → dicts with employee_id, decision and optionally
+                    review_notes and reviewer
+    Returns:
+        The recorded decisions (see ReviewStore.record_decisions)
+    Raises:
+        ReviewError if any decision is invalid (then none is recorded)
+    """
+
+    recorded = review_store.record_decisions(decisions)
+
+    log_review_events([
+        (item["employee_id"], item, {"rows": item["rows"], "signatures": item["signatures"]})
+        for item in recorded
+    ])
+
+    return recorded
+
+def log_review_events(decisions: list[tuple]):
+    """
+    Writes one audit event per decision.
+    Parameters:
+        decisions → (employee_id, decision dict, extra metadata) tuples
+    """
+
+    log_events([
+        build_event(
+            action=f"HUMAN_REVIEW_{decision['decision']}",
+            source="human_review",
+            reason=decision["review_notes"] or f"Reviewer decision: {decision['decision']}",
+            record_id=employee_id,
+            metadata={
+                "resolution_action": decision["resolution_action"],
+                "reviewer": decision["reviewer"],
+                **metadata
+            }
+        )
+        for employee_id, decision, metadata in decisions
+    ])
+
+def record_review_decision(
+        employee_id: str,
+        decision: str,
+        notes: str | None = None,
+        reviewer: str | None = None
+) -> dict:
+    """
+    Records ONE human decision in the review store.
+    """
+
+    return record_review_decisions([{
+        "employee_id": employee_id,
+        "decision": decision,
+        "review_notes": notes,
+        "reviewer": reviewer,
+    }])[0]
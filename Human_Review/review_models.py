@@ -1,6 +1,8 @@
 from pydantic import BaseModel
 from typing import Optional
 
+from Human_Review.review_store import REVIEW_PAGE_SIZE
+
 class Reviewitem(BaseModel):
     """
     This class defines what a single review item looks like.
@@ -14,10 +16,47 @@ class Reviewitem(BaseModel):
 
 class ReviewDecision(BaseModel):
     """
-    This class defines what a single review item looks like.
-    It is used when SHOWING rows to a human reviewer.
+    This class defines what a single human decision looks like.
+    It is used when a human reviewer SUBMITS a decision.
+    decision is APPROVE, REJECT or FIX.
     """
 
     employee_id: str
     decision: str
-    review_notes: Optional[str] = None
\ No newline at end of file
+    review_notes: Optional[str] = None
+    reviewer: Optional[str] = None
+
+class ReviewDecisionBatch(BaseModel):
+    """
+    Many decisions submitted at once; they are applied all together
+    or not at all.
+    """
+
+    decisions: list[ReviewDecision]
+
+class ReviewQueueRequest(BaseModel):
+    """
+    Which page of the review queue to return.
+    csv_path is accepted for older clients and ignored: the queue
+    always covers the latest analysis results.
+    """
+
+    csv_path: Optional[str] = None
+    limit: int = REVIEW_PAGE_SIZE
+    cursor: Optional[str] = None
+    reason: Optional[str] = None
+    sort: str = "score"
+    include_reviewed: bool = False
+    signature: Optional[str] = None
+
+class ClusterDecision(BaseModel):
+    """
+    One decision for a whole cluster of rows sharing a failure
+    signature. expected_size is the cluster size the reviewer saw.
+    """
+
+    signature: str
+    decision: str
+    review_notes: Optional[str] = None
+    reviewer: Optional[str] = None
+    expected_size: Optional[int] = None
@@ -1,5 +1,7 @@
 import pandas as pd
 
+from Human_Review.review_store import REVIEW_CONFIDENCE_THRESHOLD, REVIEW_PAGE_SIZE, review_store
+
 def build_review_queue(df: pd.DataFrame) -> pd.DataFrame:
     """
     This function selects rows that REQUIRE human review.
@@ -11,7 +13,7 @@ def build_review_queue(df: pd.DataFrame) -> pd.DataFrame:
 
     review_df = df[
         (df["Resolution_Action"] == "QUARANTINE") |
-        (df["Resolution_Confidence"] <0.8)
+        (df["Resolution_Confidence"] < REVIEW_CONFIDENCE_THRESHOLD)
     ].copy()
 
     review_df = review_df[
@@ -34,3 +36,28 @@ def build_review_queue(df: pd.DataFrame) -> pd.DataFrame:
     )
 
     return review_df
+
+def review_queue_page(
+        limit: int = REVIEW_PAGE_SIZE,
+        cursor: str | None = None,
+        reason: str | None = None,
+        sort: str = "score",
+        include_reviewed: bool = False,
+        signature: str | None = None
+) -> dict:
+    """
+    Same rows as build_review_queue(), one page at a time, most urgent
+    first, read from the review store's index.
+    Output:
+            {"total", "count", "items", "next_cursor"}
+            (see ReviewStore.queue_page)
+    """
+
+    return review_store.queue_page(
+        limit=limit,
+        cursor=cursor,
+        reason=reason,
+        sort=sort,
+        include_reviewed=include_reviewed,
+        signature=signature
+    )
@@ -0,0 +1,664 @@
+import base64
+import binascii
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+#Analysis results reviewed by humans (written by /analyze/health)
+RESULTS_CSV = Path("outputs/quality_results.csv")
+
+#Review store: the latest results plus every human decision
+REVIEW_DB_PATH = Path("outputs/review_store.sqlite")
+
+#What each human decision does to the row's Resolution_Action
+DECISION_ACTIONS = {
+    "APPROVE": "ACCEPT",
+    "REJECT": "REJECTED",
+    "FIX": "NEEDS_FIX",
+}
+
+#Rows below this resolution confidence need review even if not quarantined
+REVIEW_CONFIDENCE_THRESHOLD = 0.8
+
+#Reason reported for (and filtering) rows without a Resolution_Reason
+REVIEW_NO_REASON = "NO_REASON"
+
+#Queue page size: default / maximum
+REVIEW_PAGE_SIZE = 50
+REVIEW_MAX_PAGE_SIZE = 1000
+
+#Results CSV column -> store column
+RESULT_COLUMNS = {
+    "Employee_ID": "employee_id",
+    "Row_Quality_Score": "row_quality_score",
+    "Row_Usability_Status": "row_usability_status",
+    "Resolution_Action": "resolution_action",
+    "Resolution_Reason": "resolution_reason",
+    "Resolution_Confidence": "resolution_confidence",
+    "Analysis_Timestamp": "analysis_timestamp",
+    "Row_Quality_Issues": "row_quality_issues",
+}
+
+#Columns added to the results table after its first version
+_ADDED_COLUMNS = {
+    "needs_review": "INTEGER NOT NULL DEFAULT 0",
+    "row_quality_issues": "TEXT",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    row_id INTEGER PRIMARY KEY,
+    employee_id TEXT,
+    row_quality_score REAL,
+    row_usability_status TEXT,
+    resolution_action TEXT,
+    resolution_reason TEXT,
+    resolution_confidence REAL,
+    analysis_timestamp TEXT,
+    needs_review INTEGER NOT NULL DEFAULT 0,
+    row_quality_issues TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_results_employee ON results(employee_id);
+
+CREATE TABLE IF NOT EXISTS decisions (
+    employee_id TEXT NOT NULL,
+    row_quality_issues TEXT NOT NULL,
+    decision TEXT NOT NULL,
+    resolution_action TEXT NOT NULL,
+    review_notes TEXT,
+    reviewer TEXT,
+    review_timestamp TEXT NOT NULL,
+    PRIMARY KEY (employee_id, row_quality_issues)
+);
+
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class ReviewError(ValueError):
+    """
+    Raised when decisions cannot be applied; nothing was written.
+    errors lists one {"employee_id", "code", "error"} dict per bad
+    decision, code being "invalid_decision" or "not_found".
+    """
+
+    def __init__(self, errors: list[dict]):
+        super().__init__(f"{len(errors)} invalid review decision(s)")
+        self.errors = errors
+
+
+class ReviewStore:
+    """
+    SQLite store behind the human review endpoints.
+
+    The results table mirrors the latest results CSV: it is re-imported
+    (in one transaction) whenever the CSV's size or mtime changes.
+    Decisions live in their own table keyed by Employee_ID and the
+    failure signature (Row_Quality_Issues) of the rows the reviewer
+    decided on, and recording one is a few indexed upserts whatever the
+    size of the dataset. A decision applies to the rows with that
+    Employee_ID and signature: it survives a re-analysis that finds the
+    same problems, while a row whose problems changed goes back to the
+    queue with its new Resolution_Action.
+    """
+
+    def __init__(self, results_csv: Path | str = RESULTS_CSV, db_path: Path | str = REVIEW_DB_PATH):
+        self.results_csv = Path(results_csv)
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        #Older stores: add the new columns and re-import the results
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(results)")}
+        missing = [name for name in _ADDED_COLUMNS if columns and name not in columns]
+        if missing:
+            with conn:
+                for name in missing:
+                    conn.execute(f"ALTER TABLE results ADD COLUMN {name} {_ADDED_COLUMNS[name]}")
+                conn.execute("DELETE FROM state WHERE key = 'source'")
+
+        #Decisions keyed by Employee_ID only: set aside, and bound to the
+        #signatures of the next import (see _adopt_legacy_decisions)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(decisions)")}
+        if columns and "row_quality_issues" not in columns:
+            with conn:
+                conn.execute("ALTER TABLE decisions RENAME TO legacy_decisions")
+                conn.execute("DELETE FROM state WHERE key = 'source'")
+
+        conn.executescript(_SCHEMA + _QUEUE_INDEXES)
+        return conn
+
+    # ---------------------------------------------------------
+    # Results import
+    # ---------------------------------------------------------
+
+    def _signature(self) -> str | None:
+        try:
+            stat = os.stat(self.results_csv)
+        except FileNotFoundError:
+            return None
+        return json.dumps([stat.st_size, stat.st_mtime_ns])
+
+    def sync(self) -> bool:
+        """
+        Re-imports the results CSV if it changed since the last import.
+        Returns True if it was imported.
+        """
+        signature = self._signature()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT value FROM state WHERE key = 'source'").fetchone()
+                if signature is None or (row and row[0] == signature):
+                    return False
+
+                #BEGIN IMMEDIATE: one importing process at a time
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute("SELECT value FROM state WHERE key = 'source'").fetchone()
+                if row and row[0] == signature:
+                    conn.rollback()
+                    return False
+
+                self._import(conn, pd.read_csv(self.results_csv, dtype={"Employee_ID": str}))
+                self._adopt_legacy_decisions(conn)
+                conn.execute("INSERT OR REPLACE INTO state (key, value) VALUES ('source', ?)", (signature,))
+                conn.commit()
+                return True
+            finally:
+                conn.close()
+
+    def _import(self, conn: sqlite3.Connection, df: pd.DataFrame):
+        #Columns missing from the CSV (e.g. no resolution yet) are stored as NULL
+        present = [column for column in RESULT_COLUMNS if column in df.columns]
+        values = df[present].astype(object).where(df[present].notna(), None)
+
+        #Same selection as build_review_queue()
+        needs_review = np.zeros(len(df), dtype=bool)
+        if "Resolution_Action" in df.columns:
+            needs_review |= (df["Resolution_Action"] == "QUARANTINE").to_numpy()
+        if "Resolution_Confidence" in df.columns:
+            needs_review |= (df["Resolution_Confidence"] < REVIEW_CONFIDENCE_THRESHOLD).to_numpy()
+        values["needs_review"] = needs_review.astype(int)
+
+        #Results without failure signatures all fall in the "" cluster
+        if "Row_Quality_Issues" not in present:
+            present.append("Row_Quality_Issues")
+            values.insert(len(present) - 1, "Row_Quality_Issues", "")
+        else:
+            values["Row_Quality_Issues"] = values["Row_Quality_Issues"].fillna("")
+
+        conn.execute("DELETE FROM results")
+        names = ", ".join([RESULT_COLUMNS[column] for column in present] + ["needs_review"])
+        marks = ", ".join("?" for _ in range(len(present) + 1))
+        conn.executemany(
+            f"INSERT INTO results ({names}) VALUES ({marks})",
+            values.itertuples(index=False, name=None)
+        )
+
+    def _adopt_legacy_decisions(self, conn: sqlite3.Connection):
+        #Decisions from stores without signatures cover every row of their
+        #Employee_ID, so they are bound to all of its current signatures
+        if not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'legacy_decisions'"
+        ).fetchone():
+            return
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO decisions (employee_id, row_quality_issues, decision,
+                resolution_action, review_notes, reviewer, review_timestamp)
+            SELECT DISTINCT d.employee_id, r.row_quality_issues, d.decision,
+                d.resolution_action, d.review_notes, d.reviewer, d.review_timestamp
+            FROM legacy_decisions d JOIN results r ON r.employee_id = d.employee_id
+            """
+        )
+        conn.execute("DROP TABLE legacy_decisions")
+
+    # ---------------------------------------------------------
+    # Decisions
+    # ---------------------------------------------------------
+
+    def record_decisions(self, decisions: list[dict]) -> list[dict]:
+        """
+        Applies decisions ({"employee_id", "decision", "review_notes",
+        "reviewer"}) in one transaction: either all are recorded or,
+        if any names an unknown decision or Employee_ID, none is and
+        ReviewError lists the bad ones.
+
+        A decision covers the Employee_ID's rows as they are now: it is
+        stored once per failure signature they have, and a later
+        decision for the same Employee_ID replaces the earlier one.
+        Returns the recorded decisions with their resulting action, the
+        number of rows they apply to and those rows' signatures.
+        """
+        self.sync()
+        timestamp = datetime.utcnow().isoformat()
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+
+                recorded, errors = [], []
+                for item in decisions:
+                    employee_id = str(item["employee_id"])
+                    decision = str(item["decision"]).upper()
+
+                    if decision not in DECISION_ACTIONS:
+                        errors.append({"employee_id": employee_id, "code": "invalid_decision",
+                                       "error": f"Unknown decision '{item['decision']}'. "
+                                                f"Use one of {sorted(DECISION_ACTIONS)}."})
+                        continue
+
+                    signatures = conn.execute(
+                        "SELECT row_quality_issues, COUNT(*) FROM results WHERE employee_id = ? "
+                        "GROUP BY row_quality_issues",
+                        (employee_id,)
+                    ).fetchall()
+                    rows = sum(count for _, count in signatures)
+                    if rows == 0:
+                        errors.append({"employee_id": employee_id, "code": "not_found",
+                                       "error": "Employee_ID not found"})
+                        continue
+
+                    recorded.append({
+                        "employee_id": employee_id,
+                        "decision": decision,
+                        "resolution_action": DECISION_ACTIONS[decision],
+                        "review_notes": item.get("review_notes"),
+                        "reviewer": item.get("reviewer"),
+                        "review_timestamp": timestamp,
+                        "rows": rows,
+                        "signatures": [signature for signature, _ in signatures],
+                    })
+
+                if errors:
+                    conn.rollback()
+                    raise ReviewError(errors)
+
+                conn.executemany(
+                    "INSERT OR REPLACE INTO decisions (employee_id, row_quality_issues, decision, "
+                    "resolution_action, review_notes, reviewer, review_timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(d["employee_id"], signature, d["decision"], d["resolution_action"],
+                      d["review_notes"], d["reviewer"], d["review_timestamp"])
+                     for d in recorded for signature in d["signatures"]]
+                )
+                conn.commit()
+                return recorded
+            finally:
+                conn.close()
+
+    def get_decisions(self, employee_id: str) -> list[dict]:
+        """
+        The decisions recorded for an Employee_ID, one per failure
+        signature (including ones its current rows no longer have).
+        """
+        conn = self._connect()
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = conn.execute(
+                "SELECT * FROM decisions WHERE employee_id = ? ORDER BY row_quality_issues", (str(employee_id),)
+            ).fetchall()
+            return [dict(row) for row in rows]
+        finally:
+            conn.close()
+
+    # ---------------------------------------------------------
+    # Reading
+    # ---------------------------------------------------------
+
+    def results_frame(self) -> pd.DataFrame:
+        """
+        The latest results with human decisions applied (to the rows
+        whose Employee_ID and signature they were made on), using the
+        column names of the results CSV plus Human_Reviewed,
+        Review_Notes and Review_Timestamp.
+        """
+        self.sync()
+        conn = self._connect()
+        try:
+            df = pd.read_sql_query(
+                """
+                SELECT r.*, d.resolution_action AS human_action, d.review_notes, d.review_timestamp
+                FROM results r LEFT JOIN decisions d
+                    ON d.employee_id = r.employee_id AND d.row_quality_issues = r.row_quality_issues
+                ORDER BY r.row_id
+                """,
+                conn
+            )
+        finally:
+            conn.close()
+
+        reviewed = df["human_action"].notna()
+        df["resolution_action"] = df["human_action"].where(reviewed, df["resolution_action"])
+        df = df.drop(columns=["row_id", "human_action", "needs_review"])
+        df["Human_Reviewed"] = reviewed
+
+        return df.rename(columns={
+            **{store: column for column, store in RESULT_COLUMNS.items()},
+            "review_notes": "Review_Notes",
+            "review_timestamp": "Review_Timestamp",
+        })
+
+    # ---------------------------------------------------------
+    # Review queue
+    # ---------------------------------------------------------
+
+    def queue_page(self, limit: int = REVIEW_PAGE_SIZE, cursor: str | None = None,
+                   reason: str | None = None, sort: str = "score",
+                   include_reviewed: bool = False, signature: str | None = None) -> dict:
+        """
+        One page of the rows needing review (QUARANTINE, or confidence
+        below REVIEW_CONFIDENCE_THRESHOLD), most urgent first.
+
+        sort="score" orders by lowest Row_Quality_Score, then lowest
+        confidence; sort="confidence" the other way round. reason keeps
+        one Resolution_Reason (REVIEW_NO_REASON: rows without one),
+        signature one Row_Quality_Issues cluster.
+        Rows with a human decision (for their current signature) are left
+        out unless include_reviewed.
+
+        Pages are read straight from a partial index (keyset
+        pagination), so every page costs the same however deep it is:
+        pass the returned next_cursor to get the following page (None
+        on the last one). total is only counted for the first page.
+        """
+        if sort not in _QUEUE_SORTS:
+            raise ValueError(f"Unknown sort '{sort}'. Use one of {sorted(_QUEUE_SORTS)}.")
+        limit = max(1, min(int(limit), REVIEW_MAX_PAGE_SIZE))
+        first, second = _QUEUE_SORTS[sort]
+
+        filters, params = ["needs_review = 1"], []
+        if reason == REVIEW_NO_REASON:
+            filters.append("resolution_reason IS NULL")
+        elif reason is not None:
+            filters.append("resolution_reason = ?")
+            params.append(reason)
+        if signature is not None:
+            filters.append("row_quality_issues = ?")
+            params.append(signature)
+
+        self.sync()
+        conn = self._connect()
+        try:
+            total = None
+            if cursor is None:
+                total = self._queue_total(conn, filters, params, include_reviewed)
+            else:
+                key = _decode_cursor(cursor, sort)
+                #The >= on the first key lets SQLite seek into the index;
+                #the row value comparison alone would scan from the start
+                filters.append(f"{first} >= ? AND ({first}, {second}, row_id) > (?, ?, ?)")
+                params.extend([key[0], *key])
+
+            if not include_reviewed:
+                filters.append(_NOT_REVIEWED)
+
+            rows = conn.execute(
+                f"""
+                SELECT employee_id, row_quality_score, resolution_action, resolution_reason,
+                       resolution_confidence, row_quality_issues, {first}, {second}, row_id
+                FROM results r
+                WHERE {' AND '.join(filters)}
+                ORDER BY {first}, {second}, row_id
+                LIMIT ?
+                """,
+                params + [limit + 1]
+            ).fetchall()
+        finally:
+            conn.close()
+
+        next_cursor = _encode_cursor(sort, rows[limit - 1][6:]) if len(rows) > limit else None
+        items = [_queue_item(row) for row in rows[:limit]]
+        return {"total": total, "count": len(items), "items": items, "next_cursor": next_cursor}
+
+    def _queue_total(self, conn, filters: list, params: list, include_reviewed: bool) -> int:
+        where = " AND ".join(filters)
+        total = conn.execute(f"SELECT COUNT(*) FROM results r WHERE {where}", params).fetchone()[0]
+        if not include_reviewed:
+            #Subtract the reviewed rows, going from the (few) decisions
+            #(CROSS JOIN keeps SQLite from looping over results instead)
+            total -= conn.execute(
+                f"SELECT COUNT(*) FROM decisions d CROSS JOIN results r ON {_DECISION_MATCH} WHERE {where}",
+                params
+            ).fetchone()[0]
+        return total
+
+    # ---------------------------------------------------------
+    # Triage clusters
+    # ---------------------------------------------------------
+
+    def clusters(self, limit: int = REVIEW_PAGE_SIZE, sort: str = "size",
+                 include_reviewed: bool = False) -> dict:
+        """
+        Rows needing review grouped by failure signature
+        (Row_Quality_Issues), each with its size and its most urgent
+        row as representative.
+
+        sort="size" puts the largest clusters first (most rows settled
+        per decision), sort="score" the ones with the lowest score.
+        Only the counts scan the queue (through an index-only GROUP BY);
+        representatives are one indexed lookup per returned cluster.
+        """
+        if sort not in ("size", "score"):
+            raise ValueError(f"Unknown sort '{sort}'. Use 'size' or 'score'.")
+        limit = max(1, min(int(limit), REVIEW_MAX_PAGE_SIZE))
+
+        self.sync()
+        conn = self._connect()
+        try:
+            sizes = dict(conn.execute(
+                "SELECT row_quality_issues, COUNT(*) FROM results WHERE needs_review = 1 "
+                "GROUP BY row_quality_issues"
+            ).fetchall())
+            if not include_reviewed:
+                for signature, reviewed in conn.execute(
+                    "SELECT r.row_quality_issues, COUNT(*) FROM decisions d "
+                    f"CROSS JOIN results r ON {_DECISION_MATCH} "
+                    "WHERE r.needs_review = 1 GROUP BY r.row_quality_issues"
+                ):
+                    sizes[signature] -= reviewed
+            sizes = {signature: size for signature, size in sizes.items() if size > 0}
+
+            representatives = {}
+            reviewed = "" if include_reviewed else f"AND {_NOT_REVIEWED}"
+            first, second = _QUEUE_SORTS["score"]
+
+            def representative(signature):
+                if signature not in representatives:
+                    representatives[signature] = _queue_item(conn.execute(
+                        f"""
+                        SELECT employee_id, row_quality_score, resolution_action, resolution_reason,
+                               resolution_confidence, row_quality_issues
+                        FROM results r
+                        WHERE needs_review = 1 AND row_quality_issues = ? {reviewed}
+                        ORDER BY {first}, {second}, row_id LIMIT 1
+                        """,
+                        (signature,)
+                    ).fetchone())
+                return representatives[signature]
+
+            if sort == "size":
+                ordered = sorted(sizes, key=lambda signature: (-sizes[signature], signature))
+            else:
+                ordered = sorted(sizes, key=lambda signature: (
+                    _sort_value(representative(signature)["current_score"]), -sizes[signature]
+                ))
+
+            clusters = [
+                {
+                    "signature": signature,
+                    "penalties": signature.split("|") if signature else [],
+                    "size": sizes[signature],
+                    "representative": representative(signature),
+                }
+                for signature in ordered[:limit]
+            ]
+        finally:
+            conn.close()
+
+        return {
+            "cluster_count": len(sizes),
+            "rows": sum(sizes.values()),
+            "clusters": clusters,
+        }
+
+    def record_cluster_decision(self, signature: str, decision: str, review_notes: str | None = None,
+                                reviewer: str | None = None, expected_size: int | None = None) -> dict:
+        """
+        Applies one decision to every row of a cluster not yet reviewed,
+        in one transaction. It is recorded for (Employee_ID, signature),
+        so rows of the same employees in other clusters are not decided.
+
+        expected_size, if given, must equal the cluster's current size
+        (the one the reviewer saw); otherwise nothing is written and
+        ReviewError (code "conflict") is raised, e.g. when a re-analysis
+        changed the cluster in between.
+        """
+        decision_name = str(decision).upper()
+        if decision_name not in DECISION_ACTIONS:
+            raise ReviewError([{"employee_id": None, "code": "invalid_decision",
+                                "error": f"Unknown decision '{decision}'. Use one of {sorted(DECISION_ACTIONS)}."}])
+
+        self.sync()
+        timestamp = datetime.utcnow().isoformat()
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                rows = conn.execute(
+                    f"""
+                    SELECT employee_id FROM results r
+                    WHERE needs_review = 1 AND row_quality_issues = ? AND {_NOT_REVIEWED}
+                    """,
+                    (signature,)
+                ).fetchall()
+
+                error = None
+                if not rows:
+                    error = {"code": "not_found", "error": "No rows awaiting review in this cluster"}
+                elif expected_size is not None and len(rows) != expected_size:
+                    error = {"code": "conflict",
+                             "error": f"Cluster has {len(rows)} rows awaiting review, not {expected_size}"}
+                if error:
+                    conn.rollback()
+                    raise ReviewError([{"employee_id": None, **error}])
+
+                employee_ids = list(dict.fromkeys(row[0] for row in rows))
+                action = DECISION_ACTIONS[decision_name]
+                conn.executemany(
+                    "INSERT OR REPLACE INTO decisions (employee_id, row_quality_issues, decision, "
+                    "resolution_action, review_notes, reviewer, review_timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(employee_id, signature, decision_name, action, review_notes, reviewer, timestamp)
+                     for employee_id in employee_ids]
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        return {
+            "signature": signature,
+            "decision": decision_name,
+            "resolution_action": action,
+            "review_notes": review_notes,
+            "reviewer": reviewer,
+            "review_timestamp": timestamp,
+            "rows": len(rows),
+            "employee_ids": employee_ids,
+        }
+
+    def queue_reasons(self, include_reviewed: bool = False) -> dict:
+        """
+        Resolution_Reason -> number of rows needing review. Rows without
+        a reason are counted under REVIEW_NO_REASON, which queue_page()
+        accepts as a reason filter.
+        """
+        reviewed = "" if include_reviewed else f"AND {_NOT_REVIEWED}"
+        self.sync()
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT resolution_reason, COUNT(*) FROM results r
+                WHERE needs_review = 1 {reviewed}
+                GROUP BY resolution_reason ORDER BY COUNT(*) DESC
+                """
+            ).fetchall()
+            return {REVIEW_NO_REASON if reason is None else reason: count for reason, count in rows}
+        finally:
+            conn.close()
+
+
+#A decision applies to the rows with its Employee_ID and failure signature
+_DECISION_MATCH = "r.employee_id = d.employee_id AND r.row_quality_issues = d.row_quality_issues"
+_NOT_REVIEWED = f"NOT EXISTS (SELECT 1 FROM decisions d WHERE {_DECISION_MATCH})"
+
+#Sort keys of the review queue; missing values sort first (most urgent)
+_SCORE_KEY = "COALESCE(row_quality_score, -1)"
+_CONFIDENCE_KEY = "COALESCE(resolution_confidence, -1)"
+_QUEUE_SORTS = {
+    "score": (_SCORE_KEY, _CONFIDENCE_KEY),
+    "confidence": (_CONFIDENCE_KEY, _SCORE_KEY),
+}
+
+#Partial indexes over the queue rows only: for each sort, one plain,
+#one for the reason filter and one for the failure signature clusters
+_QUEUE_INDEXES = "".join(
+    f"""
+    CREATE INDEX IF NOT EXISTS idx_queue_{sort} ON results({first}, {second}, row_id)
+        WHERE needs_review = 1;
+    CREATE INDEX IF NOT EXISTS idx_queue_reason_{sort} ON results(resolution_reason, {first}, {second}, row_id)
+        WHERE needs_review = 1;
+    CREATE INDEX IF NOT EXISTS idx_queue_signature_{sort} ON results(row_quality_issues, {first}, {second}, row_id)
+        WHERE needs_review = 1;
+    """
+    for sort, (first, second) in _QUEUE_SORTS.items()
+)
+
+
+def _queue_item(row: tuple) -> dict:
+    #Same keys as build_review_queue(), plus the failure signature
+    return {
+        "employee_id": row[0],
+        "current_score": row[1],
+        "Resolution_Action": row[2],
+        "issue_reason": row[3],
+        "Resolution_Confidence": row[4],
+        "Row_Quality_Issues": row[5],
+    }
+
+
+def _sort_value(value) -> float:
+    return -1 if value is None else value
+
+
+def _encode_cursor(sort: str, key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort, *key]).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: str) -> list:
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(decoded, list) or len(decoded) != 4 or decoded[0] != sort:
+        raise ValueError("Invalid cursor (or it belongs to another sort order)")
+    return decoded[1:]
+
+
+#One store for the whole process
+review_store = ReviewStore()
@@ -0,0 +1,57 @@
+from Human_Review.review_decisions import log_review_events
+from Human_Review.review_store import REVIEW_PAGE_SIZE, review_store
+
+def review_clusters(
+        limit: int = REVIEW_PAGE_SIZE,
+        sort: str = "size",
+        include_reviewed: bool = False
+) -> dict:
+    """
+    Groups the rows awaiting review by failure signature: the set of
+    penalties calculate_row_quality_scores() gave them (Row_Quality_Issues).
+    Rows with the same signature failed for the same reasons, so one
+    look at a representative usually settles the whole cluster.
+    Output:
+            {"cluster_count", "rows", "clusters": [{"signature",
+            "penalties", "size", "representative"}, ...]}
+            largest clusters first (sort="size") or lowest score first
+            (sort="score")
+    """
+
+    return review_store.clusters(limit=limit, sort=sort, include_reviewed=include_reviewed)
+
+def record_cluster_decision(
+        signature: str,
+        decision: str,
+        notes: str | None = None,
+        reviewer: str | None = None,
+        expected_size: int | None = None
+) -> dict:
+    """
+    Applies ONE human decision to every row of a cluster still awaiting
+    review, in one transaction, and audits each Employee_ID. Rows of
+    the same Employee_IDs in other clusters are left undecided.
+    Parameters:
+        signature → the cluster's Row_Quality_Issues
+        decision → APPROVE, REJECT, FIX
+        expected_size → the cluster size the reviewer saw; if the
+                        cluster changed since, nothing is applied
+    Raises:
+        ReviewError (code not_found, conflict or invalid_decision)
+    """
+
+    recorded = review_store.record_cluster_decision(
+        signature,
+        decision,
+        review_notes=notes,
+        reviewer=reviewer,
+        expected_size=expected_size
+    )
+
+    cluster = {"cluster_signature": signature, "cluster_rows": recorded["rows"]}
+    log_review_events([
+        (employee_id, recorded, cluster)
+        for employee_id in recorded["employee_ids"]
+    ])
+
+    return recorded
@@ -1,10 +1,9 @@
 import streamlit as st
 import pandas as pd
 import requests
-from pathlib import Path
 
 API_BASE_URL = "http://localhost:8000"
-QUARANTINE_FILE = Path("outputs/quarantine.csv")
+PAGE_SIZE = 50
 
 st.set_page_config(
     page_title="Human Review Dashboard",
@@ -17,13 +16,101 @@ st.write(
     "and approve or reject the automated data quality decision that system makes."
 )
 
-# Loading the quarantined data
+# Clusters: rows with the same failures are reviewed together
 
-if not QUARANTINE_FILE.exists():
-    st.warning("No quarantined data found.")
+if st.checkbox("Group rows by failure signature"):
+    try:
+        response = requests.get(f"{API_BASE_URL}/review/clusters", params={"limit": PAGE_SIZE}, timeout=5)
+        response.raise_for_status()
+        result = response.json()
+    except Exception as e:
+        st.error(f"Failed to load the review clusters: {e}")
+        st.stop()
+
+    if not result["clusters"]:
+        st.success("No rows currentyl require human review")
+        st.stop()
+
+    st.subheader(f"{result['cluster_count']} clusters, {result['rows']} rows pending review")
+
+    clusters = result["clusters"]
+    cluster_index = st.selectbox(
+        "Select a cluster to review: ",
+        range(len(clusters)),
+        format_func=lambda i: f"{clusters[i]['signature'] or 'NO_PENALTY'} ({clusters[i]['size']} rows)"
+    )
+    cluster = clusters[cluster_index]
+
+    st.write("Representative row (lowest quality score in the cluster):")
+    st.json(cluster["representative"])
+
+    notes = st.text_input("Notes (optional)")
+    approve = st.button(f"Approve all {cluster['size']} rows")
+    reject = st.button(f"Reject all {cluster['size']} rows")
+
+    if approve or reject:
+        decision = "APPROVE" if approve else "REJECT"
+        try:
+            response = requests.post(
+                f"{API_BASE_URL}/review/clusters/decision",
+                json={
+                    "signature": cluster["signature"],
+                    "decision": decision,
+                    "review_notes": notes or None,
+                    "reviewer": "human_reviewer",
+                    "expected_size": cluster["size"]
+                },
+                timeout=30
+            )
+            response.raise_for_status()
+            st.success(f"Decision '{decision}' submitted for {response.json()['rows']} row(s).")
+        except Exception as e:
+            st.error(f"Failed to submit decision: {e}")
+
+    st.stop()
+
+# Filters: the queue is paged by the API, most urgent rows first
+
+try:
+    reasons = requests.get(f"{API_BASE_URL}/review/reasons", timeout=5).json()["reasons"]
+except Exception as e:
+    st.error(f"Failed to load the review queue: {e}")
+    st.stop()
+
+filter_col, sort_col = st.columns(2)
+reason = filter_col.selectbox(
+    "Reason",
+    ["All reasons"] + list(reasons),
+    format_func=lambda r: r if r == "All reasons" else f"{r} ({reasons[r]})"
+)
+sort = sort_col.selectbox(
+    "Most urgent first by",
+    ["score", "confidence"],
+    format_func=lambda s: "lowest quality score" if s == "score" else "lowest confidence"
+)
+
+# Cursors of the pages visited so far, reset when the filters change
+filters = (reason, sort)
+if st.session_state.get("filters") != filters:
+    st.session_state.filters = filters
+    st.session_state.cursors = [None]
+
+params = {"limit": PAGE_SIZE, "sort": sort, "cursor": st.session_state.cursors[-1]}
+if reason != "All reasons":
+    params["reason"] = reason
+
+try:
+    response = requests.get(f"{API_BASE_URL}/review/queue", params=params, timeout=5)
+    response.raise_for_status()
+    page = response.json()
+except Exception as e:
+    st.error(f"Failed to load the review queue: {e}")
     st.stop()
 
-df = pd.read_csv(QUARANTINE_FILE)
+if page["total"] is not None:
+    st.session_state.total = page["total"]
+
+df = pd.DataFrame(page["items"])
 
 if df.empty:
     st.success("No rows currentyl require human review")
@@ -31,13 +118,25 @@ if df.empty:
 
 # Rows that require review
 
-st.subheader("Rows Pending Review")
+st.subheader(
+    f"Rows Pending Review — page {len(st.session_state.cursors)} "
+    f"({st.session_state.get('total', '?')} in total)"
+)
 
 st.dataframe(df, use_container_width=True)
 
+previous_col, next_col = st.columns(2)
+if previous_col.button("Previous page", disabled=len(st.session_state.cursors) == 1):
+    st.session_state.cursors.pop()
+    st.rerun()
+if next_col.button("Next page", disabled=page["next_cursor"] is None):
+    st.session_state.cursors.append(page["next_cursor"])
+    st.rerun()
+
 row_index = st.selectbox(
     "Select a row to review: ",
-    df.index.tolist()
+    df.index.tolist(),
+    format_func=lambda i: df.loc[i, "employee_id"]
 )
 
 selected_row = df.loc[row_index]
@@ -52,31 +151,39 @@ st.json(selected_row.to_dict())
 
 st.subheader("Human Decision")
 
+notes = st.text_input("Notes (optional)")
 approve = st.button("Approve (Valid)")
 reject = st.button("Reject (Invalid, will stay quarantined)")
+approve_page = st.button(f"Approve all {len(df)} rows on this page")
 
 # Handling human's decision
 
-if approve or reject:
-    decision = "approve" if approve else "reject"
+if approve or reject or approve_page:
+    decision = "APPROVE" if (approve or approve_page) else "REJECT"
+    rows = df if approve_page else df.loc[[row_index]]
 
     payload = {
-        "row_index": int(row_index),
-        "decision": decision,
-        "reviewer": "human_reviewer"
+        "decisions": [
+            {
+                "employee_id": employee_id,
+                "decision": decision,
+                "review_notes": notes or None,
+                "reviewer": "human_reviewer"
+            }
+            for employee_id in rows["employee_id"]
+        ]
     }
 
     try:
         response = requests.post(
-            f"{API_BASE_URL}/review/decision",
+            f"{API_BASE_URL}/review/decisions",
             json=payload,
             timeout=5
         )
 
         response.raise_for_status()
 
-        st.success(f"Decision '{decision}' submitted successfully.")
+        st.success(f"Decision '{decision}' submitted for {len(rows)} row(s).")
 
     except Exception as e:
         st.error(f"Failed to submit decision: {e}")
-
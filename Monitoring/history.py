@@ -1,19 +1,145 @@
-import pandas as pd
+import csv
+import sqlite3
 from datetime import datetime
 from pathlib import Path
-HISTORY_FILE = Path("outputs/quality_hhistory.csv")
 
-def log_run_metrics(metrics: dict):
+import pandas as pd
+
+#Run history store (SQLite, one table per metric source)
+HISTORY_DB = Path("outputs/quality_history.sqlite")
+
+#Old CSV history, imported once into the store if present
+LEGACY_HISTORY_FILE = Path("outputs/quality_hhistory.csv")
+
+#Columns recorded for each metric source
+METRIC_SCHEMAS = {
+    #/analyze/health
+    "health": {
+        "total_rows": "INTEGER",
+        "usable_rows": "INTEGER",
+        "warning_rows": "INTEGER",
+        "bad_rows": "INTEGER",
+        "average_score": "REAL",
+    },
+    #/monitor/run (Monitoring.metrics.compute_resolution_engine)
+    "resolution": {
+        "total_rows": "INTEGER",
+        "accepted": "INTEGER",
+        "standardized": "INTEGER",
+        "quarantined": "INTEGER",
+        "accept_rate": "REAL",
+        "standardize_rate": "REAL",
+        "quarantine_rate": "REAL",
+    },
+}
+
+def _table(source: str) -> str:
+    if source not in METRIC_SCHEMAS:
+        raise ValueError(f"Unknown metric source '{source}'. Known: {sorted(METRIC_SCHEMAS)}")
+    return f"runs_{source}"
+
+def connect_history_store() -> sqlite3.Connection:
+    HISTORY_DB.parent.mkdir(parents=True, exist_ok=True)
+    new_store = not HISTORY_DB.exists()
+
+    conn = sqlite3.connect(HISTORY_DB, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+    for source, schema in METRIC_SCHEMAS.items():
+        table = _table(source)
+        columns = ", ".join(f"{name} {kind}" for name, kind in schema.items())
+        conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                id INTEGER PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                dataset TEXT,
+                {columns}
+            );
+            CREATE INDEX IF NOT EXISTS idx_{table}_dataset ON {table}(dataset, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_{table}_time ON {table}(timestamp);
+        """)
+
+    if new_store:
+        _import_legacy_csv(conn)
+    return conn
+
+def _import_legacy_csv(conn: sqlite3.Connection):
+    """
+    The CSV history mixed both sources under one header; rows are
+    told apart by their number of values (metrics + timestamp).
+    """
+    if not LEGACY_HISTORY_FILE.exists():
+        return
+
+    by_length = {len(schema) + 1: source for source, schema in METRIC_SCHEMAS.items()}
+    with open(LEGACY_HISTORY_FILE, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+
+    with conn:
+        for row in rows[1:]:
+            source = by_length.get(len(row))
+            if source is None:
+                continue
+            metrics = dict(zip(METRIC_SCHEMAS[source], row[:-1]))
+            _insert(conn, source, metrics, dataset=None, timestamp=row[-1])
+
+def _insert(conn, source: str, metrics: dict, dataset: str | None, timestamp: str):
+    columns = list(METRIC_SCHEMAS[source])
+    conn.execute(
+        f"INSERT INTO {_table(source)} (timestamp, dataset, {', '.join(columns)}) "
+        f"VALUES (?, ?, {', '.join('?' * len(columns))})",
+        [timestamp, dataset] + [metrics[name] for name in columns]
+    )
+
+def log_run_metrics(metrics: dict, source: str = "health", dataset: str | None = None) -> str:
+    """
+    Appends current run metrics to the history store.
+
+    metrics must have exactly the columns of METRIC_SCHEMAS[source].
+    Returns the run's timestamp.
+    """
+    _table(source)
+    expected = set(METRIC_SCHEMAS[source])
+    missing = expected - set(metrics)
+    unknown = set(metrics) - expected
+    if missing or unknown:
+        raise ValueError(
+            f"Metrics do not match the '{source}' schema "
+            f"(missing: {sorted(missing)}, unknown: {sorted(unknown)})"
+        )
+
+    timestamp = datetime.utcnow().isoformat()
+    conn = connect_history_store()
+    try:
+        with conn:
+            _insert(conn, source, metrics, dataset, timestamp)
+    finally:
+        conn.close()
+    return timestamp
+
+def load_history(source: str = "health", dataset: str | None = None, last: int | None = None) -> pd.DataFrame:
     """
-    Appends current run metrics to history file.
+    Loads run history, oldest first. With `last`, only the most recent
+    `last` runs are read (an index range scan, not the whole table).
     """
+    table = _table(source)
+    columns = ["timestamp", "dataset"] + list(METRIC_SCHEMAS[source])
 
-    record = metrics.copy()
-    record["timestamp"] = datetime.utcnow().isoformat()
+    query = f"SELECT {', '.join(columns)} FROM {table}"
+    params = []
+    if dataset is not None:
+        query += " WHERE dataset = ?"
+        params.append(dataset)
+    query += " ORDER BY timestamp DESC, id DESC"
+    if last is not None:
+        query += " LIMIT ?"
+        params.append(int(last))
 
-    df = pd.DataFrame([record])
+    conn = connect_history_store()
+    try:
+        rows = conn.execute(query, params).fetchall()
+    finally:
+        conn.close()
 
-    if HISTORY_FILE.exists():
-        df.to_csv(HISTORY_FILE, mode="a", header=False, index=False)
-    else:
-        df.to_csv(HISTORY_FILE, index=False)
\ No newline at end of file
+    return pd.DataFrame(rows[::-1], columns=columns)
@@ -0,0 +1,167 @@
+import json
+
+import numpy as np
+
+from Monitoring.history import connect_history_store
+from Monitoring.sla import SLA_WINDOW_RULES, evaluate_window_rules, rule_condition
+
+#Smoothing factor of the exponentially weighted moving averages
+EWMA_ALPHA = 0.3
+
+#Runs kept for the rolling bad-row percentage, percentiles and slopes
+ROLLING_WINDOW = 20
+
+#Percentiles reported for the average score
+SCORE_PERCENTILES = (10, 50, 90)
+
+#Metrics followed per run (derived from the /analyze/health metrics)
+TRACKED_METRICS = ("average_score", "bad_rows_pct")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rolling_state (
+    dataset TEXT PRIMARY KEY,
+    updated_at TEXT NOT NULL,
+    state TEXT NOT NULL
+);
+"""
+
+
+def _new_state() -> dict:
+    return {
+        "runs": 0,
+        "ewma": {},
+        #Last ROLLING_WINDOW runs, oldest first
+        "window": [],
+        #Running sums over the window (bad/total rows and least squares)
+        "sums": {"bad_rows": 0, "total_rows": 0, "x": 0.0, "xx": 0.0,
+                 **{f"y_{m}": 0.0 for m in TRACKED_METRICS},
+                 **{f"xy_{m}": 0.0 for m in TRACKED_METRICS}},
+        #Per SLA window rule: did each recent run meet its condition
+        "sla_flags": {},
+    }
+
+
+def _add_to_sums(sums: dict, run: dict, sign: int):
+    x = run["x"]
+    sums["bad_rows"] += sign * run["bad_rows"]
+    sums["total_rows"] += sign * run["total_rows"]
+    sums["x"] += sign * x
+    sums["xx"] += sign * x * x
+    for metric in TRACKED_METRICS:
+        sums[f"y_{metric}"] += sign * run[metric]
+        sums[f"xy_{metric}"] += sign * x * run[metric]
+
+
+def _slope(sums: dict, n: int, metric: str) -> float | None:
+    """
+    Least squares slope (change per run) from the running sums.
+    """
+    denominator = n * sums["xx"] - sums["x"] ** 2
+    if n < 2 or denominator == 0:
+        return None
+    return (n * sums[f"xy_{metric}"] - sums["x"] * sums[f"y_{metric}"]) / denominator
+
+
+def update_state(state: dict, metrics: dict, timestamp: str, rules: list | None = None) -> dict:
+    """
+    Folds one run into the rolling state. Each update costs the same
+    however many runs came before (the window has a fixed size).
+    """
+    rules = SLA_WINDOW_RULES if rules is None else rules
+    total_rows = metrics["total_rows"]
+
+    run = {
+        "x": state["runs"],
+        "timestamp": timestamp,
+        "total_rows": total_rows,
+        "bad_rows": metrics["bad_rows"],
+        "average_score": float(metrics["average_score"]),
+        "bad_rows_pct": metrics["bad_rows"] / total_rows if total_rows else 0.0,
+    }
+
+    #EWMA
+    for metric in TRACKED_METRICS:
+        previous = state["ewma"].get(metric)
+        state["ewma"][metric] = run[metric] if previous is None else (
+            EWMA_ALPHA * run[metric] + (1 - EWMA_ALPHA) * previous
+        )
+
+    #Rolling window and its running sums
+    state["window"].append(run)
+    _add_to_sums(state["sums"], run, +1)
+    if len(state["window"]) > ROLLING_WINDOW:
+        _add_to_sums(state["sums"], state["window"].pop(0), -1)
+    #Once per window, rebuild the sums so float error cannot pile up
+    if state["runs"] % ROLLING_WINDOW == 0:
+        state["sums"] = _new_state()["sums"]
+        for kept in state["window"]:
+            _add_to_sums(state["sums"], kept, +1)
+
+    #SLA rule flags, trimmed to each rule's window
+    for rule in rules:
+        flags = state["sla_flags"].setdefault(rule["name"], [])
+        flags.append(rule_condition(rule, run[rule["metric"]]))
+        del flags[:-rule["window"]]
+
+    state["runs"] += 1
+    return state
+
+
+def summarize_state(state: dict, rules: list | None = None) -> dict:
+    """
+    The rolling aggregates reported with each run.
+    """
+    window = state["window"]
+    sums = state["sums"]
+    n = len(window)
+
+    scores = [run["average_score"] for run in window]
+    percentiles = np.percentile(scores, SCORE_PERCENTILES) if scores else []
+
+    def rounded(value, digits=4):
+        return None if value is None else round(float(value), digits)
+
+    return {
+        "runs": state["runs"],
+        "window_runs": n,
+        "ewma_average_score": rounded(state["ewma"].get("average_score"), 2),
+        "ewma_bad_rows_pct": rounded(state["ewma"].get("bad_rows_pct")),
+        "rolling_bad_rows_pct": rounded(sums["bad_rows"] / sums["total_rows"]) if sums["total_rows"] else None,
+        "average_score_percentiles": {
+            f"p{p}": round(float(value), 2) for p, value in zip(SCORE_PERCENTILES, percentiles)
+        },
+        "average_score_slope": rounded(_slope(sums, n, "average_score")),
+        "bad_rows_pct_slope": rounded(_slope(sums, n, "bad_rows_pct"), 6),
+        "sla": evaluate_window_rules(state["sla_flags"], rules),
+    }
+
+
+def update_rolling_metrics(metrics: dict, timestamp: str, dataset: str | None = None) -> dict:
+    """
+    Updates the persisted rolling state of a dataset with one
+    /analyze/health run and returns the new aggregates.
+
+    Only the dataset's small state row is read and written; the run
+    history itself is not re-read.
+    """
+    key = dataset or ""
+
+    conn = connect_history_store()
+    try:
+        conn.executescript(_SCHEMA)
+        #BEGIN IMMEDIATE: concurrent runs of the same dataset update one after the other
+        conn.execute("BEGIN IMMEDIATE")
+        row = conn.execute("SELECT state FROM rolling_state WHERE dataset = ?", (key,)).fetchone()
+        state = json.loads(row[0]) if row else _new_state()
+
+        update_state(state, metrics, timestamp)
+
+        conn.execute(
+            "INSERT OR REPLACE INTO rolling_state (dataset, updated_at, state) VALUES (?, ?, ?)",
+            (key, timestamp, json.dumps(state))
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    return summarize_state(state)
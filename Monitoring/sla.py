@@ -1,12 +1,44 @@
+#Single run thresholds
+SLA_THRESHOLDS = {
+    "max_bad_rows_pct": 0.05,
+    "min_avg_score": 85,
+}
+
+#Rules over the last `window` runs of a dataset: the rule is breached
+#when its condition held in at least `breaches` of them,
+#e.g. "bad rows > 5% in 3 of the last 5 runs"
+SLA_WINDOW_RULES = [
+    {
+        "name": "BAD_ROWS_PERSISTENTLY_HIGH",
+        "metric": "bad_rows_pct",
+        "op": ">",
+        "threshold": SLA_THRESHOLDS["max_bad_rows_pct"],
+        "breaches": 3,
+        "window": 5,
+    },
+    {
+        "name": "AVERAGE_SCORE_PERSISTENTLY_LOW",
+        "metric": "average_score",
+        "op": "<",
+        "threshold": SLA_THRESHOLDS["min_avg_score"],
+        "breaches": 3,
+        "window": 5,
+    },
+]
+
+_OPERATORS = {
+    ">": lambda value, threshold: value > threshold,
+    ">=": lambda value, threshold: value >= threshold,
+    "<": lambda value, threshold: value < threshold,
+    "<=": lambda value, threshold: value <= threshold,
+}
+
 def evaluate_sla(current_metrics: dict) -> dict:
     """
     Evaluates dataset metrics against SLA thresholds.
     """
 
-    sla = {
-        "max_bad_rows_pct": 0.05,
-        "min_avg_score": 85,
-    }
+    sla = SLA_THRESHOLDS
 
     total_rows = current_metrics["total_rows"]
     bad_pct = current_metrics["bad_rows"] / total_rows
@@ -22,4 +54,39 @@ def evaluate_sla(current_metrics: dict) -> dict:
     return {
         "sla_status": "BREACHED" if violations else "OK",
         "violations": violations,
-    }
\ No newline at end of file
+    }
+
+def rule_condition(rule: dict, value: float) -> bool:
+    """
+    True if one run's value meets the rule's condition.
+    """
+    return _OPERATORS[rule["op"]](value, rule["threshold"])
+
+def evaluate_window_rules(flags: dict, rules: list | None = None) -> dict:
+    """
+    Evaluates the window rules.
+
+    flags maps each rule name to the condition results of the dataset's
+    most recent runs, oldest first (only the last `window` are used).
+    """
+    rules = SLA_WINDOW_RULES if rules is None else rules
+
+    results = []
+    for rule in rules:
+        recent = flags.get(rule["name"], [])[-rule["window"]:]
+        hits = sum(recent)
+        results.append({
+            "name": rule["name"],
+            "description": f"{rule['metric']} {rule['op']} {rule['threshold']} "
+                           f"in {rule['breaches']} of the last {rule['window']} runs",
+            "hits": hits,
+            "runs_considered": len(recent),
+            "breached": hits >= rule["breaches"],
+        })
+
+    violations = [result["name"] for result in results if result["breached"]]
+    return {
+        "sla_status": "BREACHED" if violations else "OK",
+        "violations": violations,
+        "rules": results,
+    }
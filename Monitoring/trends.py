@@ -1,37 +1,23 @@
-import pandas as pd
-from pathlib import Path
+from Monitoring.history import load_history
 
-HISTORY_FILE = Path("outputs/quality_hhistory.csv")
-
-def load_history() -> pd.DataFrame:
-    """
-    Loads historical quality metrics.
-    """
-    if not HISTORY_FILE.exists():
-        return pd.DataFrame
-
-    return pd.read_csv(HISTORY_FILE)
-
-def compute_trends(window: int = 5) -> dict:
+def compute_trends(window: int = 5, dataset: str | None = None) -> dict:
     """
-    Computes trends over the last N runs.
+    Computes trends over the last N runs (only those runs are read).
     """
 
-    df = load_history()
+    recent = load_history("health", dataset=dataset, last=window)
 
-    if len(df) < 2:
+    if len(recent) < 2:
         return {"status": "insufficient_data"}
 
-    recent = df.tail(window)
-
     trends = {
-        "avg_score_trend": recent["average_score"].iloc[-1] - recent["average_score"].iloc[0],
-        "bad_rows_trend": recent["bad_rows"].iloc[-1] - recent["bad_rows"].iloc[0],
-        "warning_rows_trend": recent["warning_rows"].iloc[-1] - recent["warning_rows"].iloc[0],
+        "avg_score_trend": round(float(recent["average_score"].iloc[-1] - recent["average_score"].iloc[0]), 2),
+        "bad_rows_trend": int(recent["bad_rows"].iloc[-1] - recent["bad_rows"].iloc[0]),
+        "warning_rows_trend": int(recent["warning_rows"].iloc[-1] - recent["warning_rows"].iloc[0]),
     }
 
     trends["direction"] = (
         "DEGRADING" if trends["bad_rows_trend"] > 0 else "IMPROVING"
     )
 
-    return trends
\ No newline at end of file
+    return trends
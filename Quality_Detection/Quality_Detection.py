@@ -16,6 +16,9 @@ import numpy as np
 import re
 from datetime import timedelta
 
+from dtype_planner import load_planned_csv
+from tracing import Trace
+
 # ============================================================
 # CONFIGURATION SECTION
 # ============================================================
@@ -44,9 +47,14 @@ Z_SCORE_THRESHOLD = 3              # Used for anomaly detection
 def load_data(path):
     """
     Load the CSV file and normalize key columns so checks work correctly.
+    Low-cardinality text is loaded as categoricals (see dtype_planner.py).
     """
-    df = pd.read_csv(path)
+    return normalize_columns(load_planned_csv(path))
 
+def normalize_columns(df):
+    """
+    Normalizes the columns of a freshly parsed CSV (in place).
+    """
     # Convert Join_Date to datetime; invalid values become NaT
     df["Join_Date"] = pd.to_datetime(df["Join_Date"], errors="coerce")
 
@@ -206,14 +214,27 @@ def run_employee_dq_pipeline(csv_path):
     """
     Runs all data quality checks and returns a unified report.
     """
-    df = load_data(csv_path)
+    trace = Trace("employee_dq")
 
-    return {
-        "schema_errors": schema_validation(df),
-        "missing_values": completeness_checks(df),
-        "accuracy_issues": accuracy_checks(df),
-        "consistency_issues": consistency_checks(df),
-        "timeliness_issues": timeliness_checks(df),
-        "salary_anomalies": anomaly_detection(df, "Salary"),
-        "age_anomalies": anomaly_detection(df, "Age")
+    with trace.stage("load") as span:
+        df = load_data(csv_path)
+        span.rows = len(df)
+
+    checks = {
+        "schema_errors": lambda: schema_validation(df),
+        "missing_values": lambda: completeness_checks(df),
+        "accuracy_issues": lambda: accuracy_checks(df),
+        "consistency_issues": lambda: consistency_checks(df),
+        "timeliness_issues": lambda: timeliness_checks(df),
+        "salary_anomalies": lambda: anomaly_detection(df, "Salary"),
+        "age_anomalies": lambda: anomaly_detection(df, "Age")
     }
+
+    report = {}
+    for name, check in checks.items():
+        with trace.stage(name, rows=len(df)):
+            report[name] = check()
+
+    report["memory"] = df.attrs.get("memory")
+    report["timings"] = trace.finish()
+    return report
@@ -1,4 +1,4 @@
-import pandas as pd
+from columnar_sidecar import load_csv
 from .anomaly_checks import check_anomalies
 
 
@@ -7,7 +7,7 @@ def run_anomaly_checks(csv_path: str):
     Loads data and runs anomaly checks.
     """
 
-    df = pd.read_csv(csv_path)
+    df = load_csv(csv_path)
 
     issues = check_anomalies(df)
 
@@ -1,9 +1,13 @@
 from .schema_pipeline import run_schema_checks
 from .anomaly_pipeline import run_anomaly_checks
 from .scoring import calculate_quality_score
+from tracing import Trace
 
 def run_full_analysis(csv_path: str):
-    schema_result  = run_schema_checks(csv_path)
+    trace = Trace("full_analysis")
+
+    with trace.stage("schema"):
+        schema_result  = run_schema_checks(csv_path)
 
     #stop if schema fails
     if schema_result["status"] == "FAIl":
@@ -13,20 +17,24 @@ def run_full_analysis(csv_path: str):
             "reason": "Schema validation failed",
             "schema": schema_result,
             "anomalies": None,
-            "quality_score": 0
+            "quality_score": 0,
+            "timings": trace.finish()
         }
 
-    anomaly_result = run_anomaly_checks(csv_path)
+    with trace.stage("anomalies"):
+        anomaly_result = run_anomaly_checks(csv_path)
 
-    score = calculate_quality_score(
-        schema_result["issues"],
-        anomaly_result["issues"]
-    )
+    with trace.stage("scoring"):
+        score = calculate_quality_score(
+            schema_result["issues"],
+            anomaly_result["issues"]
+        )
 
     return {
         "tool": "full",
         "status": "PASS" if score >= 70 else "WARN",
         "schema": schema_result,
         "anomalies": anomaly_result,
-        "quality_score": score
+        "quality_score": score,
+        "timings": trace.finish()
     }
\ No newline at end of file
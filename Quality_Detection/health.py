@@ -5,8 +5,20 @@ def classify_dataset_health(df: pd.DataFrame):
     Determines overall dataset health.
     """
 
-    avg_score = df["Row_Quality_Score"].mean()
-    bad_row_pct = (df["Row_Quality_Score"] < 70).mean() * 100
+    return classify_health_totals(
+        rows=len(df),
+        score_sum=int(df["Row_Quality_Score"].sum()),
+        bad_rows=int((df["Row_Quality_Score"] < 70).sum())
+    )
+
+def classify_health_totals(rows: int, score_sum: int, bad_rows: int):
+    """
+    Same as classify_dataset_health, from running totals
+    (used when only appended rows are scored, see incremental_health.py).
+    """
+
+    avg_score = score_sum / rows if rows else float("nan")
+    bad_row_pct = bad_rows / rows * 100 if rows else float("nan")
 
     if avg_score >= 85 and bad_row_pct <= 5:
         status = "GOOD"
@@ -19,5 +31,5 @@ def classify_dataset_health(df: pd.DataFrame):
         "dataset_health": status,
         "average_row_score": round(avg_score, 2),
         "bad_row_percentage": round(bad_row_pct, 2),
-        "rows_analyzed": len(df)
+        "rows_analyzed": rows
     }
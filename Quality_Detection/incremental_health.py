@@ -0,0 +1,469 @@
+"""
+Incremental Dataset Health
+
+Employee feeds are mostly append-only, so re-running /analyze/health on
+the whole file after a few rows were added repeats almost all of the
+work. This module remembers, per dataset, what the last analysis saw:
+
+- the byte offset and row count it stopped at, plus a hash of the start
+  and end of that prefix (to notice when the file was rewritten)
+- the column dtypes pandas inferred, so appended rows parse the same way
+- every Employee_ID with its count and first row (duplicate detection)
+- running totals of the scores and usability statuses (dataset health)
+
+The next incremental run then only parses and scores the bytes after the
+offset, checks their Employee_IDs against the stored keys, appends their
+results to the results file and folds them into the totals. Earlier rows
+whose Employee_ID becomes duplicated by a new row get the DUPLICATE_ID
+penalty in the results file too, so the outcome matches a full run.
+
+Whenever that is not guaranteed (no state yet, the file was rewritten
+or truncated, the results file was overwritten by another analysis, or
+the new rows would change how a column is typed) a full run is done
+instead and the state rebuilt from it.
+"""
+
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from columnar_sidecar import load_csv
+from tracing import Trace
+
+from .Quality_Detection import normalize_columns
+from .health import classify_health_totals
+from .persistence import OUTPUT_PATH, append_quality_results, persist_quality_results
+from .row_scoring import calculate_row_quality_scores, penalty_points, usability_status
+
+# ============================================================
+# CONFIGURATION
+# ============================================================
+
+# State of the last analysis of every dataset
+INCREMENTAL_DB_PATH = Path("outputs/incremental_health.sqlite")
+
+# Bump whenever scoring changes, so older states are rebuilt by a full run
+STATE_VERSION = 1
+
+# Bytes hashed at each end of the analyzed prefix
+PREFIX_CHECK_BYTES = 64 * 1024
+
+# Rows returned as preview
+PREVIEW_ROWS = 10
+
+# Leading Join_Date values kept to parse new dates like the full run did
+DATE_HEAD_VALUES = 10
+
+# Stored key for a missing Employee_ID (duplicated() treats them as equal)
+NULL_KEY = "\x00"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS health_state (
+    dataset TEXT PRIMARY KEY,
+    updated_at TEXT NOT NULL,
+    state TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS health_keys (
+    dataset TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    PRIMARY KEY (dataset, key)
+) WITHOUT ROWID;
+"""
+
+# Keys looked up per query (SQLite's default variable limit is 999)
+_LOOKUP_BATCH = 500
+
+_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    INCREMENTAL_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(INCREMENTAL_DB_PATH, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+# ============================================================
+# FILE SIGNATURES
+# ============================================================
+
+def _prefix_hash(csv_path: str, offset: int) -> str:
+    """
+    Hash of the first and last PREFIX_CHECK_BYTES of the first
+    `offset` bytes of the file.
+    """
+    digest = hashlib.sha256(str(offset).encode())
+    with open(csv_path, "rb") as f:
+        digest.update(f.read(min(offset, PREFIX_CHECK_BYTES)))
+        f.seek(max(offset - PREFIX_CHECK_BYTES, 0))
+        digest.update(f.read(offset - f.tell()))
+    return digest.hexdigest()
+
+
+def _ends_with_newline(csv_path: str, offset: int) -> bool:
+    if offset == 0:
+        return True
+    with open(csv_path, "rb") as f:
+        f.seek(offset - 1)
+        return f.read(1) == b"\n"
+
+
+def _results_signature() -> list | None:
+    try:
+        stat = os.stat(OUTPUT_PATH)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _key_text(ids: pd.Series) -> pd.Series:
+    """
+    Employee_IDs as stored keys (the text form of the parsed value).
+    """
+    return ids.astype(str).where(ids.notna(), NULL_KEY)
+
+
+# ============================================================
+# ANALYSIS
+# ============================================================
+
+def analyze_health_incremental(csv_path: str, trace: Trace | None = None) -> dict:
+    """
+    Dataset health of csv_path, scoring only the rows appended since its
+    last incremental analysis (or every row when that is not possible).
+
+    Returns:
+        mode ("full" or "incremental"), new_rows, total_rows,
+        summary (see classify_dataset_health), counts per usability
+        status, average_score, stored_at and preview
+    """
+    trace = trace or Trace("health")
+    dataset = os.path.abspath(csv_path)
+
+    with _lock:
+        conn = _connect()
+        try:
+            # BEGIN IMMEDIATE: one run per dataset state at a time
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT state FROM health_state WHERE dataset = ?", (dataset,)).fetchone()
+            state = json.loads(row[0]) if row else None
+
+            result = None
+            if state is not None and _can_append(csv_path, state):
+                result = _append_run(conn, dataset, csv_path, state, trace)
+            if result is None:
+                state, result = _full_run(conn, dataset, csv_path, trace)
+
+            if state is None:
+                conn.execute("DELETE FROM health_state WHERE dataset = ?", (dataset,))
+                conn.execute("DELETE FROM health_keys WHERE dataset = ?", (dataset,))
+            else:
+                state["results"] = _results_signature()
+                conn.execute(
+                    "INSERT OR REPLACE INTO health_state (dataset, updated_at, state) VALUES (?, ?, ?)",
+                    (dataset, datetime.utcnow().isoformat(), json.dumps(state, default=str))
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    return result
+
+
+def _can_append(csv_path: str, state: dict) -> bool:
+    """
+    True when the file still starts with the bytes analyzed last time
+    and the results file is still the one written by that analysis.
+    """
+    size = os.path.getsize(csv_path)
+    return (
+        state["version"] == STATE_VERSION
+        and state["results"] == _results_signature()
+        and size >= state["offset"]
+        and (size == state["offset"] or state["ends_with_newline"])
+        and _prefix_hash(csv_path, state["offset"]) == state["prefix_hash"]
+    )
+
+
+def _summarize(mode: str, new_rows: int, state: dict) -> dict:
+    counts = state["status_counts"]
+    rows = state["rows"]
+    return {
+        "mode": mode,
+        "new_rows": new_rows,
+        "total_rows": rows,
+        "summary": classify_health_totals(rows, state["score_sum"], counts["BAD"]),
+        "counts": dict(counts),
+        "average_score": round(state["score_sum"] / rows, 2) if rows else float("nan"),
+        "stored_at": OUTPUT_PATH,
+        "preview": state["preview"],
+    }
+
+
+def _preview(df: pd.DataFrame) -> list[dict]:
+    return df[
+        ["Employee_ID", "Row_Quality_Score", "Row_Usability_Status"]
+    ].head(PREVIEW_ROWS).to_dict(orient="records")
+
+
+def _add_totals(state: dict, df: pd.DataFrame):
+    state["score_sum"] += int(df["Row_Quality_Score"].sum())
+    for status, count in df["Row_Usability_Status"].value_counts().items():
+        state["status_counts"][status] += int(count)
+
+
+def _full_run(conn: sqlite3.Connection, dataset: str, csv_path: str, trace: Trace) -> tuple:
+    """
+    Scores every row and rebuilds the dataset's state.
+    Returns (state, result); state is None if the file changed while
+    it was being read (nothing is remembered then).
+    """
+    before = os.stat(csv_path)
+
+    with trace.stage("load") as span:
+        raw = load_csv(csv_path)
+        dtypes = raw.dtypes.astype(str).to_dict()
+        date_head = raw["Join_Date"].dropna().head(DATE_HEAD_VALUES).tolist()
+        df = normalize_columns(raw)
+        span.rows = len(df)
+
+    with trace.stage("scoring", rows=len(df)):
+        df = calculate_row_quality_scores(df)
+
+    with trace.stage("persistence", rows=len(df)):
+        persist_quality_results(df)
+
+    state = {
+        "version": STATE_VERSION,
+        "offset": before.st_size,
+        "ends_with_newline": _ends_with_newline(csv_path, before.st_size),
+        "prefix_hash": _prefix_hash(csv_path, before.st_size),
+        "rows": len(df),
+        "columns": list(raw.columns),
+        "dtypes": dtypes,
+        "date_head": date_head,
+        "penalties": penalty_points(df),
+        "score_sum": 0,
+        "status_counts": {"GOOD": 0, "WARNING": 0, "BAD": 0},
+        "preview": _preview(df),
+    }
+    _add_totals(state, df)
+    result = _summarize("full", len(df), state)
+
+    after = os.stat(csv_path)
+    if (after.st_size, after.st_mtime_ns) != (before.st_size, before.st_mtime_ns):
+        return None, result
+
+    with trace.stage("incremental_state", rows=len(df)):
+        keys = _key_text(df["Employee_ID"])
+        first = ~keys.duplicated()
+        counts = keys.map(keys.value_counts())[first]
+
+        conn.execute("DELETE FROM health_keys WHERE dataset = ?", (dataset,))
+        conn.executemany(
+            "INSERT INTO health_keys (dataset, key, count, position) VALUES (?, ?, ?, ?)",
+            zip([dataset] * len(counts), keys[first], counts.tolist(), np.flatnonzero(first).tolist())
+        )
+
+    return state, result
+
+
+def _read_appended(csv_path: str, state: dict) -> tuple | None:
+    """
+    Parses the bytes after the stored offset like load_data() would
+    have parsed them as part of the whole file.
+    Returns (DataFrame, bytes read), or None if these rows would make
+    pandas type a column differently than last time.
+    """
+    with open(csv_path, "rb") as f:
+        f.seek(state["offset"])
+        data = f.read()
+
+    columns = state["columns"]
+    dtypes = state["dtypes"]
+
+    # Text columns are read as text; numeric ones are inferred and
+    # must come out as they did for the whole file
+    text_dtypes = {
+        column: dtype for column, dtype in dtypes.items()
+        if not pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(dtype))
+    }
+    try:
+        df = pd.read_csv(io.BytesIO(data), header=None, names=columns, dtype=text_dtypes, index_col=False)
+    except pd.errors.EmptyDataError:
+        df = pd.DataFrame({column: pd.Series(dtype=dtype) for column, dtype in dtypes.items()})
+    except (pd.errors.ParserError, ValueError, TypeError):
+        return None
+
+    for column, dtype in dtypes.items():
+        if column in text_dtypes or str(df[column].dtype) == dtype:
+            continue
+        if dtype == "float64" and str(df[column].dtype) == "int64":
+            df[column] = df[column].astype("float64")
+            continue
+        return None
+
+    # pd.to_datetime() picks the date format from the first value, so
+    # parse the new dates behind the first ones of the file
+    head = pd.Series(state["date_head"], dtype=df["Join_Date"].dtype)
+    dates = pd.to_datetime(pd.concat([head, df["Join_Date"]], ignore_index=True), errors="coerce")
+
+    df = normalize_columns(df)
+    df["Join_Date"] = dates.iloc[len(head):].to_numpy()
+
+    return df, len(data)
+
+
+def _stored_keys(conn: sqlite3.Connection, dataset: str, keys: list) -> dict:
+    """
+    key -> (count, position) for the keys already stored.
+    """
+    stored = {}
+    for start in range(0, len(keys), _LOOKUP_BATCH):
+        batch = keys[start:start + _LOOKUP_BATCH]
+        marks = ", ".join("?" for _ in batch)
+        for key, count, position in conn.execute(
+            f"SELECT key, count, position FROM health_keys WHERE dataset = ? AND key IN ({marks})",
+            [dataset, *batch]
+        ):
+            stored[key] = (count, position)
+    return stored
+
+
+def _penalize_rows(rows: list[list[str]], columns: list[str], positions: list[int], state: dict) -> list[list[str]]:
+    """
+    Adds the DUPLICATE_ID penalty to results rows (lists of field text)
+    and updates the totals and the preview accordingly.
+    """
+    points = state["penalties"]["DUPLICATE_ID"]
+    order = list(state["penalties"])
+    score, status, stamp = (columns.index(name) for name in
+                            ("Row_Quality_Score", "Row_Usability_Status", "Analysis_Timestamp"))
+    issues = columns.index("Row_Quality_Issues") if "Row_Quality_Issues" in columns else None
+
+    # score = max(100 - penalties, 0), so one more penalty is max(score - points, 0)
+    old_scores = np.array([int(row[score]) for row in rows], dtype=np.int64)
+    new_scores = np.maximum(old_scores - points, 0)
+    new_status = usability_status(new_scores)
+    timestamp = str(datetime.utcnow())
+
+    state["score_sum"] += int(new_scores.sum() - old_scores.sum())
+    for row, position, new_score, new in zip(rows, positions, new_scores, new_status):
+        state["status_counts"][row[status]] -= 1
+        state["status_counts"][new] += 1
+
+        row[score] = str(new_score)
+        row[status] = str(new)
+        row[stamp] = timestamp
+        if issues is not None:
+            names = set(filter(None, row[issues].split("|"))) | {"DUPLICATE_ID"}
+            row[issues] = "|".join(sorted(names, key=order.index))
+
+        if position < len(state["preview"]):
+            state["preview"][position]["Row_Quality_Score"] = int(new_score)
+            state["preview"][position]["Row_Usability_Status"] = str(new)
+
+    return rows
+
+
+def _mark_duplicates(positions: list[int], state: dict):
+    """
+    Applies the DUPLICATE_ID penalty to earlier rows (by position) of
+    the results file. Only those lines are rewritten as text; the bytes
+    around them are copied as they are.
+    """
+    raw = Path(OUTPUT_PATH).read_bytes()
+    ends = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == ord("\n"))
+
+    # Quoted values may hold commas or line breaks: use the CSV parser
+    if b'"' in raw or len(ends) != state["rows"] + 1:
+        results = pd.read_csv(OUTPUT_PATH, dtype=str, keep_default_na=False)
+        rows = [list(row) for row in results.iloc[positions].itertuples(index=False)]
+        results.iloc[positions] = _penalize_rows(rows, list(results.columns), positions, state)
+        results.to_csv(OUTPUT_PATH, index=False)
+        return
+
+    # Line 0 is the header, row p is the line between ends[p] and ends[p + 1]
+    columns = raw[:ends[0]].decode().split(",")
+    rows = [raw[ends[p] + 1:ends[p + 1]].decode().split(",") for p in positions]
+    rows = _penalize_rows(rows, columns, positions, state)
+
+    pieces, copied = [], 0
+    for position, row in zip(positions, rows):
+        pieces += [raw[copied:ends[position] + 1], ",".join(row).encode()]
+        copied = ends[position + 1]
+    pieces.append(raw[copied:])
+
+    with open(OUTPUT_PATH, "wb") as f:
+        f.writelines(pieces)
+
+
+def _append_run(conn: sqlite3.Connection, dataset: str, csv_path: str, state: dict, trace: Trace) -> dict | None:
+    """
+    Scores the rows appended since the last run and folds them into the
+    state (updated in place). Returns None if a full run is needed.
+    """
+    if os.path.getsize(csv_path) == state["offset"]:
+        return _summarize("incremental", 0, state)
+
+    with trace.stage("load") as span:
+        appended = _read_appended(csv_path, state)
+        if appended is None:
+            return None
+        df, read_bytes = appended
+        span.rows = len(df)
+
+    with trace.stage("duplicates", rows=len(df)):
+        keys = _key_text(df["Employee_ID"])
+        new_counts = keys.value_counts()
+        stored = _stored_keys(conn, dataset, new_counts.index.tolist())
+
+        earlier = keys.map({key: count for key, (count, _) in stored.items()}).fillna(0)
+        duplicate_ids = (earlier + keys.map(new_counts)).to_numpy() > 1
+
+        # Rows that were unique until now become duplicates
+        newly_duplicated = sorted(position for count, position in stored.values() if count == 1)
+
+    with trace.stage("scoring", rows=len(df)):
+        df = calculate_row_quality_scores(df, duplicate_ids=duplicate_ids)
+
+    with trace.stage("persistence", rows=len(df)):
+        if newly_duplicated:
+            _mark_duplicates(newly_duplicated, state)
+        if len(df):
+            append_quality_results(df)
+
+    with trace.stage("incremental_state", rows=len(df)):
+        first = ~keys.duplicated()
+        conn.executemany(
+            "INSERT INTO health_keys (dataset, key, count, position) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (dataset, key) DO UPDATE SET count = count + excluded.count",
+            zip(
+                [dataset] * int(first.sum()),
+                keys[first],
+                keys[first].map(new_counts).tolist(),
+                (np.flatnonzero(first) + state["rows"]).tolist()
+            )
+        )
+
+        if len(state["preview"]) < PREVIEW_ROWS:
+            state["preview"] += _preview(df)[:PREVIEW_ROWS - len(state["preview"])]
+        _add_totals(state, df)
+        state["rows"] += len(df)
+        state["offset"] += read_bytes
+        state["ends_with_newline"] = _ends_with_newline(csv_path, state["offset"])
+        state["prefix_hash"] = _prefix_hash(csv_path, state["offset"])
+
+    return _summarize("incremental", len(df), state)
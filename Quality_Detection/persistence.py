@@ -4,9 +4,7 @@ import os
 
 OUTPUT_PATH = "outputs/quality_results.csv"
 
-def persist_quality_results(df: pd.DataFrame):
-    os.makedirs("outputs", exist_ok=True)
-
+def _results_frame(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     df["Analysis_Timestamp"] = datetime.utcnow()
 
@@ -17,10 +15,45 @@ def persist_quality_results(df: pd.DataFrame):
         "Analysis_Timestamp"
     ]
 
-    df[columns_to_save].to_csv(
+    # Failure signature, used to group rows for human review
+    if "Row_Quality_Issues" in df.columns:
+        columns_to_save.append("Row_Quality_Issues")
+
+    # Resolution outcome (written by /monitor/run), used to pick rows for human review
+    for column in ("Resolution_Action", "Resolution_Reason", "Resolution_Confidence"):
+        if column in df.columns:
+            columns_to_save.append(column)
+
+    return df[columns_to_save]
+
+def persist_quality_results(df: pd.DataFrame):
+    os.makedirs("outputs", exist_ok=True)
+
+    _results_frame(df).to_csv(
         OUTPUT_PATH,
         mode='w',
         index=False
     )
 
-    return OUTPUT_PATH
\ No newline at end of file
+    return OUTPUT_PATH
+
+def append_quality_results(df: pd.DataFrame):
+    """
+    Appends the results of newly scored rows to the results file
+    written by persist_quality_results (same columns, no header).
+    """
+    _results_frame(df).to_csv(
+        OUTPUT_PATH,
+        mode='a',
+        header=False,
+        index=False
+    )
+
+    return OUTPUT_PATH
+
+def persist_resolution_results(cleaned_df: pd.DataFrame, quarantined_df: pd.DataFrame):
+    """
+    Rewrites the results file with the rows of a resolution run, so the
+    review queue sees their Resolution_Action/Reason/Confidence.
+    """
+    return persist_quality_results(pd.concat([cleaned_df, quarantined_df], ignore_index=True))
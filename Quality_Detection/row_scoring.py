@@ -1,72 +1,151 @@
+import numpy as np
 import pandas as pd
 
+from integrations.ssn_client import validate_ssns_via_mcp
 
-def calculate_row_quality_scores(df: pd.DataFrame):
+REQUIRED_FIELDS = ["Employee_ID", "First_Name", "Last_Name", "Email", "Department_Region"]
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """
+    String view of a column that matches str(value) for every non-null cell.
+    Nulls are left as "" so callers must handle them with isna() first.
+    """
+    return series.astype(object).where(series.notna(), "").astype(str)
+
+
+def _blank_mask(series: pd.Series) -> np.ndarray:
+    """
+    True where the value is null or only whitespace.
+    """
+    return (series.isna() | (_as_text(series).str.strip() == "")).to_numpy()
+
+
+def _invalid_ssn_mask(series: pd.Series) -> np.ndarray:
+    """
+    True where an SSN is null or a non-blank value fails validation.
+    Distinct SSNs are validated in batches (see integrations.ssn_client)
+    and the verdicts are mapped back onto the column.
+    """
+    # Same normalization as integrations.ssn_client.normalize_ssn
+    ssn_text = _as_text(series).str.strip()
+    to_check = (ssn_text != "").to_numpy()
+
+    verdicts = validate_ssns_via_mcp(pd.unique(ssn_text[to_check]))
+    valid = ssn_text.map(verdicts).fillna(False).to_numpy(dtype=bool)
+
+    # str(NaN) == "nan" never validates, so nulls are always penalized
+    return series.isna().to_numpy() | (to_check & ~valid)
+
+
+def _penalty_flags(df: pd.DataFrame, duplicate_ids: np.ndarray | None = None) -> list[tuple[str, int, np.ndarray]]:
+    """
+    (name, points, mask) for every penalty that applies to this
+    dataset, mask being True on the rows it hits.
+    """
+    flags = []
+
+    # Missing required fields
+    for col in REQUIRED_FIELDS:
+        flags.append((f"MISSING_{col.upper()}", 25, _blank_mask(df[col])))
+
+    # Invalid email
+    email = df["Email"]
+    missing_at = email.notna() & ~_as_text(email).str.contains("@", regex=False)
+    flags.append(("INVALID_EMAIL", 20, missing_at.to_numpy()))
+
+    #Important Fields
+    if "Age" in df.columns:
+        flags.append(("MISSING_AGE", 10, df["Age"].isna().to_numpy()))
+
+    if "Join_Date" in df.columns:
+        flags.append(("MISSING_JOIN_DATE", 10, df["Join_Date"].isna().to_numpy()))
+
+    # Invalid phone (str(NaN) == "nan" is not digits either)
+    if "Phone" in df.columns:
+        phone = _as_text(df["Phone"])
+        bad_phone = df["Phone"].isna() | ((phone != "") & ~phone.str.isdigit())
+        flags.append(("INVALID_PHONE", 15, bad_phone.to_numpy()))
+
+    #Invalid Salary
+    if "Salary" in df.columns:
+        flags.append(("MISSING_SALARY", 5, df["Salary"].isna().to_numpy()))
+
+    # Duplicate primary key (positional, so it is safe for any index)
+    if duplicate_ids is None:
+        duplicate_ids = df["Employee_ID"].duplicated(keep=False).to_numpy()
+    flags.append(("DUPLICATE_ID", 30, duplicate_ids))
+
+    # SSN validation
+    if "SSN" in df.columns:
+        flags.append(("INVALID_SSN", 40, _invalid_ssn_mask(df["SSN"])))
+
+    return flags
+
+
+def _issue_signatures(flags: list[tuple[str, int, np.ndarray]], rows: int) -> np.ndarray:
     """
-    Adds Row_Quality_Score and Row_Usability_Status columns.
+    "|"-joined names of the penalties each row got ("" for none).
+    Rows are first reduced to a bit pattern, so only the few distinct
+    patterns are turned into strings.
     """
+    codes = np.zeros(rows, dtype=np.int64)
+    for bit, (_, _, mask) in enumerate(flags):
+        codes |= mask.astype(np.int64) << bit
 
-    scores = []
+    unique, inverse = np.unique(codes, return_inverse=True)
+    names = [name for name, _, _ in flags]
+    labels = np.array(
+        ["|".join(name for bit, name in enumerate(names) if code >> bit & 1) for code in unique],
+        dtype=object
+    )
+    return labels[inverse]
 
-    duplicate_ids = df["Employee_ID"].duplicated(keep=False)
 
-    for idx, row in df.iterrows():
-        score = 100
+def penalty_points(df: pd.DataFrame) -> dict[str, int]:
+    """
+    Points of every penalty that applies to a dataset with df's columns,
+    in the order they appear in Row_Quality_Issues.
+    """
+    return {name: points for name, points, _ in _penalty_flags(df.iloc[:0])}
 
-        # Missing required fields
-        for col in ["Employee_ID", "First_Name", "Last_Name", "Email", "Department_Region"]:
-            if pd.isna(row[col]) or str(row[col]).strip() == "":
-                score -= 25
 
-        # Invalid email
-        if not pd.isna(row["Email"]) and "@" not in str(row["Email"]):
-            score -= 20
+def usability_status(scores: np.ndarray) -> np.ndarray:
+    """
+    GOOD / WARNING / BAD for each row quality score.
+    """
+    return np.select(
+        [scores >= 85, scores >= 70],
+        ["GOOD", "WARNING"],
+        default="BAD"
+    )
 
-        #Important Fields
-        if "Age" in df.columns:
-            if pd.isna(row["Age"]):
-                score -= 10
 
-        if "Join_Date" in df.columns:
-            if pd.isna(row["Join_Date"]):
-                score -= 10
+def calculate_row_quality_scores(df: pd.DataFrame, duplicate_ids: np.ndarray | None = None):
+    """
+    Adds Row_Quality_Score, Row_Usability_Status and Row_Quality_Issues
+    (the penalties the row got, e.g. "MISSING_AGE|INVALID_PHONE") columns.
 
-        # Invalid phone
-        if "Phone" in df.columns:
-            phone = str(row["Phone"])
-            if phone and not phone.isdigit():
-                score -= 15
-        #Invalid Salary
-        if "Salary" in df.columns:
-            if pd.isna(row["Salary"]):
-                score -= 5
+    Every penalty is evaluated for a whole column at once and summed
+    into a score array, so cost does not involve a Python loop per row.
 
-        # Duplicate primary key
-        if duplicate_ids.iloc[idx]:
-            score -= 30
+    duplicate_ids replaces the in-frame duplicate Employee_ID check, for
+    rows scored against keys outside df (see incremental_health.py).
+    """
 
-        from integrations.ssn_client import validate_ssn_via_mcp
-        # SSN validation
-        if "SSN" in df.columns:
-            ssn = str(row["SSN"])
-            if ssn.strip() != "":
-                if not validate_ssn_via_mcp(ssn):
-                    score -= 40
+    flags = _penalty_flags(df, duplicate_ids)
 
-        scores.append(max(score, 0))
+    penalties = np.zeros(len(df), dtype=np.int64)
+    for _, points, mask in flags:
+        penalties += np.where(mask, points, 0)
 
-    df["Row_Quality_Score"] = scores
+    df["Row_Quality_Score"] = np.maximum(100 - penalties, 0)
 
     # -----------------------------
     # Usability classification
     # -----------------------------
-    def classify(score):
-        if score >= 85:
-            return "GOOD"
-        elif score >= 70:
-            return "WARNING"
-        return "BAD"
-
-    df["Row_Usability_Status"] = df["Row_Quality_Score"].apply(classify)
+    df["Row_Usability_Status"] = usability_status(df["Row_Quality_Score"].to_numpy())
+
+    df["Row_Quality_Issues"] = _issue_signatures(flags, len(df))
 
     return df
@@ -1,4 +1,4 @@
-import pandas as pd
+from columnar_sidecar import load_csv
 from .schema_checks import check_schema
 
 
@@ -7,7 +7,7 @@ def run_schema_checks(csv_path: str):
     Loads data and runs schema checks.
     """
 
-    df = pd.read_csv(csv_path)
+    df = load_csv(csv_path)
 
     issues = check_schema(df)
 
@@ -1,52 +1,116 @@
+import numpy as np
 import pandas as pd
 
+DEFAULT_KEYS = ("Employee_ID",)
+SCORE_COLUMN = "Row_Quality_Score"
+DATE_COLUMN = "HireDate"
+
+
+def _ranking_keys(df: pd.DataFrame, score_col: str, date_col: str) -> list:
+    """
+    np.lexsort keys (least significant first) ordering rows from best
+    to worst candidate: highest quality score, then most complete row,
+    then earliest hire date. lexsort is stable, so remaining ties keep
+    their original order (first occurrence wins).
+    """
+    sort_keys = []
+
+    #If still tie, earliest hire date (missing dates last)
+    if date_col in df.columns:
+        dates = pd.to_datetime(df[date_col], errors="coerce").to_numpy(dtype="datetime64[ns]").astype(np.int64)
+        dates = np.where(dates == np.iinfo(np.int64).min, np.iinfo(np.int64).max, dates)
+        sort_keys.append(dates)
+
+    #If tie, most complete row
+    non_null_count = np.zeros(len(df), dtype=np.int32)
+    for col in df.columns:
+        non_null_count += df[col].notna().to_numpy()
+    sort_keys.append(-non_null_count)
+
+    #Highest quality score wins (missing scores last)
+    if score_col in df.columns:
+        scores = pd.to_numeric(df[score_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        sort_keys.append(-np.nan_to_num(scores, nan=-np.inf))
+
+    return sort_keys
+
+
+def rank_records(df: pd.DataFrame, score_col: str = SCORE_COLUMN, date_col: str = DATE_COLUMN) -> np.ndarray:
+    """
+    Positions of the rows from best to worst candidate.
+    """
+    return np.lexsort(_ranking_keys(df, score_col, date_col))
+
+
 def select_best_record(group: pd.DataFrame) -> pd.Series:
     """
     Selects the best record from a duplicate group.
     """
+    return group.iloc[rank_records(group)[0]]
 
-    #Highest quality score wins
-    best = group.sort_values(
-        by=["Row_Quality_Score"],
-        ascending=False
-    )
 
-    #If tie, most complete row
-    best["non_null_count"] = best.notna().sum(axis=1)
-    best = best.sort_values(
-        by=["Row_Quality_Score", "non_null_count"],
-        ascending=False
-    )
-
-    #If still tie, earliest hire date
-    if "HireDate" in best.columns:
-        best = best.sort_values(
-            by="HireDate",
-            ascending=True,
-            na_position="last"
-        )
-
-    return best.iloc
+def _group_codes(df: pd.DataFrame, keys: list) -> np.ndarray:
+    """
+    One integer per row identifying its key. Rows with a missing key
+    part get a code of their own, so they are never merged.
+    """
+    codes = df.groupby(keys, sort=False, dropna=False).ngroup().to_numpy()
+    missing = df[keys].isna().any(axis=1).to_numpy()
+    if missing.any():
+        codes = codes.copy()
+        codes[missing] = codes.max() + 1 + np.arange(int(missing.sum()))
+    return codes
 
-def deduplicate_by_employee_id(df: pd.DataFrame):
+
+def deduplicate(df: pd.DataFrame, keys=DEFAULT_KEYS,
+                score_col: str = SCORE_COLUMN, date_col: str = DATE_COLUMN):
     """
-    Deduplicates records with the same Employee_ID.
+    Keeps the best record for every key (one or more columns).
+
+    Returns:
+        - winners: one row per key, in original order, original index
+        - losers: the other rows of each duplicate group, in original
+          order, original index, plus a Duplicate_Of column holding the
+          index label of the row that won
     """
+    keys = [keys] if isinstance(keys, str) else list(keys)
+
+    if len(df) == 0:
+        losers = df.iloc[:0].copy()
+        losers["Duplicate_Of"] = pd.Series(dtype=object)
+        return df.copy(), losers
+
+    codes = _group_codes(df, keys)
 
-    deduped_rows = []
-    removed_rows = []
+    # Rows with a unique key win outright; only rows in duplicate
+    # groups need ranking
+    in_duplicate_group = np.bincount(codes)[codes] > 1
+    candidates = np.flatnonzero(in_duplicate_group)
 
-    for emp_id, group in df.groupby("Employee_ID"):
-        if len(group):
-            deduped_rows.append(group.iloc[0])
-        else:
-            winner = select_best_record(group)
-            deduped_rows.append(winner)
+    # One sort over all candidates: group first, best candidate first
+    sort_keys = _ranking_keys(df.iloc[candidates], score_col, date_col)
+    order = candidates[np.lexsort(sort_keys + [codes[candidates]])]
 
-            losers = group.drop(winner.name)
-            removed_rows.append(losers)
+    sorted_codes = codes[order]
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = sorted_codes[1:] != sorted_codes[:-1]
 
-    deduped_df = pd.DataFrame(deduped_rows)
-    removed_df = pd.concat(removed_rows) if removed_rows else pd.DataFrame
+    winner_positions = np.concatenate([np.flatnonzero(~in_duplicate_group), order[is_first]])
+    loser_positions = np.sort(order[~is_first])
 
-    return deduped_df, removed_df
\ No newline at end of file
+    # Map every loser to its group's winner
+    winner_of_code = np.empty(codes.max() + 1, dtype=np.int64)
+    winner_of_code[codes[winner_positions]] = winner_positions
+
+    winners = df.iloc[np.sort(winner_positions)].copy()
+    losers = df.iloc[loser_positions].copy()
+    losers["Duplicate_Of"] = df.index.to_numpy()[winner_of_code[codes[loser_positions]]]
+
+    return winners, losers
+
+
+def deduplicate_by_employee_id(df: pd.DataFrame):
+    """
+    Deduplicates records with the same Employee_ID.
+    """
+    return deduplicate(df, keys=["Employee_ID"])
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 from Resolution_Strategy.rules import RESOLUTION_RULES
 from Resolution_Strategy.standardization import apply_standardization
@@ -5,6 +6,21 @@ from Resolution_Strategy.deduplication import deduplicate_by_employee_id
 from Resolution_Strategy.quarantine import quarantine_rows
 from Audit.audit_log import log_event
 
+# WARNING rows at or above this score are standardized, the rest are
+# quarantined (override with a "STANDARDIZE_MIN_SCORE" entry in the rules)
+DEFAULT_STANDARDIZE_MIN_SCORE = 70
+
+# Action, reason and confidence of each decision of _decide_actions(),
+# in the same order as its conditions (the last one is the default).
+# Rows under the review confidence threshold go to human review.
+DECISION_OUTCOMES = [
+    ("QUARANTINE", "Unusable row", 0.95),
+    ("STANDARDIZE", "Minor data quality issues", 0.7),
+    ("QUARANTINE", "Low data quality score", 0.9),
+    ("ACCEPT", "Meets all quality thresholds", 0.99),
+    ("QUARANTINE", "Unknown usability status", 0.5),
+]
+
 class ResolutionEngine:
     """
     Orchestrates the resolution phase of the data quality pipeline.
@@ -26,6 +42,12 @@ class ResolutionEngine:
         """
         Main entry point for resolving a dataset.
 
+        Every row gets its action in one vectorized pass, then each
+        partition is handled in bulk:
+            - ACCEPT rows are kept as-is
+            - STANDARDIZE rows go through apply_standardization() once
+            - QUARANTINE rows get their quarantine metadata in one call
+
         Returns:
             - cleaned_df: rows safe to use
             - quarantined_df: rows isolated for manual review
@@ -34,67 +56,64 @@ class ResolutionEngine:
         print("Incoming columns:", df.columns.tolist())
         print(df[["Row_Quality_Score", "Row_Usability_Status"]].head())
 
-        quarantined_rows = []
-
         before = len(df)
         df = deduplicate_by_employee_id(df)[0]
         after = len(df)
         print(f"Dedup: {before} → {after}")
 
-        resolved_rows = []
-
-        df = df.copy()
-        df["Resolution_Action"] = None
-
-        for _, row in df.iterrows():
-            decision = self._decide_action(row)
-            print(row["Employee_ID"], row["Row_Usability_Status"], row["Row_Quality_Score"], "→", decision)
+        df = df.reset_index(drop=True)
+        actions, reasons, confidences = self._decide_actions(df)
+        df["Resolution_Action"] = actions
+        df["Resolution_Reason"] = reasons
+        df["Resolution_Confidence"] = confidences
 
-            if decision == "ACCEPT":
-                row["Resolution_Action"] = "ACCEPT"
-                resolved_rows.append(row.to_dict())
+        accept_mask = actions == "ACCEPT"
+        standardize_mask = actions == "STANDARDIZE"
+        quarantine_mask = actions == "QUARANTINE"
 
-            elif decision == "STANDARDIZE":
-                standardized = apply_standardization(row)
-                standardized["Resolution_Action"] = "STANDARDIZE"
-                resolved_rows.append(standardized.to_dict())
+        # Cleaned rows keep their original order, with the
+        # STANDARDIZE ones replaced by their standardized version
+        parts = [df[accept_mask]]
+        if standardize_mask.any():
+            parts.append(apply_standardization(df[standardize_mask]))
+        cleaned_df = pd.concat(parts).sort_index().reset_index(drop=True)
 
-            elif decision == "QUARANTINE":
-                quarantined = quarantine_rows(row, reason="Row failed quality thresholds")
-                quarantined["Resolution_Action"] = "QUARANTINE"
-                quarantined_rows.append(quarantined.to_dict())
+        quarantined_df = quarantine_rows(
+            df[quarantine_mask],
+            reason="Row failed quality thresholds"
+        ).reset_index(drop=True)
 
-        cleaned_df = pd.DataFrame(resolved_rows)
         print(cleaned_df.columns.tolist())
-        if "Resolution_Action" in cleaned_df.columns:
+        if len(cleaned_df):
             print(cleaned_df["Resolution_Action"].value_counts())
         else:
             print("No resolved rows")
-        quarantined_df = pd.DataFrame(quarantined_rows)
 
         return cleaned_df, quarantined_df
 
-    def _decide_action(self, row: pd.Series) -> str:
+    def _decide_actions(self, df: pd.DataFrame) -> tuple:
         """
-        Determines what should happen to a single row.
+        Determines what should happen to every row at once.
+        Returns (actions, reasons, confidences), see DECISION_OUTCOMES.
         """
 
-        score = row["Row_Quality_Score"]
-        status = str(row["Row_Usability_Status"]).upper()
-
-        # Bad rows always quarantined
-        if status == "BAD":
-            return "QUARANTINE"
-
-        # Warning rows may be standardized
-        if status == "WARNING":
-            if score >= self.rules["STANDARDIZE_MIN_SCORE"]:
-                return "STANDARDIZE"
-            return "QUARANTINE"
-
-        # Good rows are accepted
-        if status == "GOOD":
-            return "ACCEPT"
-
-        return "QUARANTINE"
-
+        score = df["Row_Quality_Score"].to_numpy()
+        status = df["Row_Usability_Status"].astype(str).str.upper().to_numpy()
+        min_score = self.rules.get("STANDARDIZE_MIN_SCORE", DEFAULT_STANDARDIZE_MIN_SCORE)
+
+        conditions = [
+            # Bad rows always quarantined
+            status == "BAD",
+            # Warning rows may be standardized
+            (status == "WARNING") & (score >= min_score),
+            status == "WARNING",
+            # Good rows are accepted
+            status == "GOOD",
+        ]
+        actions, reasons, confidences = zip(*DECISION_OUTCOMES)
+
+        return (
+            np.select(conditions, actions[:-1], default=actions[-1]).astype(object),
+            np.select(conditions, reasons[:-1], default=reasons[-1]).astype(object),
+            np.select(conditions, confidences[:-1], default=confidences[-1]).astype(float),
+        )
@@ -1,7 +1,10 @@
+from datetime import datetime
+
+import numpy as np
 import pandas as pd
-from Audit.audit_log import log_event
+from Audit.audit_log import log_events
 
-#These are the helper functions
+#These are the helper functions (single values)
 
 def standardize_email(email: str) -> str:
     return email.strip().lower()
@@ -21,78 +24,134 @@ def standardize_date(value):
     except Exception:
         return value
 
+#Column standardizers, registered per column name.
+#Each one takes the column's non-null values and returns the
+#standardized values (same index); anything it leaves as NaN is kept.
+
+STANDARDIZERS = {}
+
+def register_standardizer(column: str, action: str, reason: str):
+    """
+    Registers a column-wise standardizer:
+
+        @register_standardizer("Zip", "STANDARDIZE_ZIP", "Padded zip code")
+        def standardize_zip_column(values: pd.Series) -> pd.Series:
+            return values.astype(str).str.zfill(5)
+
+    Registering the same column again replaces the previous one.
+    """
+    def decorator(func):
+        STANDARDIZERS[column] = {"func": func, "action": action, "reason": reason}
+        return func
+    return decorator
+
+@register_standardizer("Email", "STANDARDIZE_EMAIL", "Normalized email casing/spacing")
+def standardize_email_column(values: pd.Series) -> pd.Series:
+    return values.str.strip().str.lower()
+
+@register_standardizer("Phone", "STANDARDIZE_PHONE", "Removed non-numeric characters from phone number")
+def standardize_phone_column(values: pd.Series) -> pd.Series:
+    text = values.astype(str)
+    digits = text.str.replace(r"\D", "", regex=True)
+    return text.where(digits.str.len() != 10, digits)
+
+@register_standardizer("Department_Region", "STANDARDIZE_DEPARTMENT", "Normalized department naming format")
+def standardize_department_column(values: pd.Series) -> pd.Series:
+    return values.str.strip().str.title()
+
+@register_standardizer("HireDate", "STANDARDIZE_DATE", "Converted hire date to ISO format")
+def standardize_date_column(values: pd.Series) -> pd.Series:
+    # One parse for the whole column; values in another format than the
+    # first one are retried individually
+    parsed = pd.to_datetime(values, errors="coerce")
+    retry = parsed.isna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(values[retry], errors="coerce", format="mixed")
+    return parsed.dt.strftime("%Y-%m-%d").astype(object).where(parsed.notna())
+
 #This is the main engine that will apply the changes
 
-def apply_standardization(df: pd.DataFrame) -> pd.DataFrame:
+def apply_standardization(df: pd.DataFrame, standardizers: dict | None = None,
+                          audit: bool = True) -> pd.DataFrame:
     """
-    Applies safe, rule based standardization.
-    All changes are logged to the audit log.
+    Applies safe, rule based standardization, one column at a time.
+    All changes are logged to the audit log in a single write.
     """
 
     df = df.copy()
+    standardizers = STANDARDIZERS if standardizers is None else standardizers
+
+    if "Employee_ID" in df.columns:
+        record_ids = df["Employee_ID"]
+    else:
+        record_ids = pd.Series([f"row_{idx}" for idx in df.index], index=df.index)
+
+    # Audit events per standardizer, with the row positions they belong to
+    batches = []
+
+    for order, (column, spec) in enumerate(standardizers.items()):
+        if column not in df.columns:
+            continue
+
+        before = df[column]
+        not_null = before.notna().to_numpy()
+        if not not_null.any():
+            continue
+
+        after = spec["func"](before[not_null])
+
+        # Positions (within the non-null values) whose value really changed
+        before_values = before[not_null].to_numpy(dtype=object)
+        after_values = after.to_numpy(dtype=object)
+        changed = pd.notna(after_values) & (before_values != after_values)
+        if not changed.any():
+            continue
+
+        positions = np.flatnonzero(not_null)[changed]
+        new_values = after_values[changed]
+
+        # e.g. a numeric Phone column receiving digit strings
+        if not pd.api.types.is_string_dtype(before.dtype):
+            df[column] = df[column].astype(object)
+        df.iloc[positions, df.columns.get_loc(column)] = new_values
+
+        if audit:
+            batches.append((positions, order, spec, zip(
+                _json_list(record_ids.iloc[positions]),
+                _json_list(before.iloc[positions]),
+                new_values.tolist()
+            )))
+
+    if batches:
+        timestamp = datetime.utcnow().isoformat()
+        events = []
+        for _, _, spec, changes in batches:
+            action, reason = spec["action"], spec["reason"]
+            events.extend(
+                {
+                    "timestamp": timestamp,
+                    "action": action,
+                    "source": "standardization",
+                    "reason": reason,
+                    "record_id": record_id,
+                    "severity": "INFO",
+                    "metadata": {"before": old, "after": new}
+                }
+                for record_id, old, new in changes
+            )
+
+        # Same order as a row-by-row pass: by row, then by standardizer
+        positions = np.concatenate([batch[0] for batch in batches])
+        orders = np.concatenate([np.full(len(batch[0]), batch[1]) for batch in batches])
+        log_events([events[i] for i in np.lexsort((orders, positions))])
 
-    for idx, row in df.iterrows():
-        record_id = row.get("Employee_ID", f"row_{idx}")
-
-
-        # Email Standardization
-        if "Email" in df.columns and pd.notna(row["Email"]):
-            new_email = standardize_email(row["Email"])
-            if new_email != row["Email"]:
-                log_event(
-                    action="STANDARDIZE_EMAIL",
-                    source="standardization",
-                    reason="Normalized email casing/spacing",
-                    record_id=record_id,
-                    severity="INFO",
-                    metadata={"before": row["Email"], "after": new_email}
-                )
-                df.at[idx, "Email"] = new_email
-
-        # Phone Number Standardization
-        if "Phone" in df.columns and pd.notna(row["Phone"]):
-            new_phone = standardize_phone(str(row["Phone"]))
-
-            if new_phone != row["Phone"]:
-                log_event(
-                    action="STANDARDIZE_PHONE",
-                    source="standardization",
-                    reason="Removed non-numeric characters from phone number",
-                    record_id=record_id,
-                    severity="INFO",
-                    metadata={"before": row["Phone"], "after": new_phone}
-                )
-                df.at[idx, "Phone"] = new_phone
-
-        # Department Standardization
-        if "Department_Region" in df.columns and pd.notna(row["Department_Region"]):
-            new_dept = standardize_department(row["Department_Region"])
-
-            if new_dept != row["Department_Region"]:
-                log_event(
-                    action="STANDARDIZE_DEPARTMENT",
-                    source="standardization",
-                    reason="Normalized department naming format",
-                    record_id=record_id,
-                    severity="INFO",
-                    metadata={"before": row["Department_Region"], "after": new_dept}
-                )
-                df.at[idx, "Department_Region"] = new_dept
-
-        # Hire Data Standardization
-        if "HireDate" in df.columns and pd.notna(row["HireDate"]):
-            new_date = standardize_date(row["HireDate"])
-
-            if new_date != row["HireDate"]:
-                log_event(
-                    action="STANDARDIZE_DATE",
-                    source="standardization",
-                    reason="Converted hire date to ISO format",
-                    record_id=record_id,
-                    severity="INFO",
-                    metadata={"before": row["HireDate"], "after": new_date}
-                )
-                df.at[idx, "HireDate"] = new_date
     # Returning the cleaned dataset
     return df
 
+def _json_list(values: pd.Series) -> list:
+    """
+    Values as JSON-friendly Python objects (no numpy scalars or Timestamps).
+    """
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return [None if pd.isna(value) else value.isoformat() for value in values]
+    return values.tolist()
@@ -0,0 +1,176 @@
+"""
+Columnar Sidecar Files
+=======================
+Parsing CSV text is the slowest part of loading a dataset, and every
+analysis path used to do it from scratch on every call. This module
+converts a CSV once into a typed columnar "sidecar" file (Arrow IPC /
+Feather v2, uncompressed) stored next to it:
+
+    uploads/20260312_154500_sales.csv
+    uploads/20260312_154500_sales.csv.arrow   <- sidecar
+
+Later loads memory-map the sidecar instead of parsing the CSV, and can
+read only the columns they need (column projection).
+
+Rules:
+  - The sidecar holds exactly what pd.read_csv() returned (same dtypes,
+    same values), so every check gives the same result either way.
+  - The CSV's mtime and size are stored in the sidecar's metadata;
+    if the CSV changes, the sidecar is rebuilt on the next load.
+  - pyarrow is optional. Without it (or if a sidecar cannot be written,
+    e.g. a read-only folder or a column Arrow cannot represent) loads
+    fall back to plain pd.read_csv().
+"""
+
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+    feather = None
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+SIDECAR_SUFFIX = ".arrow"
+
+# Set DQ_DISABLE_SIDECAR=1 to always parse the CSV
+SIDECAR_ENABLED = os.environ.get("DQ_DISABLE_SIDECAR", "0") != "1"
+
+# Metadata keys recording which CSV version the sidecar was built from
+_MTIME_KEY = b"dq_source_mtime_ns"
+_SIZE_KEY = b"dq_source_size"
+
+
+def sidecar_available() -> bool:
+    return SIDECAR_ENABLED and pa is not None
+
+
+def sidecar_path(csv_path: str) -> str:
+    return csv_path + SIDECAR_SUFFIX
+
+
+def _source_signature(csv_path: str) -> dict:
+    stat = os.stat(csv_path)
+    return {_MTIME_KEY: str(stat.st_mtime_ns).encode(), _SIZE_KEY: str(stat.st_size).encode()}
+
+
+def is_sidecar_fresh(csv_path: str) -> bool:
+    """
+    True if a sidecar exists and was built from the CSV as it is now.
+    """
+    path = sidecar_path(csv_path)
+    if not sidecar_available() or not os.path.exists(path):
+        return False
+    try:
+        # Only the schema is read here, not the data
+        with pa.memory_map(path) as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+    except (OSError, pa.ArrowException):
+        return False
+
+    signature = _source_signature(csv_path)
+    return all(metadata.get(key) == value for key, value in signature.items())
+
+
+def write_sidecar(csv_path: str, df: pd.DataFrame) -> bool:
+    """
+    Writes df (the parsed CSV) as the sidecar for csv_path.
+
+    Returns:
+        True if the sidecar was written, False if it could not be
+        (the caller just keeps using the CSV)
+    """
+    if not sidecar_available():
+        return False
+
+    path = sidecar_path(csv_path)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        signature = _source_signature(csv_path)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        # Categorical columns (see dtype_planner.py) are stored as plain
+        # strings, so the sidecar stays what pd.read_csv() returns
+        for i, field in enumerate(table.schema):
+            if pa.types.is_dictionary(field.type):
+                column = pa.chunked_array(
+                    [chunk.dictionary_decode() for chunk in table.column(i).chunks],
+                    type=field.type.value_type
+                )
+                table = table.set_column(i, field.name, column)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **signature})
+        feather.write_feather(table, temp_path, compression="uncompressed")
+        os.replace(temp_path, path)
+        return True
+    except (OSError, pa.ArrowException, ValueError, TypeError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return False
+
+
+def _sidecar_frame(table, dtype: dict | None) -> pd.DataFrame:
+    """
+    Converts a sidecar table to pandas, applying the requested dtypes.
+    Categorical text columns are dictionary-encoded in Arrow first, so
+    the full string column is never built in pandas.
+    """
+    categorical = []
+    for name, kind in (dtype or {}).items():
+        if kind != "category" or name not in table.column_names:
+            continue
+        i = table.column_names.index(name)
+        if pa.types.is_string(table.schema.field(i).type) or pa.types.is_large_string(table.schema.field(i).type):
+            table = table.set_column(i, name, table.column(i).dictionary_encode())
+            categorical.append(name)
+
+    df = table.to_pandas()
+
+    for name, kind in (dtype or {}).items():
+        if name not in df.columns:
+            continue
+        if name in categorical:
+            # Same category order as pd.read_csv(dtype="category") (sorted)
+            categories = df[name].cat.categories
+            df[name] = df[name].cat.reorder_categories(categories.sort_values())
+        else:
+            df[name] = df[name].astype(kind)
+    return df
+
+
+def load_csv(csv_path: str, columns: list | None = None, dtype: dict | None = None) -> pd.DataFrame:
+    """
+    Loads a CSV, preferring its columnar sidecar.
+
+    Args:
+        csv_path: path to the CSV file
+        columns: optional list of columns to load (all if None)
+        dtype: optional {column: dtype} as for pd.read_csv (see
+            dtype_planner.py); the sidecar itself always keeps the
+            default dtypes
+
+    Returns:
+        The same DataFrame pd.read_csv() gives, limited to `columns`
+        (in the order they were requested)
+    """
+    if not sidecar_available():
+        df = pd.read_csv(csv_path, usecols=columns, dtype=dtype)
+        return df if columns is None else df[list(columns)]
+
+    if is_sidecar_fresh(csv_path):
+        table = feather.read_table(sidecar_path(csv_path), columns=columns, memory_map=True)
+        return _sidecar_frame(table, dtype)
+
+    # First load (or the CSV changed): parse the whole file once,
+    # build the sidecar, then hand back the requested columns
+    df = pd.read_csv(csv_path, dtype=dtype)
+    write_sidecar(csv_path, df)
+
+    if columns is not None:
+        return df[list(columns)]
+    return df
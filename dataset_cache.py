@@ -0,0 +1,190 @@
+"""
+Shared Dataset Cache
+=====================
+Process-wide cache of parsed CSV files, so repeated tool calls on the
+same file (e.g. get_dataset_summary, then check_missing_values, then
+detect_numeric_outliers for several columns) parse it only once.
+
+How it works:
+  - Entries are keyed by the absolute file path and validated against
+    the file's mtime and size on every lookup; if the file changed on
+    disk it is simply re-read.
+  - The total in-memory size of all cached DataFrames is kept under
+    DATASET_CACHE_MAX_BYTES by evicting the least recently used ones.
+  - A dataset can be pinned so it is never evicted automatically, or
+    evicted explicitly (see the manage_dataset_cache tool in mcp_main.py).
+
+The cached DataFrame is shared between callers, so treat it as
+read-only (make a .copy() before modifying it).
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from columnar_sidecar import load_csv
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# Memory budget for all cached DataFrames together (default 1GB)
+DATASET_CACHE_MAX_BYTES = int(os.environ.get("DATASET_CACHE_MAX_MB", "1024")) * 1024 * 1024
+
+
+def _file_signature(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class DatasetCache:
+    """
+    LRU cache of DataFrames with a memory budget and pinning.
+    """
+
+    def __init__(self, max_bytes: int = DATASET_CACHE_MAX_BYTES, loader=load_csv):
+        self.max_bytes = max_bytes
+        self.loader = loader
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry["nbytes"] for entry in self._entries.values())
+
+    def get(self, csv_path: str) -> pd.DataFrame:
+        """
+        Returns the parsed DataFrame for csv_path, reading the file only
+        if it is not cached or has changed since it was cached.
+        """
+        key = os.path.abspath(csv_path)
+        signature = _file_signature(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry["signature"] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry["df"]
+            self.misses += 1
+
+        # Parse outside the lock so other datasets stay available
+        df = self.loader(key)
+        nbytes = int(df.memory_usage(deep=True).sum())
+
+        with self._lock:
+            pinned = entry is not None and entry["pinned"]
+            # A file bigger than the whole budget is not worth caching
+            # unless it was explicitly pinned
+            if pinned or nbytes <= self.max_bytes:
+                self._entries[key] = {
+                    "df": df,
+                    "signature": signature,
+                    "nbytes": nbytes,
+                    "pinned": pinned,
+                }
+                self._entries.move_to_end(key)
+                self._evict()
+            else:
+                self._entries.pop(key, None)
+
+        return df
+
+    def _evict(self):
+        total = self.total_bytes
+        for key in list(self._entries):
+            if total <= self.max_bytes:
+                break
+            entry = self._entries[key]
+            if entry["pinned"]:
+                continue
+            total -= entry["nbytes"]
+            del self._entries[key]
+
+    def pin(self, csv_path: str) -> pd.DataFrame:
+        """
+        Loads (if needed) and pins a dataset so it is never evicted
+        by the LRU policy.
+        """
+        key = os.path.abspath(csv_path)
+        df = self.get(key)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                # Larger than the budget, so get() did not keep it
+                entry = {
+                    "df": df,
+                    "signature": _file_signature(key),
+                    "nbytes": int(df.memory_usage(deep=True).sum()),
+                }
+                self._entries[key] = entry
+            entry["pinned"] = True
+            self._evict()
+        return df
+
+    def unpin(self, csv_path: str) -> bool:
+        """
+        Makes a pinned dataset evictable again. Returns False if it
+        was not cached.
+        """
+        key = os.path.abspath(csv_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            entry["pinned"] = False
+            self._evict()
+        return True
+
+    def evict(self, csv_path: str) -> bool:
+        """
+        Drops a dataset from the cache (pinned or not). Returns False
+        if it was not cached.
+        """
+        key = os.path.abspath(csv_path)
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def info(self) -> dict:
+        """
+        Summary of what is cached, for the manage_dataset_cache tool.
+        """
+        with self._lock:
+            datasets = [
+                {
+                    "path": key,
+                    "rows": len(entry["df"]),
+                    "columns": len(entry["df"].columns),
+                    "size_mb": round(entry["nbytes"] / (1024 * 1024), 2),
+                    "pinned": entry["pinned"],
+                }
+                for key, entry in reversed(self._entries.items())
+            ]
+            return {
+                "datasets": datasets,
+                "total_mb": round(self.total_bytes / (1024 * 1024), 2),
+                "budget_mb": round(self.max_bytes / (1024 * 1024), 2),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# One cache for the whole process
+dataset_cache = DatasetCache()
+
+
+def load_dataset(csv_path: str) -> pd.DataFrame:
+    """
+    Returns the (shared, read-only) DataFrame for csv_path from the
+    process-wide cache.
+    """
+    return dataset_cache.get(csv_path)
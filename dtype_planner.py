@@ -0,0 +1,155 @@
+"""
+Load-Time Dtype Planning
+=========================
+pd.read_csv() gives every text column its full string dtype, even
+columns like Status or Department_Region that only ever hold a handful
+of distinct values, and every integer column 8 bytes per value. On big
+exports those columns dominate the memory of a load.
+
+The planner reads a sample of the file first (PLAN_SAMPLE_ROWS rows)
+and picks a cheaper dtype per column:
+
+  - low-cardinality text (distinct values at most CATEGORY_MAX_RATIO of
+    the sampled values) is loaded as "category": one small integer code
+    per row plus a single copy of each distinct string
+  - high-cardinality text keeps pandas' string dtype, which is stored in
+    Arrow buffers when pyarrow is installed (the default since pandas 3)
+  - integers are downcast to the smallest integer dtype that holds the
+    loaded values (decided on the real values, so nothing can overflow)
+  - floats and booleans are left alone: float32 would change the values
+    the quartiles, z-scores and thresholds are computed on
+
+Categoricals and downcast integers hold exactly the same values as the
+default dtypes, so every check gives the same result. logical_dtype()
+gives the dtype name pd.read_csv() would have used, for reports that
+show column dtypes.
+
+The memory of the planned frame and an estimate of what the default
+dtypes would have used (the sample's bytes per row times the row count)
+are stored in df.attrs["memory"].
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from columnar_sidecar import load_csv
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# Rows read to decide the dtypes
+PLAN_SAMPLE_ROWS = 10_000
+
+# Text columns whose sample has at most this share of distinct
+# values (distinct / non-null values) are loaded as categoricals
+CATEGORY_MAX_RATIO = 0.5
+
+# Set DQ_DISABLE_DTYPE_PLAN=1 to load with pandas' default dtypes
+PLANNING_ENABLED = os.environ.get("DQ_DISABLE_DTYPE_PLAN", "0") != "1"
+
+_MB = 1024 * 1024
+
+
+def _memory_bytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True, index=False).sum())
+
+
+def plan_dtypes(csv_path: str, columns: list | None = None) -> dict:
+    """
+    Decides the load dtypes of a CSV from a sample of its rows.
+
+    Returns:
+        A dict with:
+        - dtypes: {column: dtype} to pass to pd.read_csv
+        - sample_rows: rows in the sample
+        - default_bytes_per_row: memory per row of the sample with
+          the default dtypes
+    """
+    try:
+        sample = pd.read_csv(csv_path, nrows=PLAN_SAMPLE_ROWS, usecols=columns)
+    except pd.errors.EmptyDataError:
+        return {"dtypes": {}, "sample_rows": 0, "default_bytes_per_row": 0.0}
+
+    dtypes = {}
+    for col in sample.columns:
+        series = sample[col]
+        # Text in the sample means text in the whole file: one word that
+        # is not a number or True/False is enough for pandas to keep every
+        # value of the column as the string it read. Columns of True/False
+        # with gaps come out as Python bools (object dtype) and are skipped.
+        if pd.api.types.infer_dtype(series, skipna=True) != "string":
+            continue
+        non_null = int(series.notna().sum())
+        if non_null and series.nunique() <= CATEGORY_MAX_RATIO * non_null:
+            dtypes[col] = "category"
+
+    return {
+        "dtypes": dtypes,
+        "sample_rows": len(sample),
+        "default_bytes_per_row": _memory_bytes(sample) / len(sample) if len(sample) else 0.0,
+    }
+
+
+def downcast_integers(df: pd.DataFrame) -> dict:
+    """
+    Downcasts every int64 column to the smallest integer dtype that
+    holds its values (in place).
+
+    Returns:
+        {column: new dtype} for the columns that changed
+    """
+    downcast = {}
+    for col in df.columns:
+        if df[col].dtype == np.int64:
+            smaller = pd.to_numeric(df[col], downcast="integer")
+            if smaller.dtype != np.int64:
+                df[col] = smaller
+                downcast[col] = str(smaller.dtype)
+    return downcast
+
+
+def load_planned_csv(csv_path: str, columns: list | None = None) -> pd.DataFrame:
+    """
+    Loads a CSV (through its columnar sidecar, see columnar_sidecar.py)
+    with the dtypes planned from a sample.
+
+    Returns:
+        The same values pd.read_csv() gives, with df.attrs["memory"]
+        holding default_mb (estimated), planned_mb, categorical and
+        downcast columns. With PLANNING_ENABLED off this is just
+        load_csv() and only planned_mb is reported.
+    """
+    if not PLANNING_ENABLED:
+        df = load_csv(csv_path, columns)
+        df.attrs["memory"] = {"planned": False, "planned_mb": round(_memory_bytes(df) / _MB, 2)}
+        return df
+
+    plan = plan_dtypes(csv_path, columns)
+    df = load_csv(csv_path, columns, dtype=plan["dtypes"])
+    downcast = downcast_integers(df)
+
+    df.attrs["memory"] = {
+        "planned": True,
+        "default_mb": round(plan["default_bytes_per_row"] * len(df) / _MB, 2),
+        "planned_mb": round(_memory_bytes(df) / _MB, 2),
+        "categorical_columns": sorted(plan["dtypes"]),
+        "downcast_columns": downcast,
+    }
+    return df
+
+
+def logical_dtype(series: pd.Series) -> str:
+    """
+    Name of the dtype pd.read_csv() gives the column without planning:
+    categoricals report the dtype of their values and downcast integers
+    report int64.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        return str(dtype.categories.dtype)
+    if dtype in (np.int8, np.int16, np.int32):
+        return "int64"
+    return str(dtype)
@@ -33,6 +33,12 @@ class SSNResponse(BaseModel):
     ssn: str
     valid: bool
 
+class SSNBatchRequest(BaseModel):
+    ssns: list[str]
+
+class SSNBatchResponse(BaseModel):
+    results: list[SSNResponse]
+
 
 @app.post("/validate-ssn", response_model=SSNResponse)
 async def validate_ssn(request: SSNRequest):
@@ -40,6 +46,19 @@ async def validate_ssn(request: SSNRequest):
     return SSNResponse(ssn=request.ssn, valid=valid)
 
 
+@app.post("/validate-ssn/batch", response_model=SSNBatchResponse)
+async def validate_ssn_batch(request: SSNBatchRequest):
+    """
+    Validates many SSNs in one round trip.
+    Results are returned in the same order as the request.
+    """
+    results = [
+        SSNResponse(ssn=ssn, valid=is_valid_ssn(ssn))
+        for ssn in request.ssns
+    ]
+    return SSNBatchResponse(results=results)
+
+
 # -----------------------------
 # MCP SERVER (MINIMAL EXAMPLE)
 # -----------------------------
@@ -1,6 +1,128 @@
+import os
+import threading
+from collections import OrderedDict
+
 import requests
 
+from integrations.SSN import is_valid_ssn
+
 SSN_API_URL = "http://localhost:8001/validate-ssn"
+SSN_BATCH_API_URL = "http://localhost:8001/validate-ssn/batch"
+
+# "remote" → call the SSN validation server
+# "local"  → validate in-process with is_valid_ssn (zero network calls)
+SSN_VALIDATION_MODE = os.environ.get("SSN_VALIDATION_MODE", "remote")
+
+SSN_BATCH_SIZE = 1000          # SSNs per /validate-ssn/batch request
+SSN_CACHE_SIZE = 100_000       # Max normalized SSNs remembered in-process
+SSN_TIMEOUT_SECONDS = 2
+
+# One keep-alive session so batches reuse the same TCP connection
+_session = requests.Session()
+
+# LRU cache: normalized SSN -> valid (only successful verdicts are cached)
+_cache: OrderedDict = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def normalize_ssn(ssn) -> str:
+    """
+    Cache key / wire format for an SSN: the string value without
+    surrounding whitespace.
+    """
+    return str(ssn).strip()
+
+
+def clear_ssn_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def _cache_get_many(keys: list) -> dict:
+    found = {}
+    with _cache_lock:
+        for key in keys:
+            if key in _cache:
+                _cache.move_to_end(key)
+                found[key] = _cache[key]
+    return found
+
+
+def _cache_put_many(verdicts: dict):
+    with _cache_lock:
+        for key, valid in verdicts.items():
+            _cache[key] = valid
+            _cache.move_to_end(key)
+        while len(_cache) > SSN_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+
+def _validate_remote(ssns: list) -> dict:
+    """
+    Sends the SSNs to the batch endpoint in chunks of SSN_BATCH_SIZE.
+    If a request fails, that chunk and all remaining ones are treated
+    as invalid (not cached) instead of waiting on the timeout again.
+    """
+    verdicts = {}
+    failed = []
+
+    for start in range(0, len(ssns), SSN_BATCH_SIZE):
+        chunk = ssns[start:start + SSN_BATCH_SIZE]
+
+        if failed:
+            failed.extend(chunk)
+            continue
+
+        try:
+            response = _session.post(
+                SSN_BATCH_API_URL,
+                json={"ssns": chunk},
+                timeout=SSN_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+            for item in response.json()["results"]:
+                verdicts[item["ssn"]] = item["valid"]
+        except Exception:
+            failed.extend(chunk)
+
+    _cache_put_many(verdicts)
+
+    # Fail-safe: treat SSN as invalid if service fails
+    for ssn in failed:
+        verdicts[ssn] = False
+
+    return verdicts
+
+
+def validate_ssns_via_mcp(ssns) -> dict:
+    """
+    Validates many SSNs at once.
+
+    Values are normalized and deduplicated, answered from the LRU cache
+    where possible, and the rest are sent to the SSN server in batches
+    (or checked in-process when SSN_VALIDATION_MODE is "local").
+
+    Returns:
+        A dict of normalized SSN -> bool
+    """
+    keys = list(dict.fromkeys(normalize_ssn(ssn) for ssn in ssns))
+
+    verdicts = {key: False for key in keys if key == ""}
+    keys = [key for key in keys if key != ""]
+
+    if SSN_VALIDATION_MODE == "local":
+        verdicts.update({key: is_valid_ssn(key) for key in keys})
+        return verdicts
+
+    cached = _cache_get_many(keys)
+    verdicts.update(cached)
+
+    missing = [key for key in keys if key not in cached]
+    if missing:
+        verdicts.update(_validate_remote(missing))
+
+    return verdicts
+
 
 def validate_ssn_via_mcp(ssn: str) -> bool:
     """
@@ -8,14 +130,4 @@ def validate_ssn_via_mcp(ssn: str) -> bool:
     """
     if not ssn or str(ssn).strip() == "":
         return False
-    try:
-        response = requests.post(
-            SSN_API_URL,
-            json={"ssn": ssn},
-            timeout=2
-        )
-        response.raise_for_status()
-        return response.json()["valid"]
-    except Exception:
-        # Fail-safe: treat SSN as invalid if service fails
-        return False
+    return validate_ssns_via_mcp([ssn])[normalize_ssn(ssn)]
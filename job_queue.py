@@ -0,0 +1,485 @@
+"""
+Background Job Queue
+=====================
+Long analyses (a multi-GB upload, a full employee analysis) used to run
+inside the request that asked for them, holding an event loop or a
+threadpool worker for minutes. They can now be submitted as jobs:
+
+    job_id = job_queue.submit("generic_analysis", {"csv_path": "uploads/x.csv"})
+    job_queue.get(job_id)     -> status, progress, result
+    job_queue.cancel(job_id)
+
+How it works:
+  - Jobs are stored in SQLite (outputs/jobs.sqlite), so queued jobs and
+    finished results survive a server restart.
+  - A dispatcher thread starts queued jobs in separate worker processes,
+    at most JOB_WORKERS at a time. Each job gets its own process, so a
+    job that crashes (or is killed) cannot take the others down.
+    Workers are not daemonic (a job may start its own process pool),
+    so a normal server shutdown waits for running jobs.
+  - The worker writes its own progress and result to the store. If it
+    dies without doing so, the job is retried up to JOB_MAX_ATTEMPTS
+    times, then marked failed. Jobs left "running" by a server that
+    died are picked up again the same way when the next server starts.
+  - Cancelling a queued job removes it from the queue. A running job
+    stops at its next progress report; if it has not stopped after
+    JOB_CANCEL_GRACE_SECONDS its process is terminated.
+
+Job kinds map a name to a "module:function" path (JOB_KINDS). The
+function receives the job's params as keyword arguments, plus a
+`progress(fraction, step)` callback if it accepts one, and must return
+something JSON-serializable.
+"""
+
+import importlib
+import inspect
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+JOB_DB_PATH = Path(os.environ.get("JOB_DB_PATH", "outputs/jobs.sqlite"))
+
+# Jobs running at the same time (per server process)
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "2"))
+
+# Runs of a job whose worker crashed before it is given up on
+JOB_MAX_ATTEMPTS = 2
+
+# How long a running job gets to stop by itself after a cancel
+JOB_CANCEL_GRACE_SECONDS = 5.0
+
+# How often the dispatcher looks for new, finished and cancelled jobs
+JOB_POLL_SECONDS = 0.5
+
+# How often /jobs/{id}/events checks a job for changes
+JOB_EVENT_SECONDS = 0.5
+
+# Worker processes are started fresh (no state inherited from the server)
+JOB_START_METHOD = "spawn"
+
+JOB_KINDS = {
+    "generic_analysis": "Generic_Detection.generic_pipeline:run_generic_pipeline",
+    "generic_upload_analysis": "Generic_Detection.generic_cache:analyze_with_cache",
+    "full_analysis": "Quality_Detection.full_pipeline:run_full_analysis",
+    "schema_checks": "Quality_Detection.schema_pipeline:run_schema_checks",
+    "anomaly_checks": "Quality_Detection.anomaly_pipeline:run_anomaly_checks",
+}
+
+TERMINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    step TEXT,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    cancel_requested_at REAL,
+    owner_pid INTEGER,
+    worker_pid INTEGER,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at);
+"""
+
+
+class JobCancelled(Exception):
+    """
+    Raised inside a job (by its progress callback) once it is cancelled.
+    """
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _pid_alive(pid: int | None) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# =============================================================
+# STORE
+# =============================================================
+
+class JobStore:
+    """
+    The jobs table. Used by the server and by the worker processes.
+    """
+
+    def __init__(self, db_path: Path | str = JOB_DB_PATH):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _execute(self, sql: str, params=()) -> int:
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute(sql, params).rowcount
+        finally:
+            conn.close()
+
+    def add(self, kind: str, params: dict) -> str:
+        job_id = uuid.uuid4().hex
+        self._execute(
+            "INSERT INTO jobs (id, kind, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+            (job_id, kind, json.dumps(params), _now())
+        )
+        return job_id
+
+    def get(self, job_id: str, with_result: bool = True) -> dict | None:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        return None if row is None else self._to_dict(row, with_result)
+
+    def list_jobs(self, status: str | None = None, limit: int = 50) -> list[dict]:
+        query = "SELECT * FROM jobs"
+        params = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(limit)
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        return [self._to_dict(row, with_result=False) for row in rows]
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row, with_result: bool) -> dict:
+        job = {
+            "job_id": row["id"],
+            "kind": row["kind"],
+            "params": json.loads(row["params"]),
+            "status": row["status"],
+            "progress": row["progress"],
+            "step": row["step"],
+            "error": row["error"],
+            "attempts": row["attempts"],
+            "cancel_requested": row["cancel_requested_at"] is not None,
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+        }
+        if with_result:
+            job["result"] = json.loads(row["result"]) if row["result"] else None
+        return job
+
+    def claim_next(self, owner_pid: int) -> dict | None:
+        """
+        Marks the oldest queued job as running (owned by owner_pid)
+        and returns it, or None if the queue is empty.
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                row = conn.execute(
+                    "SELECT * FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, owner_pid = ?, "
+                    "worker_pid = NULL, started_at = ?, progress = 0, step = NULL WHERE id = ?",
+                    (owner_pid, _now(), row["id"])
+                )
+                return self._to_dict(row, with_result=False)
+        finally:
+            conn.close()
+
+    def set_worker(self, job_id: str, worker_pid: int):
+        self._execute("UPDATE jobs SET worker_pid = ? WHERE id = ?", (worker_pid, job_id))
+
+    def set_progress(self, job_id: str, fraction: float, step: str | None):
+        self._execute(
+            "UPDATE jobs SET progress = ?, step = ? WHERE id = ? AND status = 'running'",
+            (max(0.0, min(float(fraction), 1.0)), step, job_id)
+        )
+
+    def finish(self, job_id: str, status: str, result=None, error: str | None = None) -> bool:
+        """
+        Records the outcome of a running job. Returns False if the job
+        was not running any more.
+        """
+        return self._execute(
+            "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+            "progress = CASE WHEN ? = 'succeeded' THEN 1 ELSE progress END "
+            "WHERE id = ? AND status = 'running'",
+            (status, None if result is None else json.dumps(result, default=str), error,
+             _now(), status, job_id)
+        ) > 0
+
+    def requeue_or_fail(self, job_id: str, error: str, max_attempts: int = JOB_MAX_ATTEMPTS):
+        """
+        For a job whose worker died: back to the queue while it has
+        attempts left, failed otherwise. A job that was being cancelled
+        is just marked cancelled.
+        """
+        self._execute(
+            "UPDATE jobs SET "
+            "status = CASE WHEN cancel_requested_at IS NOT NULL THEN 'cancelled' "
+            "              WHEN attempts < ? THEN 'queued' ELSE 'failed' END, "
+            "error = ?, "
+            "finished_at = CASE WHEN cancel_requested_at IS NULL AND attempts < ? THEN NULL ELSE ? END "
+            "WHERE id = ? AND status = 'running'",
+            (max_attempts, error, max_attempts, _now(), job_id)
+        )
+
+    def request_cancel(self, job_id: str) -> str | None:
+        """
+        Cancels a queued job, or flags a running one. Returns the job's
+        status afterwards (None if there is no such job).
+        """
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE jobs SET status = 'cancelled', finished_at = ?, cancel_requested_at = ? "
+                    "WHERE id = ? AND status = 'queued'",
+                    (_now(), time.time(), job_id)
+                )
+                conn.execute(
+                    "UPDATE jobs SET cancel_requested_at = ? "
+                    "WHERE id = ? AND status = 'running' AND cancel_requested_at IS NULL",
+                    (time.time(), job_id)
+                )
+                row = conn.execute("SELECT status FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        return None if row is None else row["status"]
+
+    def cancel_requested(self, job_id: str) -> bool:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT cancel_requested_at FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        finally:
+            conn.close()
+        return row is not None and row["cancel_requested_at"] is not None
+
+    def running_jobs(self) -> list[sqlite3.Row]:
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT id, owner_pid, worker_pid, cancel_requested_at FROM jobs WHERE status = 'running'"
+            ).fetchall()
+        finally:
+            conn.close()
+
+
+# =============================================================
+# WORKER PROCESS
+# =============================================================
+
+def resolve_job_function(kind: str):
+    if kind not in JOB_KINDS:
+        raise ValueError(f"Unknown job kind '{kind}'. Known: {sorted(JOB_KINDS)}")
+    module_name, func_name = JOB_KINDS[kind].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _run_job(db_path: str, job_id: str, kind: str, params: dict):
+    """
+    Entry point of a worker process: runs one job and records its outcome.
+    """
+    store = JobStore(db_path)
+
+    def progress(fraction: float, step: str | None = None):
+        if store.cancel_requested(job_id):
+            raise JobCancelled()
+        store.set_progress(job_id, fraction, step)
+
+    try:
+        func = resolve_job_function(kind)
+        if "progress" in inspect.signature(func).parameters:
+            params = {**params, "progress": progress}
+        progress(0.0, "started")
+        result = func(**params)
+    except JobCancelled:
+        store.finish(job_id, "cancelled")
+    except Exception as e:
+        store.finish(job_id, "failed", error=f"{type(e).__name__}: {e}")
+    else:
+        store.finish(job_id, "succeeded", result=result)
+
+
+# =============================================================
+# QUEUE (server side)
+# =============================================================
+
+class JobQueue:
+    """
+    Submits jobs and runs the dispatcher that executes them.
+    """
+
+    def __init__(self, db_path: Path | str = JOB_DB_PATH, workers: int = JOB_WORKERS):
+        self.store = JobStore(db_path)
+        self.workers = workers
+        self._processes: dict[str, multiprocessing.Process] = {}
+        self._context = multiprocessing.get_context(JOB_START_METHOD)
+        self._dispatcher = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+
+    # ---------------------------------------------------------
+    # Public API
+    # ---------------------------------------------------------
+
+    def submit(self, kind: str, params: dict | None = None) -> str:
+        if kind not in JOB_KINDS:
+            raise ValueError(f"Unknown job kind '{kind}'. Known: {sorted(JOB_KINDS)}")
+        job_id = self.store.add(kind, params or {})
+        self.start()
+        self._wake.set()
+        return job_id
+
+    def get(self, job_id: str, with_result: bool = True) -> dict | None:
+        return self.store.get(job_id, with_result)
+
+    def list_jobs(self, status: str | None = None, limit: int = 50) -> list[dict]:
+        return self.store.list_jobs(status, limit)
+
+    def cancel(self, job_id: str) -> str | None:
+        status = self.store.request_cancel(job_id)
+        self._wake.set()
+        return status
+
+    def start(self):
+        """
+        Starts the dispatcher thread (once per process). The server
+        calls this at startup (see mcp_server.py) so queued and orphaned
+        jobs are picked up after a restart; submit() calls it too in
+        case the queue is used without the server.
+        """
+        with self._lock:
+            if self._dispatcher is not None and self._dispatcher.is_alive():
+                return
+            self._stop.clear()
+            self._dispatcher = threading.Thread(target=self._dispatch_loop, name="job-dispatcher", daemon=True)
+            self._dispatcher.start()
+
+    def stop(self, terminate_running: bool = False):
+        self._stop.set()
+        self._wake.set()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        if terminate_running:
+            for job_id, process in list(self._processes.items()):
+                process.terminate()
+                process.join()
+                self.store.requeue_or_fail(job_id, "Server stopped while the job was running")
+            self._processes.clear()
+
+    # ---------------------------------------------------------
+    # Dispatcher
+    # ---------------------------------------------------------
+
+    def _dispatch_loop(self):
+        self._recover_orphans()
+        while not self._stop.is_set():
+            try:
+                self._reap_finished()
+                self._enforce_cancels()
+                self._start_queued()
+            except Exception as e:
+                # e.g. the store is locked for longer than its timeout;
+                # the next round simply tries again
+                print(f"Job dispatcher error: {type(e).__name__}: {e}")
+            self._wake.wait(JOB_POLL_SECONDS)
+            self._wake.clear()
+
+    def _recover_orphans(self):
+        """
+        Jobs left running by a server process (and worker) that no
+        longer exist go back to the queue.
+        """
+        for row in self.store.running_jobs():
+            if row["id"] in self._processes:
+                continue
+            if not _pid_alive(row["owner_pid"]) and not _pid_alive(row["worker_pid"]):
+                self.store.requeue_or_fail(row["id"], "The server running this job stopped")
+
+    def _reap_finished(self):
+        for job_id, process in list(self._processes.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self._processes[job_id]
+            # Still "running" means the worker died before recording anything
+            self.store.requeue_or_fail(job_id, f"Worker process exited with code {process.exitcode}")
+
+    def _enforce_cancels(self):
+        now = time.time()
+        for row in self.store.running_jobs():
+            process = self._processes.get(row["id"])
+            requested = row["cancel_requested_at"]
+            if process is None or requested is None:
+                continue
+            if now - requested >= JOB_CANCEL_GRACE_SECONDS and process.is_alive():
+                process.terminate()
+                process.join()
+                del self._processes[row["id"]]
+                self.store.finish(row["id"], "cancelled")
+
+    def _start_queued(self):
+        while len(self._processes) < self.workers:
+            job = self.store.claim_next(os.getpid())
+            if job is None:
+                return
+            process = self._context.Process(
+                target=_run_job,
+                args=(str(self.store.db_path), job["job_id"], job["kind"], job["params"]),
+                name=f"job-{job['job_id'][:8]}"
+            )
+            try:
+                process.start()
+            except Exception as e:
+                self.store.finish(job["job_id"], "failed", error=f"Could not start worker: {type(e).__name__}: {e}")
+                continue
+            self._processes[job["job_id"]] = process
+            self.store.set_worker(job["job_id"], process.pid)
+
+
+# One queue per server process (the dispatcher starts on first submit)
+job_queue = JobQueue()
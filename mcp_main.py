@@ -12,12 +12,18 @@ How to run:
 
 How to connect from Claude Desktop:
     fastmcp install mcp_main.py
+
+Parsed CSVs are kept in a process-wide cache (dataset_cache.py), so
+follow-up tool calls on the same file do not parse it again.
 """
 
 from fastmcp import FastMCP
 import pandas as pd
 import numpy as np
 
+from dataset_cache import dataset_cache, load_dataset
+from Audit.audit_index import query_audit_log
+
 # =============================================================
 # CREATE THE MCP SERVER
 # =============================================================
@@ -43,7 +49,7 @@ def get_dataset_summary(csv_path: str) -> dict:
     Use this tool FIRST when analyzing a new dataset to understand
     what columns and data types are present.
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     # Build a summary for each column
     columns = []
@@ -91,7 +97,7 @@ def check_missing_values(csv_path: str) -> dict:
 
     Use this tool to assess data COMPLETENESS.
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     results = []
     for col in df.columns:
@@ -143,7 +149,7 @@ def find_duplicates(csv_path: str) -> dict:
 
     Use this tool to assess data UNIQUENESS.
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     # Count rows that are exact copies of another row
     duplicate_count = int(df.duplicated().sum())
@@ -187,7 +193,7 @@ def detect_numeric_outliers(csv_path: str, column: str) -> dict:
     Use this tool to assess data VALIDITY for numeric fields.
     Call get_dataset_summary first to see which columns are numeric.
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     # Validate the column exists
     if column not in df.columns:
@@ -245,7 +251,7 @@ def check_type_consistency(csv_path: str) -> dict:
 
     Use this tool to assess data CONSISTENCY.
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     results = []
     for col in df.columns:
@@ -307,7 +313,7 @@ def validate_column_range(csv_path: str, column: str, min_val: float = None, max
 
     Use this tool to enforce business context (e.g., "Age must be 18-70").
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     if column not in df.columns:
         return {"error": f"Column '{column}' not found."}
@@ -398,7 +404,7 @@ def check_regex_pattern(csv_path: str, column: str, pattern: str, description: s
     - Email: ^[\\w\\.-]+@[\\w\\.-]+\\.[a-zA-Z]{2,}$
     - Phone: ^\\d{3}-\\d{3}-\\d{4}$
     """
-    df = pd.read_csv(csv_path)
+    df = load_dataset(csv_path)
 
     if column not in df.columns:
         return {"error": f"Column '{column}' not found."}
@@ -423,6 +429,84 @@ def check_regex_pattern(csv_path: str, column: str, pattern: str, description: s
     }
 
 
+# =============================================================
+# TOOL 9: MANAGE DATASET CACHE
+# =============================================================
+# Every tool above reads its CSV through a shared in-memory cache.
+# This tool lets the LLM keep a big dataset loaded for a long
+# session (pin) or free the memory when it is done (evict).
+
+@mcp.tool()
+def manage_dataset_cache(action: str = "status", csv_path: str = None) -> dict:
+    """
+    Inspects or controls the in-memory cache of parsed datasets.
+
+    Actions:
+    - status: list cached datasets, their size, and hit/miss counts
+    - pin: load csv_path and keep it cached until unpinned/evicted
+    - unpin: let csv_path be evicted again when memory is needed
+    - evict: drop csv_path from the cache now
+    - clear: drop every cached dataset
+
+    Use "pin" before running many checks on a large file.
+    """
+    if action in ("pin", "unpin", "evict") and not csv_path:
+        return {"error": f"Action '{action}' requires csv_path."}
+
+    if action == "pin":
+        df = dataset_cache.pin(csv_path)
+        result = {"action": action, "csv_path": csv_path, "rows": len(df)}
+    elif action == "unpin":
+        result = {"action": action, "csv_path": csv_path, "was_cached": dataset_cache.unpin(csv_path)}
+    elif action == "evict":
+        result = {"action": action, "csv_path": csv_path, "was_cached": dataset_cache.evict(csv_path)}
+    elif action == "clear":
+        dataset_cache.clear()
+        result = {"action": action}
+    elif action == "status":
+        result = {"action": action}
+    else:
+        return {"error": f"Unknown action '{action}'. Use status, pin, unpin, evict or clear."}
+
+    result["cache"] = dataset_cache.info()
+    return result
+
+
+# =============================================================
+# TOOL 10: QUERY AUDIT LOG
+# =============================================================
+# Every automated change (standardization, quarantine, ...) is
+# written to the audit log. This tool answers questions like
+# "what happened to employee 1234?" without reading the whole log.
+
+@mcp.tool()
+def query_audit_events(record_id: str = None, action: str = None, source: str = None,
+                       severity: str = None, start: str = None, end: str = None,
+                       limit: int = 100, newest_first: bool = False) -> dict:
+    """
+    Searches the audit log of automated data changes.
+
+    All filters are optional and combined with AND:
+    - record_id: e.g. an Employee_ID, to get that record's full history
+    - action: e.g. "STANDARDIZE_EMAIL"
+    - source: e.g. "standardization"
+    - severity: e.g. "INFO", "WARNING"
+    - start / end: ISO dates or timestamps (UTC), e.g. "2026-03-12"
+
+    Returns the matching events (at most `limit`) and whether more exist.
+    """
+    return query_audit_log(
+        record_id=record_id,
+        action=action,
+        source=source,
+        severity=severity,
+        start=start,
+        end=end,
+        limit=limit,
+        newest_first=newest_first
+    )
+
+
 # =============================================================
 # ENTRY POINT
 # =============================================================
@@ -1,8 +1,17 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from pydantic import BaseModel
 from Quality_Detection.Quality_Detection import run_employee_dq_pipeline
+from job_queue import job_queue
 
-app = FastAPI(title="Employee Data Quality MCP", version="0.1")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    #Start the job dispatcher with the server, so jobs queued before a restart
+    #run (and orphaned "running" ones are requeued) without a new submit
+    job_queue.start()
+    yield
+
+app = FastAPI(title="Employee Data Quality MCP", version="0.1", lifespan=lifespan)
 
 class DatasetRequest(BaseModel):
     csv_path: str
@@ -24,6 +33,16 @@ def analyze(req: DatasetRequest):
 def health():
     return {"status": "ok"}
 
+from fastapi.responses import PlainTextResponse
+from tracing import Trace, render_prometheus
+@app.get("/metrics")
+def prometheus_metrics():
+    """
+    Per-stage pipeline timings of this server process, in the
+    Prometheus text format.
+    """
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
 #Running schema check
 from Quality_Detection.schema_pipeline import run_schema_checks
 class AnalyzeRequest(BaseModel):
@@ -46,11 +65,16 @@ from Quality_Detection.row_scoring import calculate_row_quality_scores
 from Quality_Detection.Quality_Detection import load_data
 @app.post("/analyze/score")
 def analyze_score(req: AnalyzeRequest):
+    trace = Trace("score")
+
     # Load dataset
-    df = load_data(req.csv_path)
+    with trace.stage("load") as span:
+        df = load_data(req.csv_path)
+        span.rows = len(df)
 
     # Apply row-level scoring
-    df = calculate_row_quality_scores(df)
+    with trace.stage("scoring", rows=len(df)):
+        df = calculate_row_quality_scores(df)
 
     return {
         "tool": "score",
@@ -60,19 +84,26 @@ def analyze_score(req: AnalyzeRequest):
         "max_score": int(df["Row_Quality_Score"].max()),
         "preview": df[
             ["Employee_ID", "Row_Quality_Score"]
-        ].head(10).to_dict(orient="records")
+        ].head(10).to_dict(orient="records"),
+        "timings": trace.finish()
     }
     return run_full_analysis(req.csv_path)
 
 from Quality_Detection.row_scoring import calculate_row_quality_scores
 from Quality_Detection.Quality_Detection import load_data
 from Quality_Detection.health import classify_dataset_health
-from Quality_Detection.persistence import persist_quality_results
+from Quality_Detection.persistence import persist_quality_results, persist_resolution_results
+from Quality_Detection.incremental_health import analyze_health_incremental
 from Monitoring.history import log_run_metrics
 from Monitoring.trends import compute_trends
 from Monitoring.sla import evaluate_sla
+from Monitoring.rolling import update_rolling_metrics
+class HealthRequest(AnalyzeRequest):
+    #Only score rows appended since the last incremental run of this file
+    incremental: bool = False
+
 @app.post("/analyze/health")
-def analyze_health(req: AnalyzeRequest):
+def analyze_health(req: HealthRequest):
     """
     Runs dataset health analysis:
     - Loads dataset
@@ -80,29 +111,59 @@ def analyze_health(req: AnalyzeRequest):
     - Classifies row usability
     - Computes overall dataset health
     - Persists results to a quality table
+    With incremental=True, only rows appended since the previous
+    incremental run are loaded and scored (see incremental_health.py).
     """
+    trace = Trace("health")
+
+    if req.incremental:
+        run = analyze_health_incremental(req.csv_path, trace)
+        health = run["summary"]
+        output_path = run["stored_at"]
+        preview = run["preview"]
+        metrics = {
+            "total_rows": run["total_rows"],
+            "usable_rows": run["counts"]["GOOD"],
+            "warning_rows": run["counts"]["WARNING"],
+            "bad_rows": run["counts"]["BAD"],
+            "average_score": run["average_score"],
+        }
+        analysis = {"mode": run["mode"], "new_rows": run["new_rows"]}
+    else:
+        with trace.stage("load") as span:
+            df = load_data(req.csv_path)
+            span.rows = len(df)
+
+        with trace.stage("scoring", rows=len(df)):
+            df = calculate_row_quality_scores(df)
+
+        with trace.stage("health", rows=len(df)):
+            health = classify_dataset_health(df)
+
+        with trace.stage("persistence", rows=len(df)):
+            output_path = persist_quality_results(df)
+
+        metrics = {
+            "total_rows": len(df),
+            "usable_rows": int((df["Row_Usability_Status"] == "GOOD").sum()),
+            "warning_rows": int((df["Row_Usability_Status"] == "WARNING").sum()),
+            "bad_rows": int((df["Row_Usability_Status"] == "BAD").sum()),
+            "average_score": round(df["Row_Quality_Score"].mean(), 2),
+        }
+        preview = df[
+            ["Employee_ID", "Row_Quality_Score", "Row_Usability_Status"]
+        ].head(10).to_dict(orient="records")
+        analysis = {"mode": "full", "new_rows": len(df)}
 
-    df = load_data(req.csv_path)
-
-    df = calculate_row_quality_scores(df)
-
-    health = classify_dataset_health(df)
-
-    output_path = persist_quality_results(df)
-
-    metrics = {
-        "total_rows": len(df),
-        "usable_rows": int((df["Row_Usability_Status"] == "GOOD").sum()),
-        "warning_rows": int((df["Row_Usability_Status"] == "WARNING").sum()),
-        "bad_rows": int((df["Row_Usability_Status"] == "BAD").sum()),
-        "average_score": round(df["Row_Quality_Score"].mean(), 2),
-    }
+    with trace.stage("history"):
+        # Persist run history
+        run_timestamp = log_run_metrics(metrics, source="health", dataset=req.csv_path)
 
-    # Persist run history
-    log_run_metrics(metrics)
+        # Compute trends across runs
+        trends = compute_trends(dataset=req.csv_path)
 
-    # Compute trends across runs
-    trends = compute_trends()
+        # Rolling aggregates and windowed SLA, updated with this run only
+        rolling = update_rolling_metrics(metrics, run_timestamp, dataset=req.csv_path)
 
     # Evaluate SLA
     sla = evaluate_sla(metrics)
@@ -110,18 +171,19 @@ def analyze_health(req: AnalyzeRequest):
     return {
         "tool": "health",
         "summary": health,
+        "analysis": analysis,
         "row_counts": {
-            "usable_rows": int((df["Row_Usability_Status"] == "GOOD").sum()),
-            "warning_rows": int((df["Row_Usability_Status"] == "WARNING").sum()),
-            "bad_rows": int((df["Row_Usability_Status"] == "BAD").sum()),
+            "usable_rows": metrics["usable_rows"],
+            "warning_rows": metrics["warning_rows"],
+            "bad_rows": metrics["bad_rows"],
             "metrics": metrics,
             "trends": trends,
+            "rolling": rolling,
             "sla": sla,
         },
         "stored_at": output_path,
-        "preview": df[
-            ["Employee_ID", "Row_Quality_Score", "Row_Usability_Status"]
-        ].head(10).to_dict(orient="records")
+        "preview": preview,
+        "timings": trace.finish()
     }
 
 from Monitoring.metrics import compute_resolution_engine
@@ -135,20 +197,33 @@ def monitor_dataset(req: AnalyzeRequest):
     Runs resolution + monitoring on a dataset
     """
 
+    trace = Trace("monitor")
+
     print("STEP 1: loading data")
-    df = load_data(req.csv_path)
+    with trace.stage("load") as span:
+        df = load_data(req.csv_path)
+        span.rows = len(df)
 
     print("STEP 2: scoring rows")
-    df = calculate_row_quality_scores(df)
+    with trace.stage("scoring", rows=len(df)):
+        df = calculate_row_quality_scores(df)
 
     print("STEP 3: resolving")
-    engine = ResolutionEngine(RESOLUTION_RULES)
-    cleaned_df, quarantined_df = engine.resolve(df)
+    with trace.stage("resolution", rows=len(df)):
+        engine = ResolutionEngine(RESOLUTION_RULES)
+        cleaned_df, quarantined_df = engine.resolve(df)
 
     print("STEP 4: computing metrics")
-    metrics = compute_resolution_engine(cleaned_df)
-    alerts = evaluate_alerts(metrics)
-    log_run_metrics(metrics)
+    with trace.stage("metrics", rows=len(cleaned_df)):
+        metrics = compute_resolution_engine(cleaned_df)
+        alerts = evaluate_alerts(metrics)
+
+    print("STEP 5: storing results")
+    with trace.stage("persistence", rows=len(cleaned_df) + len(quarantined_df)):
+        output_path = persist_resolution_results(cleaned_df, quarantined_df)
+
+    with trace.stage("history"):
+        log_run_metrics(metrics, source="resolution", dataset=req.csv_path)
 
     print("done")
     return {
@@ -156,49 +231,249 @@ def monitor_dataset(req: AnalyzeRequest):
         "metrics": metrics,
         "alerts": alerts,
         "cleaned_rows": len(cleaned_df),
-        "quarantined_rows": len(quarantined_df)
+        "quarantined_rows": len(quarantined_df),
+        "stored_at": output_path,
+        "timings": trace.finish()
     }
 
-import pandas as pd
-from Human_Review.review_queue import build_review_queue
-from Human_Review.review_decisions import apply_review_decision
-from Human_Review.review_models import ReviewDecision
-DATA_PATH = "outputs/quality_results.csv"
+from fastapi import HTTPException
+from Human_Review.review_queue import review_queue_page
+from Human_Review.review_decisions import record_review_decision, record_review_decisions
+from Human_Review.review_models import ClusterDecision, ReviewDecision, ReviewDecisionBatch, ReviewQueueRequest
+from Human_Review.review_triage import record_cluster_decision, review_clusters
+from Human_Review.review_store import ReviewError, REVIEW_PAGE_SIZE, review_store
 @app.post("/review/queue")
-def get_review_queue(req: AnalyzeRequest):
+def get_review_queue(req: ReviewQueueRequest):
     """
-    Returns all rows that need human review.
+    Returns one page of the rows that need human review,
+    lowest score (or confidence) first. Pass next_cursor back
+    as cursor to get the next page.
     """
-    df = pd.read_csv(DATA_PATH)
-    review_queue = build_review_queue(df)
-    return{
-        "count": len(review_queue),
-        "items": review_queue.to_dict(orient="records")
+    try:
+        return review_queue_page(
+            limit=req.limit,
+            cursor=req.cursor,
+            reason=req.reason,
+            sort=req.sort,
+            include_reviewed=req.include_reviewed,
+            signature=req.signature
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/review/queue")
+def get_review_queue_page(
+    limit: int = REVIEW_PAGE_SIZE,
+    cursor: str | None = None,
+    reason: str | None = None,
+    sort: str = "score",
+    include_reviewed: bool = False,
+    signature: str | None = None
+):
+    """
+    Same as POST /review/queue, with query parameters.
+    """
+    return get_review_queue(ReviewQueueRequest(
+        limit=limit, cursor=cursor, reason=reason, sort=sort,
+        include_reviewed=include_reviewed, signature=signature
+    ))
+
+@app.get("/review/reasons")
+def get_review_reasons(include_reviewed: bool = False):
+    """
+    Number of rows needing review per Resolution_Reason.
+    """
+    return {"reasons": review_store.queue_reasons(include_reviewed=include_reviewed)}
+
+@app.get("/review/clusters")
+def get_review_clusters(limit: int = REVIEW_PAGE_SIZE, sort: str = "size", include_reviewed: bool = False):
+    """
+    Rows awaiting review grouped by failure signature, with one
+    representative row and the size of each cluster.
+    List a cluster's rows with GET /review/queue?signature=...
+    """
+    try:
+        return review_clusters(limit=limit, sort=sort, include_reviewed=include_reviewed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/review/clusters/decision")
+def submit_cluster_decision(req: ClusterDecision):
+    """
+    Applies one decision to every row of a cluster.
+    """
+    try:
+        recorded = record_cluster_decision(
+            signature=req.signature,
+            decision=req.decision,
+            notes=req.review_notes,
+            reviewer=req.reviewer,
+            expected_size=req.expected_size
+        )
+    except ReviewError as e:
+        status = {"not_found": 404, "conflict": 409}.get(e.errors[0]["code"], 400)
+        raise HTTPException(status_code=status, detail=e.errors[0]["error"])
+
+    return {
+        "status": "success",
+        "signature": recorded["signature"],
+        "decision": recorded["decision"],
+        "resolution_action": recorded["resolution_action"],
+        "rows": recorded["rows"],
+        "employees": len(recorded["employee_ids"])
     }
 
 @app.post("/review/decision")
 def submit_review_decision(decision: ReviewDecision):
     """
     Receives a decision from a human reviewer.
+    Only that Employee_ID is updated in the review store.
     """
-    df = pd.read_csv(DATA_PATH)
-    df = apply_review_decision(
-        df,
-        employee_id=decision.employee_id,
-        decision=decision.decision,
-        notes=decision.reviewer_notes
-    )
-
-    df.to_csv(DATA_PATH, index=False)
+    try:
+        recorded = record_review_decision(
+            employee_id=decision.employee_id,
+            decision=decision.decision,
+            notes=decision.review_notes,
+            reviewer=decision.reviewer
+        )
+    except ReviewError as e:
+        status = 404 if e.errors[0]["code"] == "not_found" else 400
+        raise HTTPException(status_code=status, detail=e.errors[0]["error"])
 
     return {
         "status": "success",
-        "employee_id": decision.employee_id,
-        "decision": decision.decision
+        "employee_id": recorded["employee_id"],
+        "decision": recorded["decision"],
+        "resolution_action": recorded["resolution_action"]
     }
 
+@app.post("/review/decisions")
+def submit_review_decisions(batch: ReviewDecisionBatch):
+    """
+    Receives many decisions at once and applies them in one
+    transaction: if any is invalid, none is applied.
+    """
+    try:
+        recorded = record_review_decisions([item.model_dump() for item in batch.decisions])
+    except ReviewError as e:
+        raise HTTPException(status_code=400, detail={"message": str(e), "errors": e.errors})
+
+    return {
+        "status": "success",
+        "count": len(recorded),
+        "decisions": [
+            {key: item[key] for key in ("employee_id", "decision", "resolution_action", "rows")}
+            for item in recorded
+        ]
+    }
 
+from Audit.audit_index import query_audit_log, AUDIT_QUERY_LIMIT
+@app.get("/audit/events")
+def get_audit_events(
+    record_id: str | None = None,
+    action: str | None = None,
+    source: str | None = None,
+    severity: str | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    limit: int = AUDIT_QUERY_LIMIT,
+    newest_first: bool = False
+):
+    """
+    Searches the audit log (indexed; see Audit/audit_index.py).
+    """
+    return query_audit_log(
+        record_id=record_id,
+        action=action,
+        source=source,
+        severity=severity,
+        start=start,
+        end=end,
+        limit=limit,
+        newest_first=newest_first
+    )
 
+@app.get("/audit/records/{record_id}")
+def get_record_history(record_id: str, limit: int = AUDIT_QUERY_LIMIT):
+    """
+    Every audit event for one record (e.g. an Employee_ID), oldest first.
+    """
+    return query_audit_log(record_id=record_id, limit=limit)
+
+import asyncio
+import json
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from job_queue import JOB_KINDS, JOB_EVENT_SECONDS, TERMINAL_STATUSES
+class JobRequest(BaseModel):
+    kind: str
+    params: dict = {}
+
+@app.post("/jobs")
+def submit_job(req: JobRequest):
+    """
+    Queues a long-running analysis and returns its job id straight away.
+    e.g. {"kind": "full_analysis", "params": {"csv_path": "..."}}
+    """
+    if req.kind not in JOB_KINDS:
+        raise HTTPException(status_code=400, detail=f"Unknown job kind '{req.kind}'. Known: {sorted(JOB_KINDS)}")
+    job_id = job_queue.submit(req.kind, req.params)
+    return {
+        "job_id": job_id,
+        "status": "queued",
+        "job_url": f"/jobs/{job_id}",
+        "events_url": f"/jobs/{job_id}/events"
+    }
 
+@app.get("/jobs")
+def list_jobs(status: str | None = None, limit: int = 50):
+    """
+    Most recent jobs first (without their results).
+    """
+    return {"jobs": job_queue.list_jobs(status, limit)}
 
+@app.get("/jobs/{job_id}")
+def get_job(job_id: str):
+    """
+    Status, progress and (once finished) the result of a job.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
 
+@app.get("/jobs/{job_id}/events")
+async def stream_job_events(job_id: str):
+    """
+    Server-sent events: a "progress" event every time the job changes,
+    then a final "done" event once it has succeeded, failed or been
+    cancelled. Fetch GET /jobs/{job_id} for the result.
+    """
+    if await run_in_threadpool(job_queue.get, job_id, False) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        last = None
+        while True:
+            job = await run_in_threadpool(job_queue.get, job_id, False)
+            data = json.dumps(job)
+            finished = job["status"] in TERMINAL_STATUSES
+            if finished:
+                yield f"event: done\ndata: {data}\n\n"
+                return
+            if data != last:
+                yield f"event: progress\ndata: {data}\n\n"
+                last = data
+            await asyncio.sleep(JOB_EVENT_SECONDS)
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+@app.post("/jobs/{job_id}/cancel")
+def cancel_job(job_id: str):
+    """
+    Cancels a queued job, or asks a running one to stop.
+    """
+    status = job_queue.cancel(job_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {"job_id": job_id, "status": status}
@@ -0,0 +1,59 @@
+"""
+Uploads are saved under unique names, so two different files with the
+same name never overwrite each other or share a deduplicated copy.
+"""
+
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from Generic_Detection import generic_api
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(generic_api, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    app = FastAPI()
+    app.include_router(generic_api.router)
+    return TestClient(app)
+
+
+def upload(client, content):
+    response = client.post("/upload/analyze", files={"file": ("data.csv", content, "text/csv")})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_same_named_uploads_keep_their_own_content(client):
+    first = b"id,value\n1,10\n2,20\n3,30\n"
+    second = b"id,value\n1,99\n2,98\n"
+
+    a = upload(client, first)
+    b = upload(client, second)
+    assert a["file_info"]["saved_as"] != b["file_info"]["saved_as"]
+    with open(a["file_info"]["saved_path"], "rb") as f:
+        assert f.read() == first
+    with open(b["file_info"]["saved_path"], "rb") as f:
+        assert f.read() == second
+    assert a["report"]["dataset_info"] != b["report"]["dataset_info"]
+
+    # Re-uploading the first file reuses its own copy and report
+    again = upload(client, first)
+    assert again["file_info"]["deduplicated"]
+    assert again["file_info"]["saved_as"] == a["file_info"]["saved_as"]
+    assert again["cache"] == "hit"
+    assert again["report"]["dataset_info"] == a["report"]["dataset_info"]
+
+
+def test_modified_upload_is_not_reused(client):
+    content = b"id,value\n1,10\n2,20\n"
+    saved_path = upload(client, content)["file_info"]["saved_path"]
+    with open(saved_path, "wb") as f:
+        f.write(b"id,value\n1,11\n2,22\n")
+
+    again = upload(client, content)
+    assert not again["file_info"]["deduplicated"]
+    assert again["file_info"]["saved_path"] != saved_path
+    assert not [name for name in os.listdir(generic_api.UPLOAD_DIR) if name.endswith(".part")]
@@ -0,0 +1,142 @@
+"""
+Review decisions are tied to the failure signature of the rows they
+were made on, so a later analysis that finds a new problem puts the
+row back in the review queue.
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from Human_Review.review_store import REVIEW_NO_REASON, ReviewStore
+
+
+def write_results(path, rows):
+    """
+    Writes a results CSV with the columns /monitor/run stores, from
+    (Employee_ID, Resolution_Action, Row_Quality_Issues) tuples.
+    """
+    previous = os.stat(path).st_mtime_ns if os.path.exists(path) else 0
+    pd.DataFrame([
+        {
+            "Employee_ID": employee_id,
+            "Row_Quality_Score": 40,
+            "Row_Usability_Status": "BAD",
+            "Resolution_Action": action,
+            "Resolution_Reason": "test",
+            "Resolution_Confidence": 0.9,
+            "Analysis_Timestamp": "2026-01-01T00:00:00",
+            "Row_Quality_Issues": issues,
+        }
+        for employee_id, action, issues in rows
+    ]).to_csv(path, index=False)
+    # The store re-imports on a new size or mtime; same-size rewrites
+    # must not share an mtime on filesystems with coarse timestamps
+    mtime = max(os.stat(path).st_mtime_ns, previous + 1_000_000_000)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def queued_ids(store):
+    return [item["employee_id"] for item in store.queue_page(limit=100)["items"]]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ReviewStore(results_csv=tmp_path / "results.csv", db_path=tmp_path / "review.sqlite")
+
+
+def test_decision_is_dropped_when_a_new_problem_is_found(store):
+    write_results(store.results_csv, [("E1", "QUARANTINE", "MISSING_AGE"), ("E2", "QUARANTINE", "INVALID_SSN")])
+    store.record_decisions([{"employee_id": "E1", "decision": "APPROVE"}])
+    assert queued_ids(store) == ["E2"]
+
+    # A later feed quarantines E1 for something else
+    write_results(store.results_csv, [("E1", "QUARANTINE", "INVALID_SSN"), ("E2", "QUARANTINE", "INVALID_SSN")])
+    store.sync()
+
+    assert sorted(queued_ids(store)) == ["E1", "E2"]
+    results = store.results_frame().set_index("Employee_ID")
+    assert results.loc["E1", "Resolution_Action"] == "QUARANTINE"
+    assert not results.loc["E1", "Human_Reviewed"]
+
+
+def test_decision_survives_a_reanalysis_with_the_same_problems(store):
+    write_results(store.results_csv, [("E1", "QUARANTINE", "MISSING_AGE"), ("E2", "QUARANTINE", "INVALID_SSN")])
+    store.record_decisions([{"employee_id": "E1", "decision": "APPROVE"}])
+
+    write_results(store.results_csv, [("E2", "QUARANTINE", "INVALID_SSN"), ("E1", "QUARANTINE", "MISSING_AGE")])
+    store.sync()
+
+    assert queued_ids(store) == ["E2"]
+    results = store.results_frame().set_index("Employee_ID")
+    assert results.loc["E1", "Resolution_Action"] == "ACCEPT"
+    assert results.loc["E1", "Human_Reviewed"]
+
+
+def test_decisions_of_older_stores_are_kept(store):
+    write_results(store.results_csv, [("E1", "QUARANTINE", "MISSING_AGE"), ("E2", "QUARANTINE", "INVALID_SSN")])
+    store.sync()
+
+    # A store from before decisions had a signature
+    conn = sqlite3.connect(store.db_path)
+    with conn:
+        conn.execute("DROP TABLE decisions")
+        conn.execute(
+            "CREATE TABLE decisions (employee_id TEXT PRIMARY KEY, decision TEXT NOT NULL, "
+            "resolution_action TEXT NOT NULL, review_notes TEXT, reviewer TEXT, review_timestamp TEXT NOT NULL)"
+        )
+        conn.execute("INSERT INTO decisions VALUES ('E1', 'REJECT', 'REJECTED', NULL, NULL, '2026-01-01')")
+    conn.close()
+
+    assert queued_ids(store) == ["E2"]
+    assert [d["row_quality_issues"] for d in store.get_decisions("E1")] == ["MISSING_AGE"]
+
+
+def test_cluster_decision_leaves_other_clusters_alone(store):
+    # E1 is a duplicate ID with rows in both clusters
+    write_results(store.results_csv, [
+        ("E1", "QUARANTINE", "MISSING_AGE"),
+        ("E1", "QUARANTINE", "DUPLICATE_ID|INVALID_SSN"),
+        ("E2", "QUARANTINE", "MISSING_AGE"),
+        ("E3", "QUARANTINE", "DUPLICATE_ID|INVALID_SSN"),
+    ])
+
+    recorded = store.record_cluster_decision("MISSING_AGE", "APPROVE", expected_size=2)
+
+    assert recorded["rows"] == 2
+    clusters = {cluster["signature"]: cluster["size"] for cluster in store.clusters()["clusters"]}
+    assert clusters == {"DUPLICATE_ID|INVALID_SSN": 2}
+    assert sorted(queued_ids(store)) == ["E1", "E3"]
+
+
+def test_rows_without_a_reason_can_be_filtered(store):
+    write_results(store.results_csv, [("E1", "QUARANTINE", "MISSING_AGE"), ("E2", "QUARANTINE", "INVALID_SSN")])
+    df = pd.read_csv(store.results_csv)
+    df.loc[df["Employee_ID"] == "E1", "Resolution_Reason"] = None
+    df.to_csv(store.results_csv, index=False)
+
+    assert store.queue_reasons() == {REVIEW_NO_REASON: 1, "test": 1}
+    page = store.queue_page(reason=REVIEW_NO_REASON)
+    assert [item["employee_id"] for item in page["items"]] == ["E1"]
+    assert page["total"] == 1
+
+
+def test_resolution_results_fill_the_review_queue(store, monkeypatch):
+    from Quality_Detection import persistence
+    from Resolution_Strategy.resolution_engine import ResolutionEngine
+    from Resolution_Strategy.rules import RESOLUTION_RULES
+
+    monkeypatch.chdir(store.results_csv.parent)
+    monkeypatch.setattr(persistence, "OUTPUT_PATH", str(store.results_csv))
+    scored = pd.DataFrame({
+        "Employee_ID": ["E1", "E2", "E3"],
+        "Row_Quality_Score": [95, 40, 75],
+        "Row_Usability_Status": ["GOOD", "BAD", "WARNING"],
+        "Row_Quality_Issues": ["", "INVALID_SSN", "MISSING_AGE"],
+    })
+    persistence.persist_resolution_results(*ResolutionEngine(RESOLUTION_RULES).resolve(scored))
+
+    assert sorted(queued_ids(store)) == ["E2", "E3"]
+    assert {cluster["signature"] for cluster in store.clusters()["clusters"]} == {"INVALID_SSN", "MISSING_AGE"}
@@ -0,0 +1,245 @@
+"""
+Pipeline Stage Tracing
+=======================
+A small tracing layer that records, for every stage of a pipeline run:
+
+  wall_s       elapsed wall-clock time
+  cpu_s        CPU time of this process (all threads)
+  rows         rows processed, when the stage reports it
+  peak_rss_mb  highest resident memory of the process seen during
+               the stage (sampled every TRACE_SAMPLE_SECONDS)
+
+Usage:
+
+    trace = Trace("generic_pipeline")
+    with trace.stage("load") as span:
+        df = load_csv(path)
+        span.rows = len(df)
+    ...
+    report["timings"] = trace.finish()
+
+finish() returns the "timings" block attached to the report and adds
+the spans to a process-wide registry, which /metrics renders in the
+Prometheus text format (see render_prometheus()).
+
+Jobs (job_queue.py) run in their own processes: their timings are in
+their reports, but not in the server's /metrics.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+# =============================================================
+# CONFIGURATION
+# =============================================================
+
+# How often resident memory is sampled while a stage runs
+TRACE_SAMPLE_SECONDS = 0.02
+
+# Upper bounds (seconds) of the stage duration histogram buckets
+DURATION_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300)
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_bytes() -> int:
+    """
+    Resident memory of this process. Falls back to the peak so far
+    (getrusage) where /proc is not available.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        if resource is None:
+            return 0
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Kilobytes on Linux, bytes on macOS
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Span:
+    def __init__(self, name: str):
+        self.name = name
+        self.rows = None
+        self.wall_s = 0.0
+        self.cpu_s = 0.0
+        self.peak_rss = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "stage": self.name,
+            "wall_s": round(self.wall_s, 4),
+            "cpu_s": round(self.cpu_s, 4),
+            "rows": self.rows,
+            "peak_rss_mb": round(self.peak_rss / (1024 * 1024), 1),
+        }
+
+
+class _MemorySampler:
+    """
+    Background thread tracking the highest RSS seen between start()
+    and stop().
+    """
+
+    def __init__(self):
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self.peak = current_rss_bytes()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="trace-memory", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(TRACE_SAMPLE_SECONDS):
+            self.peak = max(self.peak, current_rss_bytes())
+
+    def stop(self) -> int:
+        """
+        Stops sampling and returns the peak.
+        """
+        self._stop.set()
+        self._thread.join()
+        return max(self.peak, current_rss_bytes())
+
+
+class Trace:
+    """
+    The stages of one pipeline run.
+    """
+
+    def __init__(self, pipeline: str):
+        self.pipeline = pipeline
+        self.spans: list[Span] = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str, rows: int | None = None):
+        span = Span(name)
+        span.rows = rows
+        sampler = _MemorySampler()
+        sampler.start()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield span
+        finally:
+            span.wall_s = time.perf_counter() - wall_start
+            span.cpu_s = time.process_time() - cpu_start
+            span.peak_rss = sampler.stop()
+            self.spans.append(span)
+
+    def finish(self) -> dict:
+        """
+        Records the run in the /metrics registry and returns the
+        report's "timings" block.
+        """
+        total = time.perf_counter() - self._start
+        registry.record(self.pipeline, self.spans, total)
+        return {
+            "pipeline": self.pipeline,
+            "total_wall_s": round(total, 4),
+            "peak_rss_mb": round(max((s.peak_rss for s in self.spans), default=0) / (1024 * 1024), 1),
+            "stages": [span.to_dict() for span in self.spans],
+        }
+
+
+# =============================================================
+# METRICS REGISTRY (Prometheus export)
+# =============================================================
+
+class MetricsRegistry:
+    """
+    Totals per (pipeline, stage) since the process started.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._runs = {}
+
+    def record(self, pipeline: str, spans: list[Span], total_s: float):
+        with self._lock:
+            run = self._runs.setdefault(pipeline, {"count": 0, "seconds": 0.0})
+            run["count"] += 1
+            run["seconds"] += total_s
+
+            for span in spans:
+                entry = self._stages.setdefault((pipeline, span.name), {
+                    "count": 0, "wall": 0.0, "cpu": 0.0, "rows": 0, "peak_rss": 0,
+                    "buckets": [0] * len(DURATION_BUCKETS),
+                })
+                entry["count"] += 1
+                entry["wall"] += span.wall_s
+                entry["cpu"] += span.cpu_s
+                entry["rows"] += span.rows or 0
+                entry["peak_rss"] = span.peak_rss
+                for i, bound in enumerate(DURATION_BUCKETS):
+                    if span.wall_s <= bound:
+                        entry["buckets"][i] += 1
+
+    def clear(self):
+        with self._lock:
+            self._stages.clear()
+            self._runs.clear()
+
+    def render_prometheus(self) -> str:
+        lines = []
+
+        def header(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            runs = sorted((key, dict(run)) for key, run in self._runs.items())
+            stages = sorted(
+                (key, {**entry, "buckets": list(entry["buckets"])})
+                for key, entry in self._stages.items()
+            )
+
+        header("dq_pipeline_runs_total", "counter", "Pipeline runs")
+        for pipeline, run in runs:
+            lines.append(f'dq_pipeline_runs_total{{pipeline="{pipeline}"}} {run["count"]}')
+        header("dq_pipeline_seconds_total", "counter", "Wall time spent in pipeline runs")
+        for pipeline, run in runs:
+            lines.append(f'dq_pipeline_seconds_total{{pipeline="{pipeline}"}} {run["seconds"]:.6f}')
+
+        simple = [
+            ("dq_stage_cpu_seconds_total", "counter", "CPU time spent in a stage", "cpu", ".6f"),
+            ("dq_stage_rows_total", "counter", "Rows processed by a stage", "rows", "d"),
+            ("dq_stage_peak_rss_bytes", "gauge", "Peak resident memory during the stage's last run", "peak_rss", "d"),
+        ]
+        for name, kind, help_text, key, fmt in simple:
+            header(name, kind, help_text)
+            for (pipeline, stage), entry in stages:
+                lines.append(f'{name}{{pipeline="{pipeline}",stage="{stage}"}} {entry[key]:{fmt}}')
+
+        header("dq_stage_duration_seconds", "histogram", "Wall time of a stage")
+        for (pipeline, stage), entry in stages:
+            labels = f'pipeline="{pipeline}",stage="{stage}"'
+            for bound, count in zip(DURATION_BUCKETS, entry["buckets"]):
+                lines.append(f'dq_stage_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f'dq_stage_duration_seconds_bucket{{{labels},le="+Inf"}} {entry["count"]}')
+            lines.append(f'dq_stage_duration_seconds_sum{{{labels}}} {entry["wall"]:.6f}')
+            lines.append(f'dq_stage_duration_seconds_count{{{labels}}} {entry["count"]}')
+
+        return "\n".join(lines) + "\n"
+
+
+# One registry for the whole process
+registry = MetricsRegistry()
+
+
+def render_prometheus() -> str:
+    return registry.render_prometheus()